@@ -1,4 +1,5 @@
-from typing import List
+import threading
+from typing import List, Optional
 
 from crewai import Agent, Crew, LLM, Process, Task
 from crewai.agents.agent_builder.base_agent import BaseAgent
@@ -12,6 +13,7 @@ from flow_researcher.tools import (
     GetLatest10qOr10kTool,
     GetCompanySubmissionsTool,
     GetLatestFilingTool,
+    get_shared_tool,
 )
 
 
@@ -30,11 +32,11 @@ class FinancialAnalystCrew:
         return Agent(
             config=self.agents_config["financial_analyst"],  # type: ignore[index]
             tools=[
-                TickerToCikTool(),
-                GetCompanyProfileTool(),
-                GetKeyFinancialSeriesTool(),
-                GetCompanyFactsTool(),
-                GetLatest10qOr10kTool(),
+                get_shared_tool(TickerToCikTool),
+                get_shared_tool(GetCompanyProfileTool),
+                get_shared_tool(GetKeyFinancialSeriesTool),
+                get_shared_tool(GetCompanyFactsTool),
+                get_shared_tool(GetLatest10qOr10kTool),
             ],
             llm=LLM(model="gemini/gemini-2.0-flash-exp"),
         )
@@ -44,9 +46,9 @@ class FinancialAnalystCrew:
         return Agent(
             config=self.agents_config["research_analyst"],  # type: ignore[index]
             tools=[
-                GetCompanyProfileTool(),
-                GetCompanySubmissionsTool(),
-                GetLatestFilingTool(),
+                get_shared_tool(GetCompanyProfileTool),
+                get_shared_tool(GetCompanySubmissionsTool),
+                get_shared_tool(GetLatestFilingTool),
             ],
             llm=LLM(model="gemini/gemini-2.0-flash-exp"),
         )
@@ -75,6 +77,30 @@ class FinancialAnalystCrew:
         return Crew(
             agents=self.agents,  # Automatically created by the @agent decorator
             tasks=self.tasks,  # Automatically created by the @task decorator
+            # The profile and metrics analyses are async tasks (see tasks.yaml), so
+            # both LLM calls run concurrently and the synthesis task awaits them
             process=Process.sequential,
             verbose=True,
         )
+
+
+# Crew built once per process from the YAML config (see get_financial_analyst_crew)
+_crew_template: Optional[Crew] = None
+_crew_lock = threading.Lock()
+
+
+def get_financial_analyst_crew() -> Crew:
+    """
+    Get a ready-to-run Financial Analyst Crew.
+    
+    The YAML config is read and the crew is assembled only once. Each call
+    returns a copy of that crew so that concurrent kickoffs do not share task
+    outputs or usage metrics: the copy has new Agent and Task objects and
+    shallow copies of the LLM configs, while the tool instances are shared.
+    """
+    global _crew_template
+    if _crew_template is None:
+        with _crew_lock:
+            if _crew_template is None:
+                _crew_template = FinancialAnalystCrew().crew()
+    return _crew_template.copy()
@@ -6,18 +6,43 @@ A simple flow that retrieves a company's financial overview including:
 - Key financial metrics (Revenues, Net Income, Assets)
 """
 
-import json
+import asyncio
 from pydantic import BaseModel, Field, model_validator
 from typing import Optional, Dict, Any
 
+from crewai import CrewOutput
 from crewai.flow import Flow, listen, router, start
 
+from flow_researcher.tools import fast_json as json
 from flow_researcher.tools import (
     TickerToCikTool,
     GetCompanyProfileTool,
     GetKeyFinancialSeriesTool,
+    get_shared_tool,
 )
-from flow_researcher.crews.financial_analyst_crew.financial_analyst_crew import FinancialAnalystCrew
+from flow_researcher.crews.financial_analyst_crew.financial_analyst_crew import get_financial_analyst_crew
+
+
+# XBRL tags fetched for the snapshot's key financial metrics
+KEY_FINANCIAL_TAGS = ["Revenues", "NetIncomeLoss", "Assets"]
+
+# Most recent facts per tag and unit passed to the crew
+MAX_FACTS_PER_UNIT = 12
+
+
+def _latest_metric_facts(metrics: Dict[str, Any]) -> Dict[str, Any]:
+    """Trim each metric series to its most recent facts before sending it to the LLM."""
+    series = {
+        tag: {
+            **tag_data,
+            "facts": {
+                unit: facts[-MAX_FACTS_PER_UNIT:]
+                for unit, facts in tag_data.get("facts", {}).items()
+            },
+        }
+        for tag, tag_data in metrics.get("series", {}).items()
+    }
+    return {**metrics, "series": series}
 
 
 class FinancialSnapshotState(BaseModel):
@@ -35,6 +60,7 @@ class FinancialSnapshotState(BaseModel):
     
     model_config = {
         "extra": "forbid",  # Don't allow extra fields
+        "validate_assignment": False,  # Flow steps write state directly; skip re-validation
     }
     
     @model_validator(mode="before")
@@ -48,9 +74,7 @@ class FinancialSnapshotState(BaseModel):
         if isinstance(data, dict):
             # Only allow ticker from external inputs
             # Ignore company_profile, financial_metrics, cik, etc. - they're internal
-            allowed_inputs = {"ticker"}
-            filtered = {k: v for k, v in data.items() if k in allowed_inputs}
-            return filtered
+            return {"ticker": data["ticker"]} if "ticker" in data else {}
         return data
 
 
@@ -66,15 +90,19 @@ class FinancialSnapshotFlow(Flow[FinancialSnapshotState]):
             ticker: Stock ticker symbol (e.g., "AAPL", "MSFT"). Defaults to "LAD".
             crewai_trigger_payload: Optional trigger payload (for backward compatibility).
         
-        Can receive ticker as a direct parameter or from trigger payload.
+        Can receive ticker as a direct parameter, from trigger payload or from
+        kickoff inputs (which CrewAI applies to the state before start).
         """
-        # Priority: direct parameter > trigger payload > default
+        # Priority: direct parameter > trigger payload > kickoff inputs > default
         if ticker and ticker != "LAD":  # Explicit ticker provided
             self.state.ticker = ticker.upper().strip()
             print(f"[FinancialSnapshotFlow]: Received ticker parameter: {self.state.ticker}")
         elif crewai_trigger_payload and crewai_trigger_payload.get("ticker"):
             self.state.ticker = crewai_trigger_payload.get("ticker", "").upper().strip()
             print(f"[FinancialSnapshotFlow]: Received ticker from trigger: {self.state.ticker}")
+        elif self.state.ticker:
+            self.state.ticker = self.state.ticker.upper().strip()
+            print(f"[FinancialSnapshotFlow]: Received ticker from inputs: {self.state.ticker}")
         else:
             # Default ticker
             self.state.ticker = "LAD"
@@ -87,20 +115,21 @@ class FinancialSnapshotFlow(Flow[FinancialSnapshotState]):
         return "ticker_initialized"
 
     @listen(initialize_ticker)
-    def get_company_info(self):
+    async def get_company_info(self):
         """
-        Convert ticker to CIK and get company profile.
+        Convert ticker to CIK, get company profile and fetch key financial metrics.
         
-        Uses TickerToCikTool and GetCompanyProfileTool.
+        Uses TickerToCikTool, GetCompanyProfileTool and GetKeyFinancialSeriesTool.
+        The CIK is resolved once and handed to the profile and metrics tools,
+        which then run concurrently in worker threads.
         """
         print(f"[FinancialSnapshotFlow]: Getting company information for {self.state.ticker}")
         
         try:
-            # Convert ticker to CIK
-            ticker_tool = TickerToCikTool()
-            cik_result = ticker_tool._run(self.state.ticker)
-            cik_data = json.loads(cik_result)
+            ticker = self.state.ticker
+            cik_result = await asyncio.to_thread(get_shared_tool(TickerToCikTool)._run, ticker)
             
+            cik_data = json.loads(cik_result)
             if not cik_data.get("data"):
                 self.state.error_message = cik_data.get("warnings", ["Ticker not found"])[0]
                 return "company_not_found"
@@ -108,18 +137,31 @@ class FinancialSnapshotFlow(Flow[FinancialSnapshotState]):
             self.state.cik = cik_data["data"]["cik"]
             print(f"[FinancialSnapshotFlow]: Found CIK: {self.state.cik}")
             
-            # Get company profile
-            profile_tool = GetCompanyProfileTool()
-            profile_result = profile_tool._run(self.state.ticker)
-            profile_data = json.loads(profile_result)
+            profile_result, metrics_result = await asyncio.gather(
+                asyncio.to_thread(get_shared_tool(GetCompanyProfileTool)._run, ticker, self.state.cik),
+                asyncio.to_thread(
+                    get_shared_tool(GetKeyFinancialSeriesTool)._run, ticker, KEY_FINANCIAL_TAGS, self.state.cik
+                ),
+            )
             
-            if profile_data.get("data"):
-                self.state.company_profile = profile_data["data"]
-                print(f"[FinancialSnapshotFlow]: Retrieved company profile")
-                return "company_found"
-            else:
+            profile_data = json.loads(profile_result)
+            if not profile_data.get("data"):
                 self.state.error_message = "Failed to retrieve company profile"
                 return "company_not_found"
+            
+            self.state.company_profile = profile_data["data"]
+            print(f"[FinancialSnapshotFlow]: Retrieved company profile")
+            
+            # Missing metrics are not fatal; the crew works with what is available
+            metrics_data = json.loads(metrics_result)
+            if metrics_data.get("data") and metrics_data["data"].get("series"):
+                self.state.financial_metrics = metrics_data["data"]
+                print(f"[FinancialSnapshotFlow]: Retrieved financial metrics")
+            else:
+                self.state.error_message = "No financial metrics available"
+                print(f"[FinancialSnapshotFlow]: Warning - No financial metrics available")
+            
+            return "company_found"
                 
         except Exception as e:
             self.state.error_message = f"Error getting company info: {str(e)}"
@@ -131,47 +173,17 @@ class FinancialSnapshotFlow(Flow[FinancialSnapshotState]):
         Route based on whether company was found.
         
         Returns 'fetch_metrics' if company found, 'handle_error' otherwise.
+        Metrics are already fetched alongside the company info at this point.
         """
         if status == "company_found":
-            print(f"[FinancialSnapshotFlow]: Company found, proceeding to fetch financial metrics")
+            print(f"[FinancialSnapshotFlow]: Company found, proceeding to summary")
             return "fetch_metrics"
         else:
             print(f"[FinancialSnapshotFlow]: Company not found or error occurred")
             return "handle_error"
 
     @listen("fetch_metrics")
-    def get_financial_metrics(self):
-        """
-        Get key financial metrics for the company.
-        
-        Retrieves Revenues, Net Income, and Assets using GetKeyFinancialSeriesTool.
-        """
-        print(f"[FinancialSnapshotFlow]: Fetching financial metrics for {self.state.ticker}")
-        
-        try:
-            metrics_tool = GetKeyFinancialSeriesTool()
-            result = metrics_tool._run(
-                self.state.ticker,
-                ["Revenues", "NetIncomeLoss", "Assets"]
-            )
-            
-            metrics_data = json.loads(result)
-            
-            if metrics_data.get("data") and metrics_data["data"].get("series"):
-                self.state.financial_metrics = metrics_data["data"]
-                print(f"[FinancialSnapshotFlow]: Retrieved financial metrics")
-            else:
-                self.state.error_message = "No financial metrics available"
-                print(f"[FinancialSnapshotFlow]: Warning - No financial metrics available")
-            
-            return "metrics_fetched"
-                
-        except Exception as e:
-            self.state.error_message = f"Error fetching metrics: {str(e)}"
-            return "metrics_fetched"  # Continue even if metrics fail
-
-    @listen("metrics_fetched")
-    def generate_snapshot_summary(self):
+    async def generate_snapshot_summary(self):
         """
         Generate a formatted summary of the financial snapshot.
         
@@ -181,8 +193,12 @@ class FinancialSnapshotFlow(Flow[FinancialSnapshotState]):
         
         try:
             # Prepare inputs for the crew
-            profile_info = json.dumps(self.state.company_profile, indent=2) if self.state.company_profile else "N/A"
-            metrics_info = json.dumps(self.state.financial_metrics, indent=2) if self.state.financial_metrics else "N/A"
+            # Compact JSON: the LLM does not need indentation, and it costs tokens
+            profile_info = json.dumps(self.state.company_profile) if self.state.company_profile else "N/A"
+            metrics_info = (
+                json.dumps(_latest_metric_facts(self.state.financial_metrics))
+                if self.state.financial_metrics else "N/A"
+            )
             
             crew_inputs = {
                 "ticker": self.state.ticker,
@@ -192,31 +208,26 @@ class FinancialSnapshotFlow(Flow[FinancialSnapshotState]):
             }
             
             # Run the financial analyst crew
-            result = (
-                FinancialAnalystCrew()
-                .crew()
-                .kickoff(inputs=crew_inputs)
-            )
+            # kickoff_async runs the crew in a worker thread, keeping the event loop free
+            result = await get_financial_analyst_crew().kickoff_async(inputs=crew_inputs)
             
             # Extract the summary from the crew result
-            # The final task (synthesize_financial_snapshot) should contain the summary
-            # CrewAI results typically have .raw for the raw output or we can access task outputs
-            if hasattr(result, 'raw') and result.raw:
-                self.state.snapshot_summary = str(result.raw)
-            elif hasattr(result, 'tasks_output') and result.tasks_output:
-                # Get output from the last task (synthesize_financial_snapshot)
-                if isinstance(result.tasks_output, list) and len(result.tasks_output) > 0:
-                    self.state.snapshot_summary = str(result.tasks_output[-1])
-                elif result.tasks_output:
-                    self.state.snapshot_summary = str(result.tasks_output)
-            else:
-                # Fallback: try to get any available output
+            # The final task (synthesize_financial_snapshot) holds the summary
+            if not isinstance(result, CrewOutput):
                 self.state.snapshot_summary = str(result) if result else "Analysis completed but no summary generated."
+            elif result.raw:
+                self.state.snapshot_summary = result.raw
+            elif result.tasks_output:
+                self.state.snapshot_summary = result.tasks_output[-1].raw
+            else:
+                self.state.snapshot_summary = "Analysis completed but no summary generated."
             
             print(f"[FinancialSnapshotFlow]: Summary generated by crew")
             return "summary_complete"
             
         except Exception as e:
+            # LLM provider errors have no common base class; cancellation and
+            # KeyboardInterrupt are BaseExceptions and still propagate
             self.state.error_message = f"Error generating summary: {str(e)}"
             self.state.snapshot_summary = f"Error: {self.state.error_message}"
             return "summary_complete"
@@ -231,7 +242,7 @@ class FinancialSnapshotFlow(Flow[FinancialSnapshotState]):
             self.state.snapshot_summary = f"Error: {self.state.error_message}"
         return "flow_complete"
 
-    @listen("summary_complete")
+    @listen(generate_snapshot_summary)
     def complete_flow(self):
         """
         Mark flow as complete.
@@ -1,7 +1,11 @@
 #!/usr/bin/env python
 """Main entry point for flow_researcher."""
 
+import asyncio
+from typing import Dict, List, Tuple
+
 from flow_researcher.flows.financial_snapshot_flow import FinancialSnapshotFlow, FinancialSnapshotState
+from flow_researcher.tools import get_default_client
 
 
 def kickoff():
@@ -42,6 +46,100 @@ def financial_snapshot(ticker: str = "LAD"):
     return result
 
 
+def kickoff_batch():
+    """Run the financial snapshot flow for every ticker in the TICKERS env var."""
+    import os
+    # Comma-separated list, e.g. TICKERS=AAPL,MSFT,LAD
+    tickers = [t for t in os.getenv("TICKERS", "LAD").split(",") if t.strip()]
+    states = financial_snapshot_batch(tickers)
+    
+    for ticker, state in states.items():
+        print("\n" + "="*60)
+        print(f"FINANCIAL SNAPSHOT SUMMARY: {ticker}")
+        print("="*60)
+        print(_summary_text(state))
+    print("="*60)
+
+
+def _summary_text(state: FinancialSnapshotState) -> str:
+    """Snapshot summary of a finished flow, or its error message."""
+    return state.snapshot_summary or f"Error: {state.error_message}"
+
+
+def financial_snapshot_batch(tickers: List[str], max_concurrency: int = 4) -> Dict[str, FinancialSnapshotState]:
+    """
+    Run the financial snapshot flow for many tickers concurrently.
+    
+    Each ticker gets its own flow instance (flow state is per run). Up to
+    max_concurrency flows are in flight at once; SEC requests from all of
+    them still go through the shared rate-limited HTTP client.
+    
+    Args:
+        tickers: Stock ticker symbols (e.g., ["AAPL", "MSFT"])
+        max_concurrency: Maximum number of flows running at the same time
+    
+    Returns:
+        Final flow state keyed by upper-cased ticker. A ticker whose flow
+        raised gets a state with that error_message instead of aborting the
+        others.
+    """
+    async def run_all():
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def run_one(ticker: str):
+            key = ticker.upper().strip()
+            async with semaphore:
+                try:
+                    return key, await financial_snapshot_async(ticker)
+                except Exception as e:
+                    state = FinancialSnapshotState(ticker=key)
+                    state.error_message = str(e)
+                    return key, state
+        
+        return await asyncio.gather(*(run_one(ticker) for ticker in tickers))
+    
+    get_default_client().warm_up()
+    return dict(asyncio.run(run_all()))
+
+
+def financial_snapshot_many(tickers: List[str], max_workers: int = 8) -> List[Tuple[str, str]]:
+    """
+    Run the financial snapshot flow for many tickers and return their summaries.
+    
+    Runs through financial_snapshot_batch, so both drivers share the same
+    concurrency limit, client warm-up and per-ticker error handling.
+    
+    Args:
+        tickers: Stock ticker symbols (e.g., ["AAPL", "MSFT"])
+        max_workers: Maximum number of flows running at the same time
+    
+    Returns:
+        (ticker, snapshot_summary) pairs in input order. A ticker whose flow
+        failed gets an "Error: ..." summary instead of aborting the others.
+    """
+    states = financial_snapshot_batch(tickers, max_concurrency=max_workers)
+    keys = [ticker.upper().strip() for ticker in tickers]
+    return [(key, _summary_text(states[key])) for key in keys]
+
+
+async def financial_snapshot_async(ticker: str = "LAD") -> FinancialSnapshotState:
+    """
+    Run the financial snapshot flow for a given ticker from async code.
+    
+    Unlike financial_snapshot, this does not block the calling event loop,
+    so many tickers can be in flight at once (e.g. from an async server).
+    
+    Args:
+        ticker: Stock ticker symbol (e.g., "AAPL", "MSFT")
+    
+    Returns:
+        The final flow state
+    """
+    flow = FinancialSnapshotFlow()
+    await flow.kickoff_async({"ticker": ticker})
+    return flow.state
+
+
 def plot():
     """Plot the financial snapshot flow."""
     flow = FinancialSnapshotFlow()
@@ -15,6 +15,8 @@ This package provides tools for accessing SEC data including:
 """
 
 from .sec_http_client import SECHttpClient, get_default_client, set_default_client
+from .tool_instances import get_shared_tool
+from .tool_result import ToolResult
 
 from .company_tools import (
     GetTickerCikMapTool,
@@ -26,6 +28,7 @@ from .company_tools import (
 from .filing_tools import (
     ListRecentFilingsTool,
     GetLatestFilingTool,
+    GetLatestFilingBatchTool,
     GetFilingsByDateRangeTool,
     GetFilingAcceptanceDatetimeTool,
 )
@@ -50,6 +53,7 @@ from .xbrl_tools import (
     ListTaxonomiesTool,
     ListConceptsTool,
     GetCompanyConceptTool,
+    GetCompanyConceptBatchTool,
     GetFramesTool,
     NormalizeFactsToTableTool,
     FactsFilterTool,
@@ -58,8 +62,11 @@ from .xbrl_tools import (
 from .edgar_index_tools import (
     ListDailyIndexPathsTool,
     DownloadDailyMasterIndexTool,
+    DownloadDailyMasterIndexBatchTool,
     ParseMasterIdxTool,
+    ParseMasterIdxUrlTool,
     FindFilingsInMasterIdxTool,
+    FindFilingsInMasterIdxByPathTool,
     EdgarPathToDocUrlTool,
 )
 
@@ -67,11 +74,14 @@ from .bulk_data_tools import (
     DownloadBulkSubmissionsZipTool,
     DownloadBulkCompanyfactsZipTool,
     ExtractBulkZipTool,
+    PackBulkZipToSqliteTool,
+    BulkSubmissionsLookupTool,
 )
 
 from .rss_tools import (
     GetCompanyEdgarRssFeedUrlTool,
     FetchRssTool,
+    FetchRssBatchTool,
     RssItemsToFilingsTool,
 )
 
@@ -87,6 +97,9 @@ __all__ = [
     "SECHttpClient",
     "get_default_client",
     "set_default_client",
+    # Shared tool instances
+    "get_shared_tool",
+    "ToolResult",
     # Company Tools
     "GetTickerCikMapTool",
     "TickerToCikTool",
@@ -95,6 +108,7 @@ __all__ = [
     # Filing Tools
     "ListRecentFilingsTool",
     "GetLatestFilingTool",
+    "GetLatestFilingBatchTool",
     "GetFilingsByDateRangeTool",
     "GetFilingAcceptanceDatetimeTool",
     # EDGAR URL Tools
@@ -113,22 +127,29 @@ __all__ = [
     "ListTaxonomiesTool",
     "ListConceptsTool",
     "GetCompanyConceptTool",
+    "GetCompanyConceptBatchTool",
     "GetFramesTool",
     "NormalizeFactsToTableTool",
     "FactsFilterTool",
     # EDGAR Index Tools
     "ListDailyIndexPathsTool",
     "DownloadDailyMasterIndexTool",
+    "DownloadDailyMasterIndexBatchTool",
     "ParseMasterIdxTool",
+    "ParseMasterIdxUrlTool",
     "FindFilingsInMasterIdxTool",
+    "FindFilingsInMasterIdxByPathTool",
     "EdgarPathToDocUrlTool",
     # Bulk Data Tools
     "DownloadBulkSubmissionsZipTool",
     "DownloadBulkCompanyfactsZipTool",
     "ExtractBulkZipTool",
+    "PackBulkZipToSqliteTool",
+    "BulkSubmissionsLookupTool",
     # RSS Tools
     "GetCompanyEdgarRssFeedUrlTool",
     "FetchRssTool",
+    "FetchRssBatchTool",
     "RssItemsToFilingsTool",
     # Convenience Tools
     "GetLatest10qOr10kTool",
@@ -5,16 +5,22 @@ These tools download and extract SEC bulk data ZIP files for offline
 or fast lookup of submissions and XBRL facts.
 """
 
-import json
+import os
+import sqlite3
 import zipfile
-from typing import Type
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Type, List
 from pathlib import Path
 
 from pydantic import BaseModel, Field
 
 from crewai.tools import BaseTool
 
-from .sec_http_client import get_default_client
+from . import fast_json as json
+from .company_tools import _normalize_cik
+from .sec_http_client import file_size, get_default_client
 
 
 class DownloadBulkSubmissionsZipInput(BaseModel):
@@ -42,13 +48,13 @@ class DownloadBulkSubmissionsZipTool(BaseTool):
         url = "https://www.sec.gov/Archives/edgar/daily-index/bulkdata/submissions.zip"
         
         try:
-            downloaded_path = client.download(url, dest_path)
+            downloaded_path = client.download_ranged(url, dest_path)
             
             result = {
                 "data": {
                     "downloaded_path": downloaded_path,
                     "url": url,
-                    "file_size": Path(downloaded_path).stat().st_size if Path(downloaded_path).exists() else None
+                    "file_size": file_size(downloaded_path)
                 },
                 "source_urls": [url],
                 "warnings": []
@@ -88,13 +94,13 @@ class DownloadBulkCompanyfactsZipTool(BaseTool):
         url = "https://www.sec.gov/Archives/edgar/daily-index/xbrl/companyfacts.zip"
         
         try:
-            downloaded_path = client.download(url, dest_path)
+            downloaded_path = client.download_ranged(url, dest_path)
             
             result = {
                 "data": {
                     "downloaded_path": downloaded_path,
                     "url": url,
-                    "file_size": Path(downloaded_path).stat().st_size if Path(downloaded_path).exists() else None
+                    "file_size": file_size(downloaded_path)
                 },
                 "source_urls": [url],
                 "warnings": []
@@ -109,10 +115,36 @@ class DownloadBulkCompanyfactsZipTool(BaseTool):
             })
 
 
+# Number of extracted file names returned when the full list is not requested
+EXTRACTED_NAMES_PREVIEW = 20
+
+# Archives with fewer members than this are extracted in-process
+PARALLEL_EXTRACT_MIN_FILES = 1000
+
+# zlib level for packed bulk documents: fast to write, still ~10x smaller than raw JSON
+PACKED_PAYLOAD_COMPRESSION_LEVEL = 3
+
+
+def _extract_members(zip_path: str, names: List[str], dest_dir: str) -> int:
+    """Extract the named members of a ZIP file (runs in a worker process)."""
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        for name in names:
+            try:
+                zip_ref.extract(name, dest_dir)
+            except FileExistsError:
+                # Another worker created the same parent directory first
+                zip_ref.extract(name, dest_dir)
+    return len(names)
+
+
 class ExtractBulkZipInput(BaseModel):
     """Input schema for extract_bulk_zip tool."""
     zip_path: str = Field(..., description="Path to the ZIP file to extract")
     dest_dir: str = Field(..., description="Directory where to extract files")
+    return_names: bool = Field(
+        default=False,
+        description="Return every extracted file name instead of only the first few"
+    )
 
 
 class ExtractBulkZipTool(BaseTool):
@@ -126,11 +158,12 @@ class ExtractBulkZipTool(BaseTool):
     description: str = """
     Extracts a bulk ZIP file (submissions or company facts) into individual
     JSON files in the specified directory. Each company's data is typically
-    in a separate JSON file.
+    in a separate JSON file. Returns the file count and the first few file
+    names; set return_names to get every extracted file name.
     """
     args_schema: Type[BaseModel] = ExtractBulkZipInput
 
-    def _run(self, zip_path: str, dest_dir: str) -> str:
+    def _run(self, zip_path: str, dest_dir: str, return_names: bool = False) -> str:
         try:
             zip_path_obj = Path(zip_path)
             dest_dir_obj = Path(dest_dir)
@@ -145,16 +178,31 @@ class ExtractBulkZipTool(BaseTool):
             # Create destination directory
             dest_dir_obj.mkdir(parents=True, exist_ok=True)
             
-            extracted_files = []
             with zipfile.ZipFile(zip_path_obj, 'r') as zip_ref:
-                zip_ref.extractall(dest_dir_obj)
-                extracted_files = zip_ref.namelist()
+                names = zip_ref.namelist()
+            file_count = len(names)
+            
+            # Inflating is CPU-bound, so large archives are split into
+            # contiguous chunks extracted by one process per core
+            workers = min(os.cpu_count() or 1, file_count // PARALLEL_EXTRACT_MIN_FILES)
+            if workers > 1:
+                chunk_size = -(-file_count // workers)
+                chunks = [names[i:i + chunk_size] for i in range(0, file_count, chunk_size)]
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    list(executor.map(_extract_members, repeat(str(zip_path_obj)), chunks, repeat(str(dest_dir_obj))))
+            else:
+                _extract_members(str(zip_path_obj), names, str(dest_dir_obj))
+            
+            # Bulk archives hold ~1M entries, so only return a preview of the
+            # names unless the caller asks for all of them
+            extracted_files = names if return_names else names[:EXTRACTED_NAMES_PREVIEW]
             
             result = {
                 "data": {
                     "dest_dir": str(dest_dir_obj.absolute()),
                     "extracted_files": extracted_files,
-                    "file_count": len(extracted_files)
+                    "file_count": file_count,
+                    "files_truncated": len(extracted_files) < file_count
                 },
                 "source_urls": [],
                 "warnings": []
@@ -173,3 +221,150 @@ class ExtractBulkZipTool(BaseTool):
                 "source_urls": [],
                 "warnings": [f"Failed to extract ZIP file: {str(e)}"]
             })
+
+
+class PackBulkZipToSqliteInput(BaseModel):
+    """Input schema for pack_bulk_zip_to_sqlite tool."""
+    zip_path: str = Field(..., description="Path to the bulk ZIP file to pack")
+    db_path: str = Field(..., description="Path of the SQLite database to write")
+
+
+class PackBulkZipToSqliteTool(BaseTool):
+    """
+    Pack bulk ZIP file into a SQLite database.
+    
+    Streams every JSON document of a bulk ZIP file (submissions or company
+    facts) into a single SQLite table keyed by document name (e.g.
+    'CIK0000320193'), storing each payload zlib-compressed. Looking up one
+    company is then a primary-key read instead of opening one of ~1M files.
+    """
+    name: str = "pack_bulk_zip_to_sqlite"
+    description: str = """
+    Packs a bulk ZIP file (submissions or company facts) into a single
+    SQLite database keyed by CIK, without extracting it to disk first.
+    Use bulk_submissions_lookup on the result for fast per-company lookups.
+    """
+    args_schema: Type[BaseModel] = PackBulkZipToSqliteInput
+
+    def _run(self, zip_path: str, db_path: str) -> str:
+        try:
+            zip_path_obj = Path(zip_path)
+            db_path_obj = Path(db_path)
+            
+            if not zip_path_obj.exists():
+                return json.dumps({
+                    "data": None,
+                    "source_urls": [],
+                    "warnings": [f"ZIP file not found: {zip_path}"]
+                })
+            
+            db_path_obj.parent.mkdir(parents=True, exist_ok=True)
+            
+            with zipfile.ZipFile(zip_path_obj, 'r') as zip_ref:
+                members = [
+                    info for info in zip_ref.infolist()
+                    if not info.is_dir() and info.filename.endswith(".json")
+                ]
+                # Generator keeps only one decompressed document in memory at a time
+                rows = (
+                    (
+                        Path(info.filename).stem,
+                        zlib.compress(zip_ref.read(info), PACKED_PAYLOAD_COMPRESSION_LEVEL)
+                    )
+                    for info in members
+                )
+                
+                conn = sqlite3.connect(db_path_obj)
+                try:
+                    with conn:
+                        conn.execute(
+                            "CREATE TABLE IF NOT EXISTS documents (name TEXT PRIMARY KEY, payload BLOB NOT NULL)"
+                        )
+                        conn.executemany("INSERT OR REPLACE INTO documents VALUES (?, ?)", rows)
+                finally:
+                    conn.close()
+            
+            result = {
+                "data": {
+                    "db_path": str(db_path_obj.absolute()),
+                    "document_count": len(members)
+                },
+                "source_urls": [],
+                "warnings": []
+            }
+            
+            return json.dumps(result)
+        except zipfile.BadZipFile:
+            return json.dumps({
+                "data": None,
+                "source_urls": [],
+                "warnings": [f"Invalid ZIP file: {zip_path}"]
+            })
+        except Exception as e:
+            return json.dumps({
+                "data": None,
+                "source_urls": [],
+                "warnings": [f"Failed to pack ZIP file: {str(e)}"]
+            })
+
+
+class BulkSubmissionsLookupInput(BaseModel):
+    """Input schema for bulk_submissions_lookup tool."""
+    db_path: str = Field(..., description="Path to a database from pack_bulk_zip_to_sqlite")
+    cik: str = Field(..., description="10-digit zero-padded CIK number")
+
+
+class BulkSubmissionsLookupTool(BaseTool):
+    """
+    Look up a company in a packed bulk database.
+    
+    Reads one company's submissions (or company facts) JSON from a database
+    built by PackBulkZipToSqliteTool, without any network request.
+    """
+    name: str = "bulk_submissions_lookup"
+    description: str = """
+    Looks up a company's submissions or company facts JSON by CIK in a local
+    database built by pack_bulk_zip_to_sqlite. Returns the same data as the
+    SEC API but without a network request.
+    """
+    args_schema: Type[BaseModel] = BulkSubmissionsLookupInput
+
+    def _run(self, db_path: str, cik: str) -> str:
+        cik_padded = _normalize_cik(cik)
+        
+        try:
+            if not Path(db_path).exists():
+                return json.dumps({
+                    "data": None,
+                    "source_urls": [],
+                    "warnings": [f"Database not found: {db_path}"]
+                })
+            
+            conn = sqlite3.connect(db_path)
+            try:
+                row = conn.execute(
+                    "SELECT payload FROM documents WHERE name = ?", (f"CIK{cik_padded}",)
+                ).fetchone()
+            finally:
+                conn.close()
+            
+            if row is None:
+                return json.dumps({
+                    "data": None,
+                    "source_urls": [],
+                    "warnings": [f"CIK '{cik_padded}' not found in bulk database"]
+                })
+            
+            result = {
+                "data": json.loads(zlib.decompress(row[0])),
+                "source_urls": [],
+                "warnings": []
+            }
+            
+            return json.dumps(result)
+        except Exception as e:
+            return json.dumps({
+                "data": None,
+                "source_urls": [],
+                "warnings": [f"Failed to look up bulk database: {str(e)}"]
+            })
@@ -5,14 +5,164 @@ These tools help identify companies by ticker, convert to CIK,
 and retrieve company submissions and profiles.
 """
 
-import json
-from typing import Type, Optional, List, Dict, Any
+import re
+import threading
+from typing import Type, Optional, List, Dict, Any, Tuple
 
 from pydantic import BaseModel, Field
 
 from crewai.tools import BaseTool
 
-from .sec_http_client import get_default_client
+from . import fast_json as json
+from .sec_http_client import MemoryCache, get_default_client
+from .tool_result import ToolResult
+
+
+# Ticker-to-CIK mappings and profiles change at most daily, so successful
+# lookups are reused across tool calls for a day
+LOOKUP_CACHE_MAXSIZE = 50_000
+LOOKUP_CACHE_TTL_SECONDS = 86_400
+
+_ticker_to_cik_cache = MemoryCache(LOOKUP_CACHE_MAXSIZE, LOOKUP_CACHE_TTL_SECONDS)
+_company_profile_cache = MemoryCache(LOOKUP_CACHE_MAXSIZE, LOOKUP_CACHE_TTL_SECONDS)
+
+# Deletes every ASCII character except 0-9 (e.g. the "CIK" prefix and whitespace)
+_DIGITS_ONLY = str.maketrans('', '', ''.join(chr(c) for c in range(128) if not chr(c).isdigit()))
+
+
+def _normalize_cik(cik: str) -> str:
+    """Normalize a CIK such as ' 320193' or 'CIK0000320193' to 10 zero-padded digits."""
+    return cik.translate(_DIGITS_ONLY).zfill(10)
+
+
+# Cheap shape check so obviously bad input (empty, whitespace, digits-only)
+# is rejected before the ticker map is fetched. Class-share suffixes such as
+# BRK.B / BRK-B are valid.
+_VALID_TICKER = re.compile(r"[A-Z][A-Z0-9.\-]{0,9}").fullmatch
+
+
+def _invalid_ticker_warning(ticker: str) -> str:
+    return f"Ticker '{ticker}' not found in SEC database (not a valid ticker symbol)"
+
+
+TICKER_MAP_URL = "https://www.sec.gov/files/company_tickers_exchange.json"
+_SUBMISSIONS_URL = "https://data.sec.gov/submissions/CIK{}.json".format
+TICKER_MAP_TTL_SECONDS = 3600
+
+_ticker_map_cache = MemoryCache(maxsize=1, ttl_seconds=TICKER_MAP_TTL_SECONDS)
+_ticker_map_lock = threading.Lock()
+
+
+# Ticker index entry: (cik, company_name, exchange)
+TickerEntry = Tuple[str, Optional[str], Optional[str]]
+
+
+def _ticker_field_indices(fields: List[str]) -> Tuple[int, int, int, int]:
+    """Resolve (cik_idx, name_idx, ticker_idx, exchange_idx) from the ticker map's "fields" header."""
+    try:
+        cik_idx, name_idx, ticker_idx = fields.index("cik"), fields.index("name"), fields.index("ticker")
+    except ValueError:
+        # Fallback if field names don't match expected
+        cik_idx, name_idx, ticker_idx = 0, 1, 2
+    # Resolved on its own: a map without exchanges still has valid lookup columns
+    exchange_idx = fields.index("exchange") if "exchange" in fields else 3
+    return cik_idx, name_idx, ticker_idx, exchange_idx
+
+
+def _build_ticker_index(
+    ticker_map: Any,
+    field_indices: Optional[Tuple[int, int, int, int]] = None
+) -> Dict[str, TickerEntry]:
+    """Index a parsed ticker map as {TICKER: (cik, company_name, exchange)}."""
+    index: Dict[str, TickerEntry] = {}
+    
+    # SEC API returns: {"fields": ["cik", "name", "ticker", "exchange"], "data": [[cik, name, ticker, exchange], ...]}
+    if field_indices is not None:
+        cik_idx, name_idx, ticker_idx, exchange_idx = field_indices
+        rows = [row for row in ticker_map["data"] if len(row) > ticker_idx]
+        # Upper-case each ticker once per map refresh, in a single comprehension
+        upper_tickers = [str(row[ticker_idx]).upper() for row in rows]
+        entries = [
+            (
+                str(row[cik_idx]),
+                row[name_idx] if len(row) > name_idx else None,
+                row[exchange_idx] if len(row) > exchange_idx else None
+            )
+            for row in rows
+        ]
+        # Building from the end keeps the first row for a duplicate ticker, like the old linear scan
+        return dict(zip(reversed(upper_tickers), reversed(entries)))
+    
+    # Legacy format handling (if API changes back)
+    if isinstance(ticker_map, dict):
+        entries = ticker_map.values()
+    elif isinstance(ticker_map, list):
+        entries = ticker_map
+    else:
+        entries = []
+    for entry in entries:
+        if isinstance(entry, dict) and entry.get('ticker'):
+            index.setdefault(
+                entry['ticker'].upper(),
+                (
+                    str(entry.get('cik_str', entry.get('cik', ''))),
+                    entry.get('title', entry.get('name', '')),
+                    entry.get('exchange')
+                )
+            )
+    return index
+
+
+def _load_ticker_map() -> Dict[str, Any]:
+    """
+    Get the cached SEC ticker map entry, downloading at most once per TTL.
+    
+    The entry holds the response body ("raw"), passed through by
+    GetTickerCikMapTool, and the ticker index ("index") used for lookups; the
+    field indices are resolved once while the index is built. The map is about
+    1 MB and changes at most daily, so every ticker lookup in the process
+    shares one copy. Callers must not mutate it.
+    """
+    cached = _ticker_map_cache.get(TICKER_MAP_URL)
+    if cached is None:
+        # Concurrent flows would otherwise all download the map at once
+        with _ticker_map_lock:
+            cached = _ticker_map_cache.get(TICKER_MAP_URL)
+            if cached is None:
+                response = get_default_client().get(TICKER_MAP_URL)
+                ticker_map = json.loads(response.content)
+                field_indices = None
+                if isinstance(ticker_map, dict) and "fields" in ticker_map and "data" in ticker_map:
+                    field_indices = _ticker_field_indices(ticker_map["fields"])
+                cached = {
+                    "raw": response.content,
+                    "index": _build_ticker_index(ticker_map, field_indices)
+                }
+                _ticker_map_cache.set(TICKER_MAP_URL, cached)
+    return cached
+
+
+def _get_ticker_index() -> Dict[str, TickerEntry]:
+    """Get the {TICKER: (cik, company_name, exchange)} index of the SEC ticker map."""
+    return _load_ticker_map()["index"]
+
+
+def _resolve_ticker(ticker: str) -> Tuple[Optional[str], Optional[str], List[str], List[str]]:
+    """
+    Resolve a ticker against the cached SEC ticker map.
+    
+    Returns:
+        (cik_padded, company_name, source_urls, warnings); cik_padded is None
+        if the ticker is unknown or malformed. Errors fetching the map are raised.
+    """
+    ticker_upper = ticker.upper().strip()
+    if not _VALID_TICKER(ticker_upper):
+        return None, None, [], [_invalid_ticker_warning(ticker)]
+    
+    cik, company_name, _ = _get_ticker_index().get(ticker_upper, (None, None, None))
+    if not cik:
+        return None, None, [TICKER_MAP_URL], [f"Ticker '{ticker}' not found in SEC database"]
+    return cik.zfill(10), company_name, [TICKER_MAP_URL], []
 
 
 class GetTickerCikMapInput(BaseModel):
@@ -37,27 +187,21 @@ class GetTickerCikMapTool(BaseTool):
     args_schema: Type[BaseModel] = GetTickerCikMapInput
 
     def _run(self) -> str:
-        client = get_default_client()
-        url = "https://www.sec.gov/files/company_tickers_exchange.json"
+        url = TICKER_MAP_URL
         
         try:
-            response = client.get(url)
-            data = response.json()
-            
-            # Normalize the response format
-            result = {
-                "data": data,
-                "source_urls": [url],
-                "warnings": []
-            }
+            # The map is passed through unchanged, so splice the (already validated)
+            # response body into the envelope instead of re-serializing ~1 MB of JSON
+            raw = _load_ticker_map()["raw"]
+            payload = b'{"data":' + raw + b',"source_urls":' + json.dumps([url]).encode() + b',"warnings":[]}'
             
-            return json.dumps(result)
+            return payload.decode()
         except Exception as e:
-            return json.dumps({
-                "data": None,
-                "source_urls": [url],
-                "warnings": [f"Failed to fetch ticker map: {str(e)}"]
-            })
+            return ToolResult(
+                data=None,
+                source_urls=[url],
+                warnings=[f"Failed to fetch ticker map: {str(e)}"]
+            ).to_json()
 
 
 class TickerToCikInput(BaseModel):
@@ -82,77 +226,42 @@ class TickerToCikTool(BaseTool):
 
     def _run(self, ticker: str) -> str:
         ticker_upper = ticker.upper().strip()
-        client = get_default_client()
-        url = "https://www.sec.gov/files/company_tickers_exchange.json"
+        cached = _ticker_to_cik_cache.get(ticker_upper)
+        if cached is not None:
+            return cached
+        
+        url = TICKER_MAP_URL
         
         try:
-            response = client.get(url)
-            ticker_map = response.json()
+            cik_padded, company_name, source_urls, warnings = _resolve_ticker(ticker)
             
-            # Find matching ticker
-            cik = None
-            company_name = None
-            
-            # SEC API returns: {"fields": ["cik", "name", "ticker", "exchange"], "data": [[cik, name, ticker, exchange], ...]}
-            if isinstance(ticker_map, dict) and "fields" in ticker_map and "data" in ticker_map:
-                fields = ticker_map["fields"]
-                data_rows = ticker_map["data"]
-                
-                # Find indices for fields
-                try:
-                    cik_idx = fields.index("cik")
-                    name_idx = fields.index("name")
-                    ticker_idx = fields.index("ticker")
-                except ValueError:
-                    # Fallback if field names don't match expected
-                    cik_idx, name_idx, ticker_idx = 0, 1, 2
-                
-                # Search through data rows
-                for row in data_rows:
-                    if len(row) > ticker_idx and str(row[ticker_idx]).upper() == ticker_upper:
-                        cik = str(row[cik_idx])
-                        company_name = row[name_idx] if len(row) > name_idx else None
-                        break
-            # Legacy format handling (if API changes back)
-            elif isinstance(ticker_map, dict):
-                for entry in ticker_map.values():
-                    if isinstance(entry, dict) and entry.get('ticker', '').upper() == ticker_upper:
-                        cik = str(entry.get('cik_str', entry.get('cik', '')))
-                        company_name = entry.get('title', entry.get('name', ''))
-                        break
-            elif isinstance(ticker_map, list):
-                for entry in ticker_map:
-                    if isinstance(entry, dict) and entry.get('ticker', '').upper() == ticker_upper:
-                        cik = str(entry.get('cik_str', entry.get('cik', '')))
-                        company_name = entry.get('title', entry.get('name', ''))
-                        break
-            
-            if cik:
-                # Pad CIK to 10 digits
-                cik_padded = cik.zfill(10)
-                result = {
-                    "data": {
+            if cik_padded:
+                result = ToolResult(
+                    data={
                         "ticker": ticker_upper,
                         "cik": cik_padded,
                         "company_name": company_name
                     },
-                    "source_urls": [url],
-                    "warnings": []
-                }
+                    source_urls=source_urls,
+                    warnings=warnings
+                )
+                output = result.to_json()
+                _ticker_to_cik_cache.set(ticker_upper, output)
+                return output
             else:
-                result = {
-                    "data": None,
-                    "source_urls": [url],
-                    "warnings": [f"Ticker '{ticker}' not found in SEC database"]
-                }
+                result = ToolResult(
+                    data=None,
+                    source_urls=source_urls,
+                    warnings=warnings
+                )
             
-            return json.dumps(result)
+            return result.to_json()
         except Exception as e:
-            return json.dumps({
-                "data": None,
-                "source_urls": [url],
-                "warnings": [f"Failed to convert ticker to CIK: {str(e)}"]
-            })
+            return ToolResult(
+                data=None,
+                source_urls=[url],
+                warnings=[f"Failed to convert ticker to CIK: {str(e)}"]
+            ).to_json()
 
 
 class GetCompanySubmissionsInput(BaseModel):
@@ -182,32 +291,52 @@ class GetCompanySubmissionsTool(BaseTool):
 
     def _run(self, cik: str) -> str:
         # Ensure CIK is 10 digits, zero-padded
-        cik_padded = cik.strip().zfill(10)
+        cik_padded = _normalize_cik(cik)
         client = get_default_client()
-        url = f"https://data.sec.gov/submissions/CIK{cik_padded}.json"
+        url = _SUBMISSIONS_URL(cik_padded)
         
         try:
-            response = client.get(url)
-            data = response.json()
+            data = client.get_json(url)
             
-            result = {
-                "data": data,
-                "source_urls": [url],
-                "warnings": []
-            }
+            result = ToolResult(
+                data=data,
+                source_urls=[url],
+                warnings=[]
+            )
             
-            return json.dumps(result)
+            return result.to_json()
         except Exception as e:
-            return json.dumps({
-                "data": None,
-                "source_urls": [url],
-                "warnings": [f"Failed to fetch company submissions: {str(e)}"]
-            })
+            return ToolResult(
+                data=None,
+                source_urls=[url],
+                warnings=[f"Failed to fetch company submissions: {str(e)}"]
+            ).to_json()
+
+
+# Profile fields that the ticker map alone can answer
+TICKER_MAP_PROFILE_FIELDS = {'ticker', 'cik', 'entity_name', 'exchanges'}
+
+# Top-level submissions fields read by GetCompanyProfileTool
+SUBMISSIONS_PROFILE_FIELDS = (
+    'name', 'formerNames', 'tickers', 'exchanges', 'sic', 'sicDescription',
+    'addresses', 'wksi', 'formerConformedName', 'category', 'filerType'
+)
 
 
 class GetCompanyProfileInput(BaseModel):
     """Input schema for get_company_profile tool."""
     ticker: str = Field(..., description="Stock ticker symbol (e.g., 'AAPL', 'MSFT')")
+    cik: Optional[str] = Field(
+        None,
+        description="CIK of the company if already known; skips the ticker-to-CIK lookup"
+    )
+    fields: Optional[List[str]] = Field(
+        None,
+        description=(
+            "Optional subset of profile fields needed. If all of them are among "
+            "'ticker', 'cik', 'entity_name' and 'exchanges', the submissions download is skipped"
+        )
+    )
 
 
 class GetCompanyProfileTool(BaseTool):
@@ -229,74 +358,49 @@ class GetCompanyProfileTool(BaseTool):
     Returns company name, former names, tickers, exchanges, SIC codes,
     addresses, and filer status. This combines ticker-to-CIK conversion
     with company submissions data to provide a complete company profile.
+    Pass fields=['ticker', 'cik', 'entity_name', 'exchanges'] when only
+    those are needed for a much cheaper lookup.
     """
     args_schema: Type[BaseModel] = GetCompanyProfileInput
 
-    def _run(self, ticker: str) -> str:
+    def _run(self, ticker: str, cik: Optional[str] = None, fields: Optional[List[str]] = None) -> str:
         ticker_upper = ticker.upper().strip()
+        if fields and set(fields) <= TICKER_MAP_PROFILE_FIELDS:
+            return self._run_from_ticker_map(ticker, cik)
+        
+        cache_key = (ticker_upper, _normalize_cik(cik) if cik else None)
+        cached = _company_profile_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         client = get_default_client()
         
-        # First, get CIK from ticker
-        ticker_url = "https://www.sec.gov/files/company_tickers_exchange.json"
         submissions_url = None
+        source_urls = []
         warnings = []
         
         try:
-            # Get ticker map
-            response = client.get(ticker_url)
-            ticker_map = response.json()
-            
-            # Find CIK
-            cik = None
             company_name = None
-            
-            # SEC API returns: {"fields": ["cik", "name", "ticker", "exchange"], "data": [[cik, name, ticker, exchange], ...]}
-            if isinstance(ticker_map, dict) and "fields" in ticker_map and "data" in ticker_map:
-                fields = ticker_map["fields"]
-                data_rows = ticker_map["data"]
-                
-                # Find indices for fields
-                try:
-                    cik_idx = fields.index("cik")
-                    name_idx = fields.index("name")
-                    ticker_idx = fields.index("ticker")
-                except ValueError:
-                    # Fallback if field names don't match expected
-                    cik_idx, name_idx, ticker_idx = 0, 1, 2
-                
-                # Search through data rows
-                for row in data_rows:
-                    if len(row) > ticker_idx and str(row[ticker_idx]).upper() == ticker_upper:
-                        cik = str(row[cik_idx])
-                        company_name = row[name_idx] if len(row) > name_idx else None
-                        break
-            # Legacy format handling (if API changes back)
-            elif isinstance(ticker_map, dict):
-                for entry in ticker_map.values():
-                    if isinstance(entry, dict) and entry.get('ticker', '').upper() == ticker_upper:
-                        cik = str(entry.get('cik_str', entry.get('cik', '')))
-                        company_name = entry.get('title', entry.get('name', ''))
-                        break
-            elif isinstance(ticker_map, list):
-                for entry in ticker_map:
-                    if isinstance(entry, dict) and entry.get('ticker', '').upper() == ticker_upper:
-                        cik = str(entry.get('cik_str', entry.get('cik', '')))
-                        company_name = entry.get('title', entry.get('name', ''))
-                        break
-            
-            if not cik:
-                return json.dumps({
-                    "data": None,
-                    "source_urls": [ticker_url],
-                    "warnings": [f"Ticker '{ticker}' not found in SEC database"]
-                })
+            if cik:
+                # Caller already resolved the CIK, skip the ticker map lookup
+                cik = _normalize_cik(cik)
+            else:
+                # First, get CIK from ticker
+                cik, company_name, source_urls, warnings = _resolve_ticker(ticker)
+                if not cik:
+                    return ToolResult(
+                        data=None,
+                        source_urls=source_urls,
+                        warnings=warnings
+                    ).to_json()
             
             cik_padded = cik.zfill(10)
-            submissions_url = f"https://data.sec.gov/submissions/CIK{cik_padded}.json"
+            submissions_url = _SUBMISSIONS_URL(cik_padded)
             
-            # Get submissions
-            response = client.get(submissions_url)
-            submissions = response.json()
+            # Get submissions; the client keeps the parsed body, so a cache hit
+            # is neither re-encoded nor parsed again
+            data = client.get_json(submissions_url)
+            submissions = {field: data[field] for field in SUBMISSIONS_PROFILE_FIELDS if field in data}
             
             # Normalize profile data
             profile = {
@@ -317,20 +421,56 @@ class GetCompanyProfileTool(BaseTool):
                 }
             }
             
-            result = {
-                "data": profile,
-                "source_urls": [ticker_url, submissions_url],
-                "warnings": warnings
-            }
+            result = ToolResult(
+                data=profile,
+                source_urls=source_urls + [submissions_url],
+                warnings=warnings
+            )
             
-            return json.dumps(result)
+            output = result.to_json()
+            _company_profile_cache.set(cache_key, output)
+            return output
         except Exception as e:
-            source_urls = [ticker_url]
             if submissions_url:
                 source_urls.append(submissions_url)
             
-            return json.dumps({
-                "data": None,
-                "source_urls": source_urls,
-                "warnings": [f"Failed to fetch company profile: {str(e)}"]
-            })
+            return ToolResult(
+                data=None,
+                source_urls=source_urls,
+                warnings=[f"Failed to fetch company profile: {str(e)}"]
+            ).to_json()
+
+    def _run_from_ticker_map(self, ticker: str, cik: Optional[str] = None) -> str:
+        """Build the reduced profile from the cached ticker map alone."""
+        ticker_upper = ticker.upper().strip()
+        if not _VALID_TICKER(ticker_upper):
+            return ToolResult(data=None, source_urls=[], warnings=[_invalid_ticker_warning(ticker)]).to_json()
+        
+        try:
+            entry = _get_ticker_index().get(ticker_upper)
+            if entry is None:
+                return ToolResult(
+                    data=None,
+                    source_urls=[TICKER_MAP_URL],
+                    warnings=[f"Ticker '{ticker}' not found in SEC database"]
+                ).to_json()
+            
+            entry_cik, company_name, exchange = entry
+            profile = {
+                "ticker": ticker_upper,
+                "cik": _normalize_cik(cik or entry_cik),
+                "entity_name": company_name,
+                "exchanges": [exchange] if exchange else []
+            }
+            
+            return ToolResult(
+                data=profile,
+                source_urls=[TICKER_MAP_URL],
+                warnings=[]
+            ).to_json()
+        except Exception as e:
+            return ToolResult(
+                data=None,
+                source_urls=[TICKER_MAP_URL],
+                warnings=[f"Failed to fetch company profile: {str(e)}"]
+            ).to_json()
@@ -5,16 +5,28 @@ These tools combine multiple lower-level tools to provide convenient
 high-level operations for common use cases.
 """
 
-import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Type, Optional, List
 
 from pydantic import BaseModel, Field
 
 from crewai.tools import BaseTool
 
-from .company_tools import TickerToCikTool, GetCompanySubmissionsTool
+from .company_tools import (
+    LOOKUP_CACHE_MAXSIZE,
+    LOOKUP_CACHE_TTL_SECONDS,
+    _normalize_cik,
+    _resolve_ticker,
+)
+from .filing_document_tools import GetFilingIndexHtmlTool, ParseFilingIndexDocumentsTool
 from .filing_tools import ListRecentFilingsTool, GetLatestFilingTool
-from .xbrl_tools import GetCompanyFactsTool, GetCompanyConceptTool
+from .sec_http_client import MemoryCache
+from .tool_instances import get_shared_tool
+from .tool_result import ToolResult
+from .xbrl_tools import GetCompanyConceptTool, MAX_CONCEPT_FETCH_WORKERS
+
+
+_key_financial_series_cache = MemoryCache(LOOKUP_CACHE_MAXSIZE, LOOKUP_CACHE_TTL_SECONDS)
 
 
 class GetLatest10qOr10kInput(BaseModel):
@@ -40,44 +52,41 @@ class GetLatest10qOr10kTool(BaseTool):
     def _run(self, ticker: str) -> str:
         try:
             # Convert ticker to CIK
-            ticker_tool = TickerToCikTool()
-            cik_result = json.loads(ticker_tool._run(ticker))
-            
-            if not cik_result["data"]:
-                return json.dumps({
-                    "data": None,
-                    "source_urls": cik_result["source_urls"],
-                    "warnings": cik_result["warnings"]
-                })
+            cik, _, ticker_urls, ticker_warnings = _resolve_ticker(ticker)
             
-            cik = cik_result["data"]["cik"]
+            if not cik:
+                return ToolResult(
+                    data=None,
+                    source_urls=ticker_urls,
+                    warnings=ticker_warnings
+                ).to_json()
             
             # Get recent filings filtered for 10-Q and 10-K
-            filings_tool = ListRecentFilingsTool()
-            filings_result = json.loads(filings_tool._run(cik, forms=["10-Q", "10-K"], limit=1))
+            filings_tool = get_shared_tool(ListRecentFilingsTool)
+            filings_result = filings_tool._run_native(cik, forms=["10-Q", "10-K"], limit=1)
             
             if not filings_result["data"]:
-                return json.dumps({
-                    "data": None,
-                    "source_urls": cik_result["source_urls"] + filings_result["source_urls"],
-                    "warnings": ["No 10-Q or 10-K filings found"]
-                })
+                return ToolResult(
+                    data=None,
+                    source_urls=ticker_urls + filings_result["source_urls"],
+                    warnings=["No 10-Q or 10-K filings found"]
+                ).to_json()
             
             latest = filings_result["data"][0]
             
-            result = {
-                "data": latest,
-                "source_urls": cik_result["source_urls"] + filings_result["source_urls"],
-                "warnings": []
-            }
+            result = ToolResult(
+                data=latest,
+                source_urls=ticker_urls + filings_result["source_urls"],
+                warnings=[]
+            )
             
-            return json.dumps(result)
+            return result.to_json()
         except Exception as e:
-            return json.dumps({
-                "data": None,
-                "source_urls": [],
-                "warnings": [f"Failed to get latest 10-Q or 10-K: {str(e)}"]
-            })
+            return ToolResult(
+                data=None,
+                source_urls=[],
+                warnings=[f"Failed to get latest 10-Q or 10-K: {str(e)}"]
+            ).to_json()
 
 
 class GetLatest8kInput(BaseModel):
@@ -102,35 +111,32 @@ class GetLatest8kTool(BaseTool):
     def _run(self, ticker: str) -> str:
         try:
             # Convert ticker to CIK
-            ticker_tool = TickerToCikTool()
-            cik_result = json.loads(ticker_tool._run(ticker))
+            cik, _, ticker_urls, ticker_warnings = _resolve_ticker(ticker)
             
-            if not cik_result["data"]:
-                return json.dumps({
-                    "data": None,
-                    "source_urls": cik_result["source_urls"],
-                    "warnings": cik_result["warnings"]
-                })
-            
-            cik = cik_result["data"]["cik"]
+            if not cik:
+                return ToolResult(
+                    data=None,
+                    source_urls=ticker_urls,
+                    warnings=ticker_warnings
+                ).to_json()
             
             # Get latest 8-K
-            latest_tool = GetLatestFilingTool()
-            latest_result = json.loads(latest_tool._run(cik, "8-K"))
+            latest_tool = get_shared_tool(GetLatestFilingTool)
+            latest_result = latest_tool._run_native(cik, "8-K")
             
-            result = {
-                "data": latest_result["data"],
-                "source_urls": cik_result["source_urls"] + latest_result["source_urls"],
-                "warnings": latest_result["warnings"]
-            }
+            result = ToolResult(
+                data=latest_result["data"],
+                source_urls=ticker_urls + latest_result["source_urls"],
+                warnings=latest_result["warnings"]
+            )
             
-            return json.dumps(result)
+            return result.to_json()
         except Exception as e:
-            return json.dumps({
-                "data": None,
-                "source_urls": [],
-                "warnings": [f"Failed to get latest 8-K: {str(e)}"]
-            })
+            return ToolResult(
+                data=None,
+                source_urls=[],
+                warnings=[f"Failed to get latest 8-K: {str(e)}"]
+            ).to_json()
 
 
 class GetFilingDocsBundleInput(BaseModel):
@@ -157,71 +163,63 @@ class GetFilingDocsBundleTool(BaseTool):
 
     def _run(self, ticker: str, form: str) -> str:
         try:
-            from .company_tools import TickerToCikTool
-            from .filing_tools import GetLatestFilingTool
-            from .edgar_url_tools import BuildFilingIndexUrlTool
-            from .filing_document_tools import GetFilingIndexHtmlTool, ParseFilingIndexDocumentsTool
-            
             # Convert ticker to CIK
-            ticker_tool = TickerToCikTool()
-            cik_result = json.loads(ticker_tool._run(ticker))
+            cik, _, ticker_urls, ticker_warnings = _resolve_ticker(ticker)
             
-            if not cik_result["data"]:
-                return json.dumps({
-                    "data": None,
-                    "source_urls": cik_result["source_urls"],
-                    "warnings": cik_result["warnings"]
-                })
-            
-            cik = cik_result["data"]["cik"]
+            if not cik:
+                return ToolResult(
+                    data=None,
+                    source_urls=ticker_urls,
+                    warnings=ticker_warnings
+                ).to_json()
             
             # Get latest filing
-            latest_tool = GetLatestFilingTool()
-            latest_result = json.loads(latest_tool._run(cik, form))
+            latest_tool = get_shared_tool(GetLatestFilingTool)
+            latest_result = latest_tool._run_native(cik, form)
             
             if not latest_result["data"]:
-                return json.dumps({
-                    "data": None,
-                    "source_urls": cik_result["source_urls"] + latest_result["source_urls"],
-                    "warnings": latest_result["warnings"]
-                })
+                return ToolResult(
+                    data=None,
+                    source_urls=ticker_urls + latest_result["source_urls"],
+                    warnings=latest_result["warnings"]
+                ).to_json()
             
             filing_meta = latest_result["data"]
             accession = filing_meta["accessionNumber"]
             
             # Get filing index HTML
-            index_tool = GetFilingIndexHtmlTool()
-            index_result = json.loads(index_tool._run(cik, accession))
+            index_tool = get_shared_tool(GetFilingIndexHtmlTool)
+            index_result = index_tool._run_native(cik, accession)
             
             documents = []
             if index_result["data"]:
                 # Parse documents
-                parse_tool = ParseFilingIndexDocumentsTool()
-                parse_result = json.loads(parse_tool._run(index_result["data"]["html"]))
+                parse_tool = get_shared_tool(ParseFilingIndexDocumentsTool)
+                parse_result = parse_tool._run_native(index_result["data"]["html"])
                 documents = parse_result["data"]
             
-            result = {
-                "data": {
+            result = ToolResult(
+                data={
                     "filing_meta": filing_meta,
                     "documents": documents,
                     "document_count": len(documents),
                     "index_url": index_result["data"]["url"] if index_result["data"] else None
                 },
-                "source_urls": (
-                    cik_result["source_urls"] +
+                source_urls=(
+                    ticker_urls +
                     latest_result["source_urls"] +
                     index_result["source_urls"]
                 ),
-                "warnings": latest_result["warnings"] + index_result["warnings"]
-            }
+                warnings=latest_result["warnings"] + index_result["warnings"]
+            )
             
-            return json.dumps(result)
+            return result.to_json()
         except Exception as e:
-            return json.dumps({
-                "data": None,
-                "source_urls": [],
-                "warnings": [f"Failed to get filing docs bundle: {str(e)}"]
-            })
+            return ToolResult(
+                data=None,
+                source_urls=[],
+                warnings=[f"Failed to get filing docs bundle: {str(e)}"]
+            ).to_json()
 
 
 class GetKeyFinancialSeriesInput(BaseModel):
@@ -231,6 +229,10 @@ class GetKeyFinancialSeriesInput(BaseModel):
         ...,
         description="List of XBRL tags to retrieve (e.g., ['Revenues', 'NetIncomeLoss', 'Assets'])"
     )
+    cik: Optional[str] = Field(
+        None,
+        description="CIK of the company if already known; skips the ticker-to-CIK lookup"
+    )
 
 
 class GetKeyFinancialSeriesTool(BaseTool):
@@ -248,60 +250,76 @@ class GetKeyFinancialSeriesTool(BaseTool):
     """
     args_schema: Type[BaseModel] = GetKeyFinancialSeriesInput
 
-    def _run(self, ticker: str, tags: List[str]) -> str:
+    def _run(self, ticker: str, tags: List[str], cik: Optional[str] = None) -> str:
+        cache_key = (ticker.upper().strip(), tuple(tags), _normalize_cik(cik) if cik else None)
+        cached = _key_financial_series_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            # Convert ticker to CIK
-            ticker_tool = TickerToCikTool()
-            cik_result = json.loads(ticker_tool._run(ticker))
-            
-            if not cik_result["data"]:
-                return json.dumps({
-                    "data": None,
-                    "source_urls": cik_result["source_urls"],
-                    "warnings": cik_result["warnings"]
-                })
-            
-            cik = cik_result["data"]["cik"]
+            source_urls = []
+            if cik:
+                cik = _normalize_cik(cik)
+            else:
+                # Convert ticker to CIK
+                cik, _, source_urls, ticker_warnings = _resolve_ticker(ticker)
+                
+                if not cik:
+                    return ToolResult(
+                        data=None,
+                        source_urls=source_urls,
+                        warnings=ticker_warnings
+                    ).to_json()
             
             # Get concepts for each tag
-            concept_tool = GetCompanyConceptTool()
+            concept_tool = get_shared_tool(GetCompanyConceptTool)
             series_data = {}
-            source_urls = cik_result["source_urls"]
             warnings = []
             
-            for tag in tags:
-                try:
-                    concept_result = json.loads(concept_tool._run(cik, "us-gaap", tag))
-                    source_urls.extend(concept_result.get("source_urls", []))
-                    
-                    if concept_result["data"]:
-                        # Extract units and facts
-                        units_data = concept_result["data"].get("units", {})
-                        series_data[tag] = {
-                            "units": list(units_data.keys()),
-                            "facts": units_data
-                        }
-                    else:
-                        warnings.append(f"No data found for tag '{tag}'")
-                except Exception as e:
-                    warnings.append(f"Failed to get data for tag '{tag}': {str(e)}")
+            # One HTTP request per tag; fetch them concurrently (the shared client's
+            # rate limiter still applies) and collect the results in tag order
+            max_workers = max(1, min(len(tags), MAX_CONCEPT_FETCH_WORKERS))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [(tag, executor.submit(concept_tool._run_native, cik, "us-gaap", tag)) for tag in tags]
+                
+                for tag, future in futures:
+                    try:
+                        concept_result = future.result()
+                        source_urls.extend(concept_result.get("source_urls", []))
+                        
+                        if concept_result["data"]:
+                            # Extract units and facts
+                            units_data = concept_result["data"].get("units", {})
+                            series_data[tag] = {
+                                "units": list(units_data.keys()),
+                                "facts": units_data
+                            }
+                        else:
+                            warnings.append(f"No data found for tag '{tag}'")
+                    except Exception as e:
+                        warnings.append(f"Failed to get data for tag '{tag}': {str(e)}")
             
-            result = {
-                "data": {
+            result = ToolResult(
+                data={
                     "ticker": ticker,
                     "cik": cik,
                     "series": series_data,
                     "tags_requested": tags,
                     "tags_found": list(series_data.keys())
                 },
-                "source_urls": source_urls,
-                "warnings": warnings
-            }
+                source_urls=source_urls,
+                warnings=warnings
+            )
             
-            return json.dumps(result)
+            output = result.to_json()
+            # A missing tag may be a transient fetch failure, so only complete
+            # results are kept for the whole TTL
+            if not warnings:
+                _key_financial_series_cache.set(cache_key, output)
+            return output
         except Exception as e:
-            return json.dumps({
-                "data": None,
-                "source_urls": [],
-                "warnings": [f"Failed to get key financial series: {str(e)}"]
-            })
+            return ToolResult(
+                data=None,
+                source_urls=[],
+                warnings=[f"Failed to get key financial series: {str(e)}"]
+            ).to_json()
@@ -5,9 +5,15 @@ These tools work with EDGAR daily and quarterly index files for discovering
 filings by date and building custom searches.
 """
 
-import json
+import csv
+import gzip
+import io
+import os
 import re
-from typing import Type, Optional, List
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Type, Optional, List, Dict, Tuple
 from datetime import datetime
 from pathlib import Path
 
@@ -15,7 +21,61 @@ from pydantic import BaseModel, Field
 
 from crewai.tools import BaseTool
 
+from . import fast_json as json
+from .company_tools import _normalize_cik
+from .edgar_url_tools import ARCHIVES_DATA_URL
 from .sec_http_client import get_default_client
+from .tool_result import ToolResult
+
+try:
+    # Optional: parallel decompression of .gz index files
+    import rapidgzip
+except ImportError:
+    rapidgzip = None
+
+
+DAILY_INDEX_BASE_URL = "https://www.sec.gov/Archives/edgar/daily-index"
+
+# Leading "/", "edgar/" or "edgar/data/" of an index path, stripped in one match
+_EDGAR_PATH_PREFIX = re.compile(r"^/*(?:edgar/(?:data/)?)?")
+
+# Zero-padded month numbers covered by each quarter, e.g. 2 -> ("04", "05", "06")
+_QUARTER_MONTHS = {
+    q: tuple(f"{m:02d}" for m in range((q - 1) * 3 + 1, q * 3 + 1))
+    for q in range(1, 5)
+}
+
+# Master index variants for one month, in the order downloads try them
+_MASTER_INDEX_URL_TEMPLATES = (
+    "{base}/{year}/QTR{quarter}/master.{month}.idx",
+    "{base}/{year}/QTR{quarter}/master.{month}.idx.gz",
+)
+
+
+def _open_index_text(path: Path):
+    """Open a plain or gzip-compressed index file as latin-1 text."""
+    if path.suffix != ".gz":
+        return open(path, 'r', encoding='latin-1', newline='')
+    if rapidgzip is not None:
+        raw = rapidgzip.open(str(path), parallelization=os.cpu_count() or 1)
+    else:
+        raw = gzip.open(path, 'rb')
+    return io.TextIOWrapper(raw, encoding='latin-1', newline='')
+
+
+def _master_index_urls(year: int, quarter: int, month: str) -> List[str]:
+    """Build the master index URLs for one month of a quarter."""
+    return [
+        template.format(base=DAILY_INDEX_BASE_URL, year=year, quarter=quarter, month=month)
+        for template in _MASTER_INDEX_URL_TEMPLATES
+    ]
+
+
+def _master_index_urls_for_date(date: str) -> List[str]:
+    """Build the master index URLs for a YYYY-MM-DD date (ValueError if malformed)."""
+    date_obj = datetime.strptime(date, "%Y-%m-%d")
+    quarter = (date_obj.month - 1) // 3 + 1
+    return _master_index_urls(date_obj.year, quarter, f"{date_obj.month:02d}")
 
 
 class ListDailyIndexPathsInput(BaseModel):
@@ -27,6 +87,10 @@ class ListDailyIndexPathsInput(BaseModel):
         le=4,
         description="Quarter (1-4), optional"
     )
+    verify: bool = Field(
+        default=False,
+        description="Check which paths exist on SEC (HEAD requests) and report their sizes"
+    )
 
 
 class ListDailyIndexPathsTool(BaseTool):
@@ -40,42 +104,48 @@ class ListDailyIndexPathsTool(BaseTool):
     description: str = """
     Lists likely daily index file paths for a given year and optionally quarter.
     Returns paths to .idx, .gz, and .zip files that can be downloaded from
-    the SEC's daily index directory.
+    the SEC's daily index directory. With verify=True, also returns the paths
+    that actually exist, with their sizes in bytes.
     """
     args_schema: Type[BaseModel] = ListDailyIndexPathsInput
 
-    def _run(self, year: int, quarter: Optional[int] = None) -> str:
-        base_url = "https://www.sec.gov/Archives/edgar/daily-index"
+    def _run(self, year: int, quarter: Optional[int] = None, verify: bool = False) -> str:
+        # A single quarter, or all four
+        quarters = (quarter,) if quarter else (1, 2, 3, 4)
+        paths = [
+            path
+            for q in quarters
+            for month in _QUARTER_MONTHS[q]
+            for path in _master_index_urls(year, q, month)
+        ]
         
-        paths = []
+        data = {
+            "year": year,
+            "quarter": quarter,
+            "paths": paths,
+            "count": len(paths)
+        }
+        warnings = []
         
-        if quarter:
-            # Quarterly paths
-            for month in range((quarter - 1) * 3 + 1, quarter * 3 + 1):
-                month_str = f"{month:02d}"
-                paths.extend([
-                    f"{base_url}/{year}/QTR{quarter}/master.{month_str}.idx",
-                    f"{base_url}/{year}/QTR{quarter}/master.{month_str}.idx.gz",
-                ])
-        else:
-            # All quarters
-            for q in range(1, 5):
-                for month in range((q - 1) * 3 + 1, q * 3 + 1):
-                    month_str = f"{month:02d}"
-                    paths.extend([
-                        f"{base_url}/{year}/QTR{q}/master.{month_str}.idx",
-                        f"{base_url}/{year}/QTR{q}/master.{month_str}.idx.gz",
-                    ])
+        if verify:
+            # All paths are probed concurrently rather than one round trip each
+            outcomes = get_default_client().head_all(paths)
+            data["verified"] = [
+                {
+                    "url": path,
+                    "size": int(outcome.headers["Content-Length"]) if "Content-Length" in outcome.headers else None
+                }
+                for path, outcome in zip(paths, outcomes)
+                if not isinstance(outcome, Exception) and outcome.ok
+            ]
+            errors = [outcome for outcome in outcomes if isinstance(outcome, Exception)]
+            if errors:
+                warnings.append(f"Could not check {len(errors)} of {len(paths)} paths: {str(errors[0])}")
         
         result = {
-            "data": {
-                "year": year,
-                "quarter": quarter,
-                "paths": paths,
-                "count": len(paths)
-            },
-            "source_urls": [base_url],
-            "warnings": []
+            "data": data,
+            "source_urls": [DAILY_INDEX_BASE_URL],
+            "warnings": warnings
         }
         
         return json.dumps(result)
@@ -104,68 +174,251 @@ class DownloadDailyMasterIndexTool(BaseTool):
 
     def _run(self, date: str, dest_path: str) -> str:
         try:
-            # Parse date
-            date_obj = datetime.strptime(date, "%Y-%m-%d")
-            year = date_obj.year
-            month = date_obj.month
-            quarter = (month - 1) // 3 + 1
-            
-            base_url = "https://www.sec.gov/Archives/edgar/daily-index"
-            month_str = f"{month:02d}"
-            
             # Try different file formats
-            urls_to_try = [
-                f"{base_url}/{year}/QTR{quarter}/master.{month_str}.idx",
-                f"{base_url}/{year}/QTR{quarter}/master.{month_str}.idx.gz",
-            ]
-            
+            urls_to_try = _master_index_urls_for_date(date)
+        except ValueError:
+            return json.dumps({
+                "data": None,
+                "source_urls": [],
+                "warnings": ["Invalid date format. Use YYYY-MM-DD format."]
+            })
+        
+        try:
             client = get_default_client()
-            downloaded_path = None
-            source_url = None
-            
-            for url in urls_to_try:
-                try:
-                    downloaded_path = client.download(url, dest_path)
-                    source_url = url
-                    break
-                except:
-                    continue
             
-            if downloaded_path:
-                result = {
-                    "data": {
-                        "downloaded_path": downloaded_path,
-                        "url": source_url,
-                        "date": date
-                    },
-                    "source_urls": [source_url],
-                    "warnings": []
-                }
+            if Path(dest_path).exists():
+                # Already downloaded; download() returns the local copy
+                source_url = urls_to_try[0]
             else:
-                result = {
+                # HEAD-probe every variant at once; only an existing file is downloaded
+                source_url = client.first_available(urls_to_try)
+            
+            if not source_url:
+                return json.dumps({
                     "data": None,
                     "source_urls": urls_to_try,
-                    "warnings": [f"Failed to download master index for {date} from any URL"]
-                }
+                    "warnings": [f"No master index found for {date} at any URL"]
+                })
+            
+            downloaded_path = client.download(source_url, dest_path)
+            
+            result = {
+                "data": {
+                    "downloaded_path": downloaded_path,
+                    "url": source_url,
+                    "date": date
+                },
+                "source_urls": [source_url],
+                "warnings": []
+            }
             
             return json.dumps(result)
-        except ValueError:
+        except Exception as e:
             return json.dumps({
                 "data": None,
-                "source_urls": [],
-                "warnings": ["Invalid date format. Use YYYY-MM-DD format."]
+                "source_urls": urls_to_try,
+                "warnings": [f"Failed to download daily master index: {str(e)}"]
             })
+
+
+# Dates downloaded concurrently by the batch tool; the shared client's rate
+# limiter still caps the request rate at SEC's limit
+MAX_MASTER_INDEX_DOWNLOAD_WORKERS = 8
+
+
+class DownloadDailyMasterIndexBatchInput(BaseModel):
+    """Input schema for download_daily_master_index_batch tool."""
+    dates: List[str] = Field(..., description="Dates in YYYY-MM-DD format")
+    dest_dir: str = Field(..., description="Local directory where to save the index files")
+
+
+class DownloadDailyMasterIndexBatchTool(BaseTool):
+    """
+    Download daily master index files for many dates.
+    
+    Downloads the master index file for each date concurrently through the
+    shared rate-limited client, saving them as master.YYYYMMDD.idx[.gz]
+    under dest_dir.
+    """
+    name: str = "download_daily_master_index_batch"
+    description: str = """
+    Downloads the daily master index files for a list of dates in one call.
+    Each file is saved in dest_dir as master.YYYYMMDD.idx (or .idx.gz).
+    Dates that cannot be downloaded are reported in warnings.
+    """
+    args_schema: Type[BaseModel] = DownloadDailyMasterIndexBatchInput
+
+    def _run(self, dates: List[str], dest_dir: str) -> str:
+        try:
+            client = get_default_client()
+            dest_dir_obj = Path(dest_dir)
+            
+            def download(date):
+                try:
+                    urls_to_try = _master_index_urls_for_date(date)
+                except ValueError:
+                    return None, [], f"Invalid date format for {date}. Use YYYY-MM-DD format."
+                
+                stem = f"master.{date.replace('-', '')}"
+                candidates = [(url, dest_dir_obj / (stem + url[url.rindex('.idx'):])) for url in urls_to_try]
+                
+                existing = next(((url, path) for url, path in candidates if path.exists()), None)
+                if existing:
+                    source_url, dest_path = existing
+                else:
+                    try:
+                        source_url = client.first_available(urls_to_try)
+                    except Exception as e:
+                        return None, urls_to_try, f"Failed to download master index for {date}: {str(e)}"
+                    if not source_url:
+                        return None, urls_to_try, f"No master index found for {date} at any URL"
+                    dest_path = dict(candidates)[source_url]
+                
+                try:
+                    downloaded_path = client.download(source_url, str(dest_path))
+                except Exception as e:
+                    return None, [source_url], f"Failed to download master index for {date}: {str(e)}"
+                
+                return {"date": date, "downloaded_path": downloaded_path, "url": source_url}, [source_url], None
+            
+            max_workers = max(1, min(len(dates), MAX_MASTER_INDEX_DOWNLOAD_WORKERS))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                outcomes = list(executor.map(download, dates))
+            
+            downloads = [entry for entry, _, _ in outcomes if entry]
+            source_urls = [url for _, urls, _ in outcomes for url in urls]
+            warnings = [warning for _, _, warning in outcomes if warning]
+            
+            result = {
+                "data": {
+                    "downloads": downloads,
+                    "count": len(downloads),
+                    "requested": len(dates)
+                },
+                "source_urls": source_urls,
+                "warnings": warnings
+            }
+            
+            return json.dumps(result)
         except Exception as e:
             return json.dumps({
                 "data": None,
                 "source_urls": [],
-                "warnings": [f"Failed to download daily master index: {str(e)}"]
+                "warnings": [f"Failed to download daily master indexes: {str(e)}"]
             })
 
 
+def _parse_master_idx_lines(f) -> List[Dict[str, str]]:
+    """Parse the rows of master index text read line by line from f."""
+    # Master index format: skip header lines up to the column header,
+    # then one pipe-separated row per filing:
+    # CIK|Company Name|Form Type|Date Filed|File Name
+    for line in f:
+        if '|' in line and 'CIK' in line.upper():
+            break
+    
+    # csv.reader tokenizes in C; QUOTE_NONE keeps quotes in company
+    # names literal, like str.split('|') would
+    rows = []
+    for parts in csv.reader(f, delimiter='|', quoting=csv.QUOTE_NONE):
+        if len(parts) < 4:
+            continue
+        
+        rows.append({
+            "cik": parts[0].strip(),
+            "company_name": parts[1].strip(),
+            "form_type": parts[2].strip(),
+            "date_filed": parts[3].strip(),
+            "edgar_path": parts[4].strip() if len(parts) > 4 else ""
+        })
+    return rows
+
+
+def _read_master_idx(path: Path) -> List[Dict[str, str]]:
+    """Parse the rows of a master index file."""
+    with _open_index_text(path) as f:
+        return _parse_master_idx_lines(f)
+
+
+@lru_cache(maxsize=16)
+def _parse_master_idx_cached(path: str, mtime_ns: int) -> Tuple[Dict[str, str], ...]:
+    # mtime_ns is only part of the cache key, so a rewritten file is re-parsed
+    return tuple(_read_master_idx(Path(path)))
+
+
+# Row positions by zero-padded CIK and by upper-cased form type
+MasterIdxIndex = Tuple[Dict[str, List[int]], Dict[str, List[int]]]
+
+
+def _index_master_idx_rows(rows) -> MasterIdxIndex:
+    """Index master index rows by CIK and form type in a single pass."""
+    by_cik = defaultdict(list)
+    by_form = defaultdict(list)
+    for position, row in enumerate(rows):
+        by_cik[row.get("cik", "").zfill(10)].append(position)
+        by_form[row.get("form_type", "").upper()].append(position)
+    return dict(by_cik), dict(by_form)
+
+
+@lru_cache(maxsize=16)
+def _index_master_idx_cached(path: str, mtime_ns: int) -> MasterIdxIndex:
+    return _index_master_idx_rows(_parse_master_idx_cached(path, mtime_ns))
+
+
+def _parse_master_idx(path: Path) -> Tuple[Dict[str, str], ...]:
+    """Parse a master index file, reusing the rows of recently parsed files."""
+    return _parse_master_idx_cached(str(path.resolve()), path.stat().st_mtime_ns)
+
+
+def _load_master_idx(path: Path) -> Tuple[Tuple[Dict[str, str], ...], MasterIdxIndex]:
+    """Parse and index a master index file, both cached per path and mtime."""
+    key = (str(path.resolve()), path.stat().st_mtime_ns)
+    return _parse_master_idx_cached(*key), _index_master_idx_cached(*key)
+
+
+def _filter_master_idx_rows(
+    rows,
+    cik: Optional[str] = None,
+    forms: Optional[List[str]] = None,
+    index: Optional[MasterIdxIndex] = None
+) -> List[Dict[str, str]]:
+    """
+    Filter master index rows by CIK and/or form types, keeping row order.
+    
+    Filters are answered from a CIK / form type index (built here unless
+    a cached one is passed) instead of scanning and re-normalizing rows.
+    """
+    if not cik and not forms:
+        return list(rows)
+    
+    by_cik, by_form = index or _index_master_idx_rows(rows)
+    
+    positions = None
+    if cik:
+        positions = by_cik.get(_normalize_cik(cik), [])
+    if forms:
+        form_positions = set()
+        for form in forms:
+            form_positions.update(by_form.get(form.upper(), ()))
+        if positions is None:
+            positions = sorted(form_positions)
+        else:
+            positions = [p for p in positions if p in form_positions]
+    
+    return [rows[p] for p in positions]
+
+
 class ParseMasterIdxInput(BaseModel):
     """Input schema for parse_master_idx tool."""
-    file_path: str = Field(..., description="Path to the master.idx file")
+    file_path: str = Field(..., description="Path to the master.idx (or master.idx.gz) file")
+    summary_only: bool = Field(
+        default=False,
+        description="Return only the row count and form type counts instead of every row"
+    )
+
+
+# Number of most common form types listed in a master index summary
+MASTER_IDX_SUMMARY_FORM_TYPES = 20
 
 
 class ParseMasterIdxTool(BaseTool):
@@ -177,13 +430,15 @@ class ParseMasterIdxTool(BaseTool):
     """
     name: str = "parse_master_idx"
     description: str = """
-    Parses a master index file and extracts filing information. Returns rows
-    with: cik, company_name, form_type, date_filed, edgar_path. The master
-    index file format is a fixed-width text file with header information.
+    Parses a master index file (.idx or .idx.gz) and extracts filing information.
+    Returns rows with: cik, company_name, form_type, date_filed, edgar_path. The
+    master index file format is a fixed-width text file with header information.
+    Set summary_only to get just the row count and the most common form types;
+    then use find_filings_in_master_idx_by_path to fetch the rows you need.
     """
     args_schema: Type[BaseModel] = ParseMasterIdxInput
 
-    def _run(self, file_path: str) -> str:
+    def _run(self, file_path: str, summary_only: bool = False) -> str:
         try:
             file_path_obj = Path(file_path)
             if not file_path_obj.exists():
@@ -193,54 +448,74 @@ class ParseMasterIdxTool(BaseTool):
                     "warnings": [f"File not found: {file_path}"]
                 })
             
-            rows = []
-            with open(file_path_obj, 'r', encoding='latin-1') as f:
-                lines = f.readlines()
+            if summary_only:
+                rows, (_, by_form) = _load_master_idx(file_path_obj)
+                form_counts = sorted(by_form.items(), key=lambda item: len(item[1]), reverse=True)
+                data = {
+                    "file_path": str(file_path_obj),
+                    "count": len(rows),
+                    "form_types": {
+                        form: len(positions)
+                        for form, positions in form_counts[:MASTER_IDX_SUMMARY_FORM_TYPES]
+                    }
+                }
+            else:
+                rows = _parse_master_idx(file_path_obj)
+                data = {
+                    "rows": rows,
+                    "count": len(rows)
+                }
             
-            # Master index format: skip header lines (usually first few lines)
-            # Then parse fixed-width format
-            # Format: CIK|Company Name|Form Type|Date Filed|File Name
-            data_started = False
+            result = {
+                "data": data,
+                "source_urls": [],
+                "warnings": [] if rows else ["No rows parsed from master index file"]
+            }
             
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                # Skip header lines
-                if not data_started:
-                    if '|' in line and 'CIK' in line.upper():
-                        data_started = True
-                        continue
-                    continue
-                
-                # Parse line (pipe-separated or fixed-width)
-                if '|' in line:
-                    parts = line.split('|')
-                    if len(parts) >= 4:
-                        try:
-                            cik = parts[0].strip()
-                            company_name = parts[1].strip()
-                            form_type = parts[2].strip()
-                            date_filed = parts[3].strip()
-                            edgar_path = parts[4].strip() if len(parts) > 4 else ""
-                            
-                            rows.append({
-                                "cik": cik,
-                                "company_name": company_name,
-                                "form_type": form_type,
-                                "date_filed": date_filed,
-                                "edgar_path": edgar_path
-                            })
-                        except (IndexError, ValueError):
-                            continue
+            return json.dumps(result)
+        except Exception as e:
+            return json.dumps({
+                "data": [],
+                "source_urls": [],
+                "warnings": [f"Failed to parse master index: {str(e)}"]
+            })
+
+
+class ParseMasterIdxUrlInput(BaseModel):
+    """Input schema for parse_master_idx_url tool."""
+    url: str = Field(..., description="URL of a master.idx or master.idx.gz file on SEC")
+
+
+class ParseMasterIdxUrlTool(BaseTool):
+    """
+    Parse a master index file straight from SEC.
+    
+    Streams the file and parses rows as they arrive, decompressing .gz files
+    on the fly, without saving anything to disk.
+    """
+    name: str = "parse_master_idx_url"
+    description: str = """
+    Fetches a master index file (.idx or .idx.gz) from its SEC URL and parses it
+    without saving it to disk. Returns rows with: cik, company_name, form_type,
+    date_filed, edgar_path. Use download_daily_master_index instead if you need
+    the file itself.
+    """
+    args_schema: Type[BaseModel] = ParseMasterIdxUrlInput
+
+    def _run(self, url: str) -> str:
+        try:
+            with get_default_client().stream(url) as response:
+                # Undo any Content-Encoding while reading the raw socket stream
+                response.raw.decode_content = True
+                body = gzip.GzipFile(fileobj=response.raw) if url.endswith(".gz") else response.raw
+                rows = _parse_master_idx_lines(io.TextIOWrapper(body, encoding='latin-1', newline=''))
             
             result = {
                 "data": {
                     "rows": rows,
                     "count": len(rows)
                 },
-                "source_urls": [],
+                "source_urls": [url],
                 "warnings": [] if rows else ["No rows parsed from master index file"]
             }
             
@@ -248,7 +523,7 @@ class ParseMasterIdxTool(BaseTool):
         except Exception as e:
             return json.dumps({
                 "data": [],
-                "source_urls": [],
+                "source_urls": [url],
                 "warnings": [f"Failed to parse master index: {str(e)}"]
             })
 
@@ -297,13 +572,7 @@ class FindFilingsInMasterIdxTool(BaseTool):
                 rows_list = []
             
             # Apply filters
-            filtered = rows_list
-            if cik:
-                cik_padded = cik.strip().zfill(10)
-                filtered = [r for r in filtered if r.get("cik", "").zfill(10) == cik_padded]
-            if forms:
-                forms_upper = [f.upper() for f in forms]
-                filtered = [r for r in filtered if r.get("form_type", "").upper() in forms_upper]
+            filtered = _filter_master_idx_rows(rows_list, cik, forms)
             
             result = {
                 "data": {
@@ -334,6 +603,67 @@ class FindFilingsInMasterIdxTool(BaseTool):
             })
 
 
+class FindFilingsInMasterIdxByPathInput(BaseModel):
+    """Input schema for find_filings_in_master_idx_by_path tool."""
+    file_path: str = Field(..., description="Path to the master.idx (or master.idx.gz) file")
+    cik: Optional[str] = Field(default=None, description="Filter by CIK")
+    forms: Optional[List[str]] = Field(
+        default=None,
+        description="Filter by form types (e.g., ['10-Q', '10-K'])"
+    )
+
+
+class FindFilingsInMasterIdxByPathTool(BaseTool):
+    """
+    Find filings in a master index file.
+    
+    Parses a master index file (reusing recently parsed files) and filters
+    its rows by CIK and/or form types in one step.
+    """
+    name: str = "find_filings_in_master_idx_by_path"
+    description: str = """
+    Filters the rows of a local master index file by CIK and/or form types.
+    Takes the file path instead of parsed rows, so the full index never has
+    to be passed around; only the matching rows are returned.
+    """
+    args_schema: Type[BaseModel] = FindFilingsInMasterIdxByPathInput
+
+    def _run(self, file_path: str, cik: Optional[str] = None, forms: Optional[List[str]] = None) -> str:
+        try:
+            file_path_obj = Path(file_path)
+            if not file_path_obj.exists():
+                return json.dumps({
+                    "data": {"rows": [], "count": 0, "original_count": 0},
+                    "source_urls": [],
+                    "warnings": [f"File not found: {file_path}"]
+                })
+            
+            rows, index = _load_master_idx(file_path_obj)
+            filtered = _filter_master_idx_rows(rows, cik, forms, index)
+            
+            result = {
+                "data": {
+                    "rows": filtered,
+                    "count": len(filtered),
+                    "original_count": len(rows),
+                    "filters_applied": {
+                        "cik": cik,
+                        "forms": forms
+                    }
+                },
+                "source_urls": [],
+                "warnings": []
+            }
+            
+            return json.dumps(result)
+        except Exception as e:
+            return json.dumps({
+                "data": {"rows": [], "count": 0, "original_count": 0},
+                "source_urls": [],
+                "warnings": [f"Failed to find filings: {str(e)}"]
+            })
+
+
 class EdgarPathToDocUrlInput(BaseModel):
     """Input schema for edgar_path_to_doc_url tool."""
     edgar_path: str = Field(
@@ -358,21 +688,10 @@ class EdgarPathToDocUrlTool(BaseTool):
 
     def _run(self, edgar_path: str) -> str:
         # Remove leading 'edgar/' or 'edgar/data/' if present
-        path = edgar_path.lstrip('/')
-        if path.startswith('edgar/data/'):
-            path = path[11:]  # Remove 'edgar/data/'
-        elif path.startswith('edgar/'):
-            path = path[6:]  # Remove 'edgar/'
+        path = _EDGAR_PATH_PREFIX.sub("", edgar_path, count=1)
+        url = f"{ARCHIVES_DATA_URL}/{path}"
         
-        url = f"https://www.sec.gov/Archives/edgar/data/{path}"
-        
-        result = {
-            "data": {
-                "url": url,
-                "edgar_path": edgar_path
-            },
-            "source_urls": [],
-            "warnings": []
-        }
-        
-        return json.dumps(result)
+        return ToolResult(data={
+            "url": url,
+            "edgar_path": edgar_path
+        }).to_json()
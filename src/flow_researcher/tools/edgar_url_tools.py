@@ -5,13 +5,22 @@ These tools help construct URLs for accessing EDGAR filing documents
 and archives.
 """
 
-import json
 from typing import Type
 
 from pydantic import BaseModel, Field
 
 from crewai.tools import BaseTool
 
+from .company_tools import _normalize_cik
+from .tool_result import ToolResult
+
+
+ARCHIVES_DATA_URL = "https://www.sec.gov/Archives/edgar/data"
+
+_FILING_INDEX_URL = (ARCHIVES_DATA_URL + "/{}/{}-index.html").format
+_COMPLETE_SUBMISSION_URL = (ARCHIVES_DATA_URL + "/{}/{}.txt").format
+_FILING_FOLDER_URL = (ARCHIVES_DATA_URL + "/{}/{}/").format
+
 
 class AccessionToNodashesInput(BaseModel):
     """Input schema for accession_to_nodashes tool."""
@@ -39,16 +48,10 @@ class AccessionToNodashesTool(BaseTool):
     def _run(self, accession_with_dashes: str) -> str:
         accession_no_dashes = accession_with_dashes.replace("-", "")
         
-        result = {
-            "data": {
-                "accession_with_dashes": accession_with_dashes,
-                "accession_no_dashes": accession_no_dashes
-            },
-            "source_urls": [],
-            "warnings": []
-        }
-        
-        return json.dumps(result)
+        return ToolResult(data={
+            "accession_with_dashes": accession_with_dashes,
+            "accession_no_dashes": accession_no_dashes
+        }).to_json()
 
 
 class BuildFilingIndexUrlInput(BaseModel):
@@ -75,21 +78,20 @@ class BuildFilingIndexUrlTool(BaseTool):
     """
     args_schema: Type[BaseModel] = BuildFilingIndexUrlInput
 
+    @staticmethod
+    def build(cik: str, accession_with_dashes: str) -> str:
+        """Return the URL alone, for callers inside this package."""
+        return _FILING_INDEX_URL(_normalize_cik(cik), accession_with_dashes)
+
     def _run(self, cik: str, accession_with_dashes: str) -> str:
-        cik_padded = cik.strip().zfill(10)
-        url = f"https://www.sec.gov/Archives/edgar/data/{cik_padded}/{accession_with_dashes}-index.html"
-        
-        result = {
-            "data": {
-                "url": url,
-                "cik": cik_padded,
-                "accession": accession_with_dashes
-            },
-            "source_urls": [],
-            "warnings": []
-        }
+        cik_padded = _normalize_cik(cik)
+        url = self.build(cik_padded, accession_with_dashes)
         
-        return json.dumps(result)
+        return ToolResult(data={
+            "url": url,
+            "cik": cik_padded,
+            "accession": accession_with_dashes
+        }).to_json()
 
 
 class BuildCompleteSubmissionTxtUrlInput(BaseModel):
@@ -116,21 +118,20 @@ class BuildCompleteSubmissionTxtUrlTool(BaseTool):
     """
     args_schema: Type[BaseModel] = BuildCompleteSubmissionTxtUrlInput
 
+    @staticmethod
+    def build(cik: str, accession_with_dashes: str) -> str:
+        """Return the URL alone, for callers inside this package."""
+        return _COMPLETE_SUBMISSION_URL(_normalize_cik(cik), accession_with_dashes)
+
     def _run(self, cik: str, accession_with_dashes: str) -> str:
-        cik_padded = cik.strip().zfill(10)
-        url = f"https://www.sec.gov/Archives/edgar/data/{cik_padded}/{accession_with_dashes}.txt"
+        cik_padded = _normalize_cik(cik)
+        url = self.build(cik_padded, accession_with_dashes)
         
-        result = {
-            "data": {
-                "url": url,
-                "cik": cik_padded,
-                "accession": accession_with_dashes
-            },
-            "source_urls": [],
-            "warnings": []
-        }
-        
-        return json.dumps(result)
+        return ToolResult(data={
+            "url": url,
+            "cik": cik_padded,
+            "accession": accession_with_dashes
+        }).to_json()
 
 
 class BuildFilingFolderUrlInput(BaseModel):
@@ -159,19 +160,13 @@ class BuildFilingFolderUrlTool(BaseTool):
     args_schema: Type[BaseModel] = BuildFilingFolderUrlInput
 
     def _run(self, cik: str, accession_with_dashes: str) -> str:
-        cik_padded = cik.strip().zfill(10)
+        cik_padded = _normalize_cik(cik)
         accession_no_dashes = accession_with_dashes.replace("-", "")
-        url = f"https://www.sec.gov/Archives/edgar/data/{cik_padded}/{accession_no_dashes}/"
-        
-        result = {
-            "data": {
-                "url": url,
-                "cik": cik_padded,
-                "accession_with_dashes": accession_with_dashes,
-                "accession_no_dashes": accession_no_dashes
-            },
-            "source_urls": [],
-            "warnings": []
-        }
+        url = _FILING_FOLDER_URL(cik_padded, accession_no_dashes)
         
-        return json.dumps(result)
+        return ToolResult(data={
+            "url": url,
+            "cik": cik_padded,
+            "accession_with_dashes": accession_with_dashes,
+            "accession_no_dashes": accession_no_dashes
+        }).to_json()
@@ -0,0 +1,120 @@
+"""
+Fast JSON encoding and decoding backed by orjson.
+
+Every tool returns its result as a JSON string and composite tools and
+flows parse those strings again, so (de)serialization sits on all call
+paths. This module is a drop-in for the parts of the stdlib json API
+used here: import it as ``json`` and keep calling dumps/loads.
+"""
+
+import threading
+from typing import Any, List, Optional, Sequence, Union
+
+import orjson
+
+try:
+    # Optional: lets loads_path/loads_keys skip materializing unrequested values
+    import simdjson
+except ImportError:
+    simdjson = None
+
+PARTIAL_PARSING = simdjson is not None
+
+
+# Subclass of json.JSONDecodeError, so existing except clauses keep working
+JSONDecodeError = orjson.JSONDecodeError
+
+_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def dumps(obj: Any) -> str:
+    """Serialize obj to a compact JSON string."""
+    return orjson.dumps(obj, option=_DUMPS_OPTIONS).decode()
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes, for writing straight to files."""
+    return orjson.dumps(obj, option=_DUMPS_OPTIONS)
+
+
+def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+    """Deserialize a JSON string or bytes to a Python object."""
+    return orjson.loads(data)
+
+
+# simdjson parsers reuse their buffers and are not thread-safe
+_simdjson_parsers = threading.local()
+
+
+def _simdjson_parser():
+    """Return this thread's simdjson parser."""
+    parser = getattr(_simdjson_parsers, "parser", None)
+    if parser is None:
+        parser = _simdjson_parsers.parser = simdjson.Parser()
+    return parser
+
+
+def _simdjson_parse(data: Union[str, bytes]) -> Any:
+    """Parse data with this thread's simdjson parser, raising JSONDecodeError like orjson."""
+    if isinstance(data, str):
+        data = data.encode()
+    try:
+        return _simdjson_parser().parse(data)
+    except ValueError as e:
+        raise JSONDecodeError(str(e), "", 0) from e
+
+
+def _materialize(value: Any) -> Any:
+    """Copy a simdjson proxy into plain Python objects."""
+    # Materialize now: the parser's next document invalidates these proxies
+    if isinstance(value, simdjson.Object):
+        return value.as_dict()
+    if isinstance(value, simdjson.Array):
+        return value.as_list()
+    return value
+
+
+def _find(doc: Any, object_type: type, paths: Sequence[Sequence[str]]) -> Any:
+    """Return the value at the first key path that exists in doc, or None."""
+    for path in paths:
+        value = doc
+        for key in path:
+            if not isinstance(value, object_type) or key not in value:
+                break
+            value = value[key]
+        else:
+            return value
+    return None
+
+
+def _parse_for_paths(data: Union[str, bytes]) -> tuple:
+    """Parse data for a path lookup; returns (document, its object type)."""
+    if simdjson is None:
+        return orjson.loads(data), dict
+    
+    return _simdjson_parse(data), simdjson.Object
+
+
+def loads_path(data: Union[str, bytes], *paths: Sequence[str]) -> Any:
+    """
+    Deserialize the value at the first key path that exists in a JSON document.
+    
+    Each path is a sequence of object keys, e.g. ("facts", "us-gaap"). With
+    pysimdjson installed only that sub-tree becomes Python objects; otherwise
+    the whole document is parsed with orjson. Returns None if no path exists.
+    """
+    doc, object_type = _parse_for_paths(data)
+    value = _find(doc, object_type, paths)
+    return value if simdjson is None else _materialize(value)
+
+
+def loads_keys(data: Union[str, bytes], *paths: Sequence[str]) -> Optional[List[str]]:
+    """
+    List the keys of the object at the first key path that exists.
+    
+    With pysimdjson installed none of the values are deserialized. Returns
+    None if no path leads to an object.
+    """
+    doc, object_type = _parse_for_paths(data)
+    value = _find(doc, object_type, paths)
+    return list(value.keys()) if isinstance(value, object_type) else None
@@ -4,19 +4,61 @@ Filing Document Index & Retrieval Tools.
 These tools help retrieve and parse filing documents from EDGAR archives.
 """
 
-import json
 import re
-from typing import Type, Optional, List, Dict, Any
-from pathlib import Path
+from typing import Type, Optional, List, Dict, Any, Tuple
 
 from pydantic import BaseModel, Field
 
 from crewai.tools import BaseTool
 
-from .sec_http_client import get_default_client
+from . import fast_json as json
+from .sec_http_client import file_size, get_default_client
 from .edgar_url_tools import BuildFilingIndexUrlTool, BuildCompleteSubmissionTxtUrlTool
 
 
+try:
+    # Optional: C HTML parser for filing index pages
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    HTMLParser = None
+
+
+# Patterns for parsing filing index HTML, compiled once for every call
+_BASE_URL_RE = re.compile(r'<base\s+href="([^"]+)"', re.IGNORECASE)
+_DOC_LINK_RE = re.compile(r'<a\s+href="([^"]+\.(?:txt|html|htm|xml|pdf))"[^>]*>([^<]+)</a>', re.IGNORECASE)
+_EX_NUMBER_RE = re.compile(r'\d+\.\d+')
+
+_DOC_SUFFIXES = ('.txt', '.html', '.htm', '.xml', '.pdf')
+
+# Primary document form types, checked in order against description and filename
+_FORM_KEYS = ("10-Q", "10-K", "8-K")
+
+
+def _extract_document_links(index_html: str) -> Tuple[str, List[Tuple[str, str]]]:
+    """
+    Find the <base href> and the (href, link text) of document links in index HTML.
+    
+    Uses selectolax when installed, which parses the page once in C and does
+    not depend on attribute order; otherwise falls back to regexes.
+    """
+    if HTMLParser is not None:
+        tree = HTMLParser(index_html)
+        base = tree.css_first('base')
+        base_url = (base.attributes.get('href') or "") if base is not None else ""
+        links = []
+        for anchor in tree.css('a[href]'):
+            href = anchor.attributes.get('href') or ""
+            text = anchor.text(separator=' ', strip=True)
+            if text and href.lower().endswith(_DOC_SUFFIXES):
+                links.append((href, text))
+        return base_url, links
+    
+    base_url_match = _BASE_URL_RE.search(index_html)
+    base_url = base_url_match.group(1) if base_url_match else ""
+    links = [(match.group(1), match.group(2).strip()) for match in _DOC_LINK_RE.finditer(index_html)]
+    return base_url, links
+
+
 class GetFilingIndexHtmlInput(BaseModel):
     """Input schema for get_filing_index_html tool."""
     cik: str = Field(..., description="10-digit zero-padded CIK number")
@@ -41,12 +83,14 @@ class GetFilingIndexHtmlTool(BaseTool):
     args_schema: Type[BaseModel] = GetFilingIndexHtmlInput
 
     def _run(self, cik: str, accession_with_dashes: str) -> str:
+        return json.dumps(self._run_native(cik, accession_with_dashes))
+
+    def _run_native(self, cik: str, accession_with_dashes: str) -> Dict[str, Any]:
+        """Build the result envelope as a dict, for callers inside this package."""
         client = get_default_client()
         
         # Build URL
-        url_tool = BuildFilingIndexUrlTool()
-        url_result = json.loads(url_tool._run(cik, accession_with_dashes))
-        url = url_result["data"]["url"]
+        url = BuildFilingIndexUrlTool.build(cik, accession_with_dashes)
         
         try:
             response = client.get(url)
@@ -61,13 +105,13 @@ class GetFilingIndexHtmlTool(BaseTool):
                 "warnings": []
             }
             
-            return json.dumps(result)
+            return result
         except Exception as e:
-            return json.dumps({
+            return {
                 "data": None,
                 "source_urls": [url],
                 "warnings": [f"Failed to fetch filing index HTML: {str(e)}"]
-            })
+            }
 
 
 class ParseFilingIndexDocumentsInput(BaseModel):
@@ -91,6 +135,10 @@ class ParseFilingIndexDocumentsTool(BaseTool):
     args_schema: Type[BaseModel] = ParseFilingIndexDocumentsInput
 
     def _run(self, index_html: str) -> str:
+        return json.dumps(self._run_native(index_html))
+
+    def _run_native(self, index_html: str) -> Dict[str, Any]:
+        """Build the result envelope as a dict, for callers inside this package."""
         try:
             documents = []
             
@@ -101,48 +149,41 @@ class ParseFilingIndexDocumentsTool(BaseTool):
             # Try to find document links and extract information
             # Common pattern: <a href="...">filename</a> with description
             
-            # Extract base URL from HTML if present
-            base_url_match = re.search(r'<base\s+href="([^"]+)"', index_html, re.IGNORECASE)
-            base_url = base_url_match.group(1) if base_url_match else ""
-            
-            # Find all document links - look for patterns like:
-            # <a href="filename">Description</a>
-            # or table rows with document information
-            
-            # Simple approach: find all links that look like document files
-            doc_link_pattern = r'<a\s+href="([^"]+\.(?:txt|html|htm|xml|pdf))"[^>]*>([^<]+)</a>'
-            matches = re.finditer(doc_link_pattern, index_html, re.IGNORECASE)
+            # Extract the base URL (if present) and all links that look like
+            # document files: <a href="filename">Description</a>
+            base_url, links = _extract_document_links(index_html)
+            base_prefix = base_url.rstrip("/") + "/" if base_url else ""
             
-            for match in matches:
-                url = match.group(1)
-                description = match.group(2).strip()
+            for url, description in links:
                 
                 # Determine document type from filename or description
-                filename = url.split("/")[-1] if "/" in url else url
+                filename = url.rpartition("/")[2]
                 doc_type = None
                 
                 # Try to extract document type from description or filename
-                if "10-Q" in description.upper() or "10-Q" in filename.upper():
-                    doc_type = "10-Q"
-                elif "10-K" in description.upper() or "10-K" in filename.upper():
-                    doc_type = "10-K"
-                elif "8-K" in description.upper() or "8-K" in filename.upper():
-                    doc_type = "8-K"
-                elif filename.startswith("EX-") or "EX-" in filename:
-                    # Extract exhibit number
-                    ex_match = re.search(r'EX-(\d+\.\d+)', filename, re.IGNORECASE)
-                    if ex_match:
-                        doc_type = f"EX-{ex_match.group(1)}"
-                elif filename.endswith(".xml"):
-                    doc_type = "XML"
-                elif filename.endswith(".txt"):
-                    doc_type = "TXT"
+                description_up = description.upper()
+                filename_up = filename.upper()
+                for form_key in _FORM_KEYS:
+                    if form_key in description_up or form_key in filename_up:
+                        doc_type = form_key
+                        break
+                else:
+                    ex_at = filename_up.find("EX-")
+                    if ex_at >= 0:
+                        # Extract exhibit number right after "EX-"
+                        ex_match = _EX_NUMBER_RE.match(filename_up, ex_at + 3)
+                        if ex_match:
+                            doc_type = f"EX-{ex_match.group()}"
+                    elif filename.endswith(".xml"):
+                        doc_type = "XML"
+                    elif filename.endswith(".txt"):
+                        doc_type = "TXT"
                 
                 # Build full URL if relative
                 if url.startswith("http"):
                     full_url = url
-                elif base_url:
-                    full_url = base_url.rstrip("/") + "/" + url.lstrip("/")
+                elif base_prefix:
+                    full_url = base_prefix + url.lstrip("/")
                 else:
                     full_url = url
                 
@@ -159,13 +200,13 @@ class ParseFilingIndexDocumentsTool(BaseTool):
                 "warnings": [] if documents else ["No documents found in index HTML"]
             }
             
-            return json.dumps(result)
+            return result
         except Exception as e:
-            return json.dumps({
+            return {
                 "data": [],
                 "source_urls": [],
                 "warnings": [f"Failed to parse filing index: {str(e)}"]
-            })
+            }
 
 
 class FindDocumentByTypeInput(BaseModel):
@@ -210,20 +251,19 @@ class FindDocumentByTypeTool(BaseTool):
                     "warnings": ["Documents must be a list"]
                 })
             
-            # Normalize preferred types to uppercase
-            preferred_upper = [pt.upper() for pt in preferred_types]
+            # Normalize preferred types to uppercase, dropping repeats but
+            # keeping preference order
+            preferred_upper = list(dict.fromkeys(pt.upper() for pt in preferred_types))
             
             matches = []
             for doc in docs:
-                doc_type = doc.get("type", "").upper()
-                filename = doc.get("filename", "").upper()
-                description = doc.get("description", "").upper()
+                # One upper-cased haystack per document; the NUL separators keep
+                # a type from matching across field boundaries
+                haystack = "\0".join((doc.get("type", ""), doc.get("filename", ""), doc.get("description", ""))).upper()
                 
-                # Check if document matches any preferred type
+                # Check if document matches any preferred type, in preference order
                 for pref_type in preferred_upper:
-                    if (pref_type in doc_type or 
-                        pref_type in filename or 
-                        pref_type in description):
+                    if pref_type in haystack:
                         matches.append({
                             "document": doc,
                             "matched_type": pref_type,
@@ -285,7 +325,7 @@ class DownloadFilingDocumentTool(BaseTool):
                 "data": {
                     "downloaded_path": downloaded_path,
                     "url": doc_url,
-                    "file_size": Path(downloaded_path).stat().st_size if Path(downloaded_path).exists() else None
+                    "file_size": file_size(downloaded_path)
                 },
                 "source_urls": [doc_url],
                 "warnings": []
@@ -328,9 +368,7 @@ class GetCompleteSubmissionTextTool(BaseTool):
         client = get_default_client()
         
         # Build URL
-        url_tool = BuildCompleteSubmissionTxtUrlTool()
-        url_result = json.loads(url_tool._run(cik, accession_with_dashes))
-        url = url_result["data"]["url"]
+        url = BuildCompleteSubmissionTxtUrlTool.build(cik, accession_with_dashes)
         
         try:
             response = client.get(url)
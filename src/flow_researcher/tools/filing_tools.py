@@ -5,16 +5,90 @@ These tools help discover and retrieve metadata about SEC filings
 including recent filings, latest filings by form type, date ranges, etc.
 """
 
-import json
-from typing import Type, Optional, List, Dict, Any
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Type, Optional, List, Dict, Any, Tuple
 from datetime import datetime, date
 
 from pydantic import BaseModel, Field
 
 from crewai.tools import BaseTool
 
-from .sec_http_client import get_default_client
-from .company_tools import TickerToCikTool
+from . import fast_json as json
+from .sec_http_client import MemoryCache, get_default_client
+from .company_tools import TickerToCikTool, _SUBMISSIONS_URL, _normalize_cik
+from .tool_instances import get_shared_tool
+
+
+# Parsed submissions JSON per CIK, shared by the filing tools so a flow that
+# lists, picks the latest and searches a date range fetches it once. Bounded
+# by the size of the JSON bodies, like the client's memory cache, since large
+# filers' submissions run to several MB each
+SUBMISSIONS_CACHE_TTL_SECONDS = 300
+SUBMISSIONS_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+_submissions_cache = MemoryCache(
+    maxsize=256, ttl_seconds=SUBMISSIONS_CACHE_TTL_SECONDS, max_bytes=SUBMISSIONS_CACHE_MAX_BYTES
+)
+
+
+def _get_submissions(cik_padded: str) -> Tuple[Dict[str, Any], Dict[str, List[int]]]:
+    """
+    Fetch and parse a company's submissions JSON, reusing recent results.
+    
+    Returns:
+        (submissions, form_index) where form_index maps each upper-cased
+        form type to its positions in the recent filings arrays, most recent first
+    """
+    entry = _submissions_cache.get(cik_padded)
+    if entry is None:
+        submissions = get_default_client().get_json(_SUBMISSIONS_URL(cik_padded))
+        form_index = defaultdict(list)
+        for i, form in enumerate(submissions.get('filings', {}).get('recent', {}).get('form', [])):
+            form_index[form.upper()].append(i)
+        entry = (submissions, dict(form_index))
+        # get_json does not expose the body; re-encoding it is cheap next to the fetch
+        _submissions_cache.set(cik_padded, entry, size=len(json.dumps_bytes(submissions)))
+    return entry
+
+
+def _filing_positions(filings: Dict[str, list], form_index: Dict[str, List[int]], forms: Optional[List[str]]) -> List[int]:
+    """Positions of the recent filings matching any of forms (all if None), in order."""
+    count = len(filings['accessionNumber'])
+    if not forms:
+        return list(range(count))
+    # Normalize and dedupe the requested forms once at the boundary
+    positions = set()
+    for form in frozenset(form.strip().upper() for form in forms):
+        positions.update(form_index.get(form, ()))
+    return sorted(i for i in positions if i < count)
+
+
+# Submissions recent-filings columns copied into each normalized filing
+_FILING_FIELDS = ('form', 'filingDate', 'reportDate', 'acceptanceDateTime', 'accessionNumber', 'primaryDocument')
+
+
+def _filing_rows(filings: Dict[str, list], positions: List[int]) -> List[Dict[str, Any]]:
+    """Normalize the recent filings at the given positions."""
+    count = len(filings['accessionNumber'])
+    columns = []
+    for name in _FILING_FIELDS:
+        values = filings.get(name) or []
+        # Pad short columns once so rows can index every column directly
+        columns.append(values if len(values) >= count else list(values) + [None] * (count - len(values)))
+    
+    forms, filing_dates, report_dates, acceptance_times, accessions, primary_docs = columns
+    return [
+        {
+            "form": forms[i],
+            "filingDate": filing_dates[i],
+            "reportDate": report_dates[i],
+            "acceptanceDateTime": acceptance_times[i],
+            "accessionNumber": accessions[i],
+            "primaryDocument": primary_docs[i]
+        }
+        for i in positions
+    ]
 
 
 class ListRecentFilingsInput(BaseModel):
@@ -22,7 +96,7 @@ class ListRecentFilingsInput(BaseModel):
     cik: str = Field(..., description="10-digit zero-padded CIK number (e.g., '0000320193')")
     forms: Optional[List[str]] = Field(
         default=None,
-        description="Optional list of form types to filter (e.g., ['10-Q', '10-K', '8-K'])"
+        description="Optional list of form types to filter (e.g., ['10-Q', '10-K', '8-K']); matched case-insensitively"
     )
     limit: int = Field(
         default=100,
@@ -50,53 +124,30 @@ class ListRecentFilingsTool(BaseTool):
     args_schema: Type[BaseModel] = ListRecentFilingsInput
 
     def _run(self, cik: str, forms: Optional[List[str]] = None, limit: int = 100) -> str:
-        cik_padded = cik.strip().zfill(10)
-        client = get_default_client()
-        url = f"https://data.sec.gov/submissions/CIK{cik_padded}.json"
+        return json.dumps(self._run_native(cik, forms, limit))
+
+    def _run_native(self, cik: str, forms: Optional[List[str]] = None, limit: int = 100) -> Dict[str, Any]:
+        """Build the result envelope as a dict, for callers inside this package."""
+        cik_padded = _normalize_cik(cik)
+        url = _SUBMISSIONS_URL(cik_padded)
         
         try:
-            response = client.get(url)
-            submissions = response.json()
+            submissions, form_index = _get_submissions(cik_padded)
             
             # Get filings array
             filings = submissions.get('filings', {}).get('recent', {})
             
             if not filings or 'accessionNumber' not in filings:
-                return json.dumps({
+                return {
                     "data": [],
                     "source_urls": [url],
                     "warnings": ["No filings found in submissions data"]
-                })
-            
-            # Normalize filings
-            normalized = []
-            accession_numbers = filings.get('accessionNumber', [])
-            form_types = filings.get('form', [])
-            filing_dates = filings.get('filingDate', [])
-            report_dates = filings.get('reportDate', [])
-            acceptance_dates = filings.get('acceptanceDateTime', [])
-            primary_docs = filings.get('primaryDocument', [])
-            
-            for i in range(len(accession_numbers)):
-                form = form_types[i] if i < len(form_types) else None
-                
-                # Filter by forms if specified
-                if forms and form not in forms:
-                    continue
-                
-                filing_meta = {
-                    "form": form,
-                    "filingDate": filing_dates[i] if i < len(filing_dates) else None,
-                    "reportDate": report_dates[i] if i < len(report_dates) else None,
-                    "acceptanceDateTime": acceptance_dates[i] if i < len(acceptance_dates) else None,
-                    "accessionNumber": accession_numbers[i],
-                    "primaryDocument": primary_docs[i] if i < len(primary_docs) else None
                 }
-                
-                normalized.append(filing_meta)
-                
-                if len(normalized) >= limit:
-                    break
+            
+            # Select matching rows from the cached form index, then normalize
+            # only the ones returned
+            positions = _filing_positions(filings, form_index, forms)[:limit]
+            normalized = _filing_rows(filings, positions)
             
             result = {
                 "data": normalized,
@@ -104,13 +155,13 @@ class ListRecentFilingsTool(BaseTool):
                 "warnings": []
             }
             
-            return json.dumps(result)
+            return result
         except Exception as e:
-            return json.dumps({
+            return {
                 "data": [],
                 "source_urls": [url],
                 "warnings": [f"Failed to list filings: {str(e)}"]
-            })
+            }
 
 
 class GetLatestFilingInput(BaseModel):
@@ -136,51 +187,37 @@ class GetLatestFilingTool(BaseTool):
     args_schema: Type[BaseModel] = GetLatestFilingInput
 
     def _run(self, cik: str, form: str) -> str:
-        cik_padded = cik.strip().zfill(10)
+        return json.dumps(self._run_native(cik, form))
+
+    def _run_native(self, cik: str, form: str) -> Dict[str, Any]:
+        """Build the result envelope as a dict, for callers inside this package."""
+        cik_padded = _normalize_cik(cik)
         form_upper = form.upper().strip()
-        client = get_default_client()
-        url = f"https://data.sec.gov/submissions/CIK{cik_padded}.json"
+        url = _SUBMISSIONS_URL(cik_padded)
         
         try:
-            response = client.get(url)
-            submissions = response.json()
+            submissions, form_index = _get_submissions(cik_padded)
             
             filings = submissions.get('filings', {}).get('recent', {})
             
             if not filings or 'accessionNumber' not in filings:
-                return json.dumps({
+                return {
                     "data": None,
                     "source_urls": [url],
                     "warnings": ["No filings found in submissions data"]
-                })
+                }
             
-            # Find latest matching form
-            accession_numbers = filings.get('accessionNumber', [])
-            form_types = filings.get('form', [])
+            # The recent arrays are ordered newest first, so the latest filing
+            # is the first dated row of that form
             filing_dates = filings.get('filingDate', [])
-            report_dates = filings.get('reportDate', [])
-            acceptance_dates = filings.get('acceptanceDateTime', [])
-            primary_docs = filings.get('primaryDocument', [])
             
-            latest_filing = None
-            latest_date = None
+            latest_position = next(
+                (i for i in _filing_positions(filings, form_index, [form_upper])
+                 if i < len(filing_dates) and filing_dates[i]),
+                None
+            )
             
-            for i in range(len(accession_numbers)):
-                if i < len(form_types) and form_types[i] == form_upper:
-                    filing_date = filing_dates[i] if i < len(filing_dates) else None
-                    
-                    if filing_date:
-                        # Compare dates to find latest
-                        if latest_date is None or filing_date > latest_date:
-                            latest_date = filing_date
-                            latest_filing = {
-                                "form": form_upper,
-                                "filingDate": filing_date,
-                                "reportDate": report_dates[i] if i < len(report_dates) else None,
-                                "acceptanceDateTime": acceptance_dates[i] if i < len(acceptance_dates) else None,
-                                "accessionNumber": accession_numbers[i],
-                                "primaryDocument": primary_docs[i] if i < len(primary_docs) else None
-                            }
+            latest_filing = _filing_rows(filings, [latest_position])[0] if latest_position is not None else None
             
             if latest_filing:
                 result = {
@@ -195,13 +232,60 @@ class GetLatestFilingTool(BaseTool):
                     "warnings": [f"No {form_upper} filings found for this company"]
                 }
             
-            return json.dumps(result)
+            return result
         except Exception as e:
-            return json.dumps({
+            return {
                 "data": None,
                 "source_urls": [url],
                 "warnings": [f"Failed to get latest filing: {str(e)}"]
-            })
+            }
+
+
+# Concurrent submissions fetches for batch lookups; the shared client's rate
+# limiter still caps the request rate
+MAX_SUBMISSIONS_FETCH_WORKERS = 8
+
+
+class GetLatestFilingBatchInput(BaseModel):
+    """Input schema for get_latest_filing_batch tool."""
+    ciks: List[str] = Field(..., description="10-digit zero-padded CIK numbers (e.g., ['0000320193', '0000789019'])")
+    form: str = Field(..., description="Form type (e.g., '10-Q', '10-K', '8-K')")
+
+
+class GetLatestFilingBatchTool(BaseTool):
+    """
+    Get the most recent filing of a form type for several companies.
+    
+    Runs GetLatestFilingTool for each CIK concurrently, so a basket of
+    companies costs roughly one round trip instead of one per company.
+    """
+    name: str = "get_latest_filing_batch"
+    description: str = """
+    Gets the most recent filing of a specific form type for a list of companies
+    (by CIK) in one call. Returns a mapping of CIK to its latest filing, or null
+    when the company has no such filing; problems are reported in warnings.
+    """
+    args_schema: Type[BaseModel] = GetLatestFilingBatchInput
+
+    def _run(self, ciks: List[str], form: str) -> str:
+        latest_tool = get_shared_tool(GetLatestFilingTool)
+        ciks_padded = list(dict.fromkeys(_normalize_cik(cik) for cik in ciks))
+        
+        max_workers = max(1, min(len(ciks_padded), MAX_SUBMISSIONS_FETCH_WORKERS))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            outcomes = list(executor.map(lambda cik: latest_tool._run_native(cik, form), ciks_padded))
+        
+        result = {
+            "data": {cik: outcome["data"] for cik, outcome in zip(ciks_padded, outcomes)},
+            "source_urls": [url for outcome in outcomes for url in outcome["source_urls"]],
+            "warnings": [
+                f"CIK {cik}: {warning}"
+                for cik, outcome in zip(ciks_padded, outcomes)
+                for warning in outcome["warnings"]
+            ]
+        }
+        
+        return json.dumps(result)
 
 
 class GetFilingsByDateRangeInput(BaseModel):
@@ -211,7 +295,7 @@ class GetFilingsByDateRangeInput(BaseModel):
     end_date: str = Field(..., description="End date in YYYY-MM-DD format")
     forms: Optional[List[str]] = Field(
         default=None,
-        description="Optional list of form types to filter (e.g., ['10-Q', '10-K'])"
+        description="Optional list of form types to filter (e.g., ['10-Q', '10-K']); matched case-insensitively"
     )
 
 
@@ -232,9 +316,8 @@ class GetFilingsByDateRangeTool(BaseTool):
     args_schema: Type[BaseModel] = GetFilingsByDateRangeInput
 
     def _run(self, cik: str, start_date: str, end_date: str, forms: Optional[List[str]] = None) -> str:
-        cik_padded = cik.strip().zfill(10)
-        client = get_default_client()
-        url = f"https://data.sec.gov/submissions/CIK{cik_padded}.json"
+        cik_padded = _normalize_cik(cik)
+        url = _SUBMISSIONS_URL(cik_padded)
         
         try:
             # Parse dates
@@ -248,8 +331,7 @@ class GetFilingsByDateRangeTool(BaseTool):
                     "warnings": ["Start date must be before or equal to end date"]
                 })
             
-            response = client.get(url)
-            submissions = response.json()
+            submissions, form_index = _get_submissions(cik_padded)
             
             filings = submissions.get('filings', {}).get('recent', {})
             
@@ -260,40 +342,19 @@ class GetFilingsByDateRangeTool(BaseTool):
                     "warnings": ["No filings found in submissions data"]
                 })
             
-            # Filter filings by date range
-            normalized = []
-            accession_numbers = filings.get('accessionNumber', [])
-            form_types = filings.get('form', [])
+            # Filter filings by date range. filingDate is always YYYY-MM-DD, so
+            # ISO strings compare like dates without parsing every row. Rows are
+            # ordered by acceptance time, not strictly by filingDate, so every
+            # row is checked rather than stopping at the first one before start
             filing_dates = filings.get('filingDate', [])
-            report_dates = filings.get('reportDate', [])
-            acceptance_dates = filings.get('acceptanceDateTime', [])
-            primary_docs = filings.get('primaryDocument', [])
+            start_iso, end_iso = start.isoformat(), end.isoformat()
+            
+            in_range = [
+                i for i in _filing_positions(filings, form_index, forms)
+                if i < len(filing_dates) and filing_dates[i] and start_iso <= filing_dates[i] <= end_iso
+            ]
             
-            for i in range(len(accession_numbers)):
-                form = form_types[i] if i < len(form_types) else None
-                filing_date_str = filing_dates[i] if i < len(filing_dates) else None
-                
-                # Filter by forms if specified
-                if forms and form not in forms:
-                    continue
-                
-                # Filter by date range
-                if filing_date_str:
-                    try:
-                        filing_date = datetime.strptime(filing_date_str, "%Y-%m-%d").date()
-                        if start <= filing_date <= end:
-                            filing_meta = {
-                                "form": form,
-                                "filingDate": filing_date_str,
-                                "reportDate": report_dates[i] if i < len(report_dates) else None,
-                                "acceptanceDateTime": acceptance_dates[i] if i < len(acceptance_dates) else None,
-                                "accessionNumber": accession_numbers[i],
-                                "primaryDocument": primary_docs[i] if i < len(primary_docs) else None
-                            }
-                            normalized.append(filing_meta)
-                    except ValueError:
-                        # Skip if date parsing fails
-                        continue
+            normalized = _filing_rows(filings, in_range)
             
             result = {
                 "data": normalized,
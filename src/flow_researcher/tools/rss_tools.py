@@ -4,8 +4,9 @@ RSS / "Latest Filings" Monitoring Tools.
 These tools work with SEC RSS feeds for monitoring latest filings.
 """
 
-import json
+import io
 import re
+import xml.etree.ElementTree as ET
 from typing import Type, Optional, List, Dict, Any
 from datetime import datetime
 
@@ -13,9 +14,155 @@ from pydantic import BaseModel, Field
 
 from crewai.tools import BaseTool
 
+from . import fast_json as json
+from .company_tools import _normalize_cik
 from .sec_http_client import get_default_client
 
 
+# Patterns for parsing Atom and RSS feeds, compiled once for every call
+_ENTRY_RE = re.compile(r'<entry[^>]*>(.*?)</entry>', re.DOTALL)
+_TITLE_RE = re.compile(r'<title[^>]*>(.*?)</title>', re.DOTALL)
+_LINK_HREF_RE = re.compile(r'<link[^>]*href="([^"]+)"')
+_PUBLISHED_RE = re.compile(r'<published[^>]*>(.*?)</published>')
+_SUMMARY_RE = re.compile(r'<summary[^>]*>(.*?)</summary>', re.DOTALL)
+
+_ITEM_RE = re.compile(r'<item[^>]*>(.*?)</item>', re.DOTALL)
+_RSS_LINK_RE = re.compile(r'<link[^>]*>(.*?)</link>')
+_PUBDATE_RE = re.compile(r'<pubDate[^>]*>(.*?)</pubDate>')
+_DESCRIPTION_RE = re.compile(r'<description[^>]*>(.*?)</description>', re.DOTALL)
+
+# Archives folder link: /Archives/edgar/data/{CIK}/{ACCESSION}/
+_ACCESSION_LINK_RE = re.compile(r'/Archives/edgar/data/(\d+)/([^/]+)/')
+
+# How much of a feed to look at when telling Atom from RSS
+_SNIFF_CHARS = 512
+
+# Form types recognized in feed items, checked in order against title and description
+_RSS_FORM_TYPES = ("10-Q", "10-K", "8-K", "20-F", "6-K", "DEF 14A", "S-1")
+
+
+def _local_name(tag: str) -> str:
+    """Strip the {namespace} prefix ElementTree puts on tag names."""
+    return tag.rpartition('}')[2]
+
+
+def _parse_feed_xml(content: bytes) -> List[Dict[str, str]]:
+    """
+    Parse Atom entries or RSS items with the C XML parser.
+    
+    Each entry is cleared once read, so the parsed tree stays small.
+    Raises ET.ParseError if the feed is not well-formed XML.
+    """
+    items = []
+    for _, elem in ET.iterparse(io.BytesIO(content)):
+        kind = _local_name(elem.tag)
+        if kind not in ('entry', 'item'):
+            continue
+        
+        fields = {}
+        for child in elem:
+            name = _local_name(child.tag)
+            if name == 'link':
+                # Atom links carry the URL in href, RSS links as text
+                link = child.get('href') or (child.text or "").strip()
+                if link:
+                    fields.setdefault('link', link)
+            elif name not in fields:
+                fields[name] = "".join(child.itertext()).strip()
+        
+        if kind == 'entry':
+            items.append({
+                "title": fields.get('title', ""),
+                "link": fields.get('link', ""),
+                "pubDate": fields.get('published', ""),
+                "description": fields.get('summary', "")
+            })
+        else:
+            items.append({
+                "title": fields.get('title', ""),
+                "link": fields.get('link', ""),
+                "pubDate": fields.get('pubDate', ""),
+                "description": fields.get('description', "")
+            })
+        elem.clear()
+    
+    return items
+
+
+def _parse_feed_regex(content: str) -> List[Dict[str, str]]:
+    """Scan feed text for Atom entries or RSS items with regexes (tolerates malformed XML)."""
+    items = []
+    # The root element sits in the prologue, so only the head needs checking
+    head = content[:_SNIFF_CHARS]
+    
+    # Try Atom format first (SEC uses Atom)
+    if '<feed' in head:
+        # Atom format
+        entries = _ENTRY_RE.finditer(content)
+        
+        for entry in entries:
+            entry_text = entry.group(1)
+            
+            # Extract title
+            title_match = _TITLE_RE.search(entry_text)
+            title = title_match.group(1).strip() if title_match else ""
+            
+            # Extract link
+            link_match = _LINK_HREF_RE.search(entry_text)
+            link = link_match.group(1) if link_match else ""
+            
+            # Extract published date
+            pub_match = _PUBLISHED_RE.search(entry_text)
+            pub_date = pub_match.group(1).strip() if pub_match else ""
+            
+            # Extract summary/description
+            summary_match = _SUMMARY_RE.search(entry_text)
+            description = summary_match.group(1).strip() if summary_match else ""
+            
+            items.append({
+                "title": title,
+                "link": link,
+                "pubDate": pub_date,
+                "description": description
+            })
+    
+    # Try RSS format
+    elif '<rss' in head or '<rdf:RDF' in head:
+        rss_items = _ITEM_RE.finditer(content)
+        
+        for item in rss_items:
+            item_text = item.group(1)
+            
+            title_match = _TITLE_RE.search(item_text)
+            title = title_match.group(1).strip() if title_match else ""
+            
+            link_match = _RSS_LINK_RE.search(item_text)
+            link = link_match.group(1).strip() if link_match else ""
+            
+            pub_match = _PUBDATE_RE.search(item_text)
+            pub_date = pub_match.group(1).strip() if pub_match else ""
+            
+            desc_match = _DESCRIPTION_RE.search(item_text)
+            description = desc_match.group(1).strip() if desc_match else ""
+            
+            items.append({
+                "title": title,
+                "link": link,
+                "pubDate": pub_date,
+                "description": description
+            })
+    
+    return items
+
+
+def _parse_feed_response(response) -> List[Dict[str, str]]:
+    """Parse a fetched feed, falling back to the regex scan if it is not well-formed XML."""
+    try:
+        return _parse_feed_xml(response.content)
+    except ET.ParseError:
+        return _parse_feed_regex(response.text)
+
+
 class GetCompanyEdgarRssFeedUrlInput(BaseModel):
     """Input schema for get_company_edgar_rss_feed_url tool."""
     cik: str = Field(..., description="10-digit zero-padded CIK number")
@@ -37,9 +184,9 @@ class GetCompanyEdgarRssFeedUrlTool(BaseTool):
     args_schema: Type[BaseModel] = GetCompanyEdgarRssFeedUrlInput
 
     def _run(self, cik: str) -> str:
-        cik_padded = cik.strip().zfill(10)
+        cik_padded = _normalize_cik(cik)
         # Remove leading zeros for RSS feed URL
-        cik_numeric = str(int(cik_padded))
+        cik_numeric = cik_padded.lstrip('0') or '0'
         
         url = f"https://www.sec.gov/cgi-bin/browse-edgar?action=getcompany&CIK={cik_numeric}&type=&dateb=&owner=exclude&count=40&output=atom"
         
@@ -77,75 +224,16 @@ class FetchRssTool(BaseTool):
     args_schema: Type[BaseModel] = FetchRssInput
 
     def _run(self, url: str) -> str:
+        return json.dumps(self._run_native(url))
+
+    def _run_native(self, url: str) -> Dict[str, Any]:
+        """Build the result envelope as a dict, for callers inside this package."""
         client = get_default_client()
         
         try:
-            response = client.get(url)
-            content = response.text
-            
-            # Parse RSS/Atom feed (simple parsing)
-            items = []
-            
-            # Try Atom format first (SEC uses Atom)
-            if '<?xml' in content and 'feed' in content:
-                # Atom format
-                entry_pattern = r'<entry[^>]*>(.*?)</entry>'
-                entries = re.finditer(entry_pattern, content, re.DOTALL)
-                
-                for entry in entries:
-                    entry_text = entry.group(1)
-                    
-                    # Extract title
-                    title_match = re.search(r'<title[^>]*>(.*?)</title>', entry_text, re.DOTALL)
-                    title = title_match.group(1).strip() if title_match else ""
-                    
-                    # Extract link
-                    link_match = re.search(r'<link[^>]*href="([^"]+)"', entry_text)
-                    link = link_match.group(1) if link_match else ""
-                    
-                    # Extract published date
-                    pub_match = re.search(r'<published[^>]*>(.*?)</published>', entry_text)
-                    pub_date = pub_match.group(1).strip() if pub_match else ""
-                    
-                    # Extract summary/description
-                    summary_match = re.search(r'<summary[^>]*>(.*?)</summary>', entry_text, re.DOTALL)
-                    description = summary_match.group(1).strip() if summary_match else ""
-                    
-                    items.append({
-                        "title": title,
-                        "link": link,
-                        "pubDate": pub_date,
-                        "description": description
-                    })
-            
-            # Try RSS format
-            elif '<rss' in content or '<rdf:RDF' in content:
-                item_pattern = r'<item[^>]*>(.*?)</item>'
-                rss_items = re.finditer(item_pattern, content, re.DOTALL)
-                
-                for item in rss_items:
-                    item_text = item.group(1)
-                    
-                    title_match = re.search(r'<title[^>]*>(.*?)</title>', item_text, re.DOTALL)
-                    title = title_match.group(1).strip() if title_match else ""
-                    
-                    link_match = re.search(r'<link[^>]*>(.*?)</link>', item_text)
-                    link = link_match.group(1).strip() if link_match else ""
-                    
-                    pub_match = re.search(r'<pubDate[^>]*>(.*?)</pubDate>', item_text)
-                    pub_date = pub_match.group(1).strip() if pub_match else ""
-                    
-                    desc_match = re.search(r'<description[^>]*>(.*?)</description>', item_text, re.DOTALL)
-                    description = desc_match.group(1).strip() if desc_match else ""
-                    
-                    items.append({
-                        "title": title,
-                        "link": link,
-                        "pubDate": pub_date,
-                        "description": description
-                    })
+            items = _parse_feed_response(client.get(url))
             
-            result = {
+            return {
                 "data": {
                     "items": items,
                     "count": len(items)
@@ -153,13 +241,67 @@ class FetchRssTool(BaseTool):
                 "source_urls": [url],
                 "warnings": [] if items else ["No items found in RSS feed or unsupported format"]
             }
-            
-            return json.dumps(result)
         except Exception as e:
-            return json.dumps({
+            return {
                 "data": {"items": [], "count": 0},
                 "source_urls": [url],
                 "warnings": [f"Failed to fetch or parse RSS feed: {str(e)}"]
+            }
+
+
+class FetchRssBatchInput(BaseModel):
+    """Input schema for fetch_rss_batch tool."""
+    urls: List[str] = Field(..., description="RSS feed URLs")
+
+
+class FetchRssBatchTool(BaseTool):
+    """
+    Fetch and parse several RSS feeds.
+    
+    Fetches the feeds concurrently through the shared rate-limited client
+    and parses each one like FetchRssTool.
+    """
+    name: str = "fetch_rss_batch"
+    description: str = """
+    Fetches and parses several RSS/Atom feeds (e.g., one per company) in one
+    call. Returns the parsed items per feed URL, each with title, link,
+    publication date (pubDate), and description. Feeds that fail are reported
+    in warnings.
+    """
+    args_schema: Type[BaseModel] = FetchRssBatchInput
+
+    def _run(self, urls: List[str]) -> str:
+        try:
+            urls = list(dict.fromkeys(urls))
+            responses = get_default_client().get_many(urls)
+            
+            feeds = {}
+            warnings = []
+            for url, response in zip(urls, responses):
+                if isinstance(response, Exception):
+                    feeds[url] = []
+                    warnings.append(f"Failed to fetch RSS feed {url}: {str(response)}")
+                    continue
+                
+                feeds[url] = _parse_feed_response(response)
+                if not feeds[url]:
+                    warnings.append(f"No items found in RSS feed {url} or unsupported format")
+            
+            result = {
+                "data": {
+                    "feeds": feeds,
+                    "count": sum(len(items) for items in feeds.values())
+                },
+                "source_urls": urls,
+                "warnings": warnings
+            }
+            
+            return json.dumps(result)
+        except Exception as e:
+            return json.dumps({
+                "data": {"feeds": {}, "count": 0},
+                "source_urls": list(urls),
+                "warnings": [f"Failed to fetch RSS feeds: {str(e)}"]
             })
 
 
@@ -211,7 +353,7 @@ class RssItemsToFilingsTool(BaseTool):
                 
                 # Try to extract accession number from link
                 # Pattern: /Archives/edgar/data/{CIK}/{ACCESSION}/
-                accn_match = re.search(r'/Archives/edgar/data/(\d+)/([^/]+)/', link)
+                accn_match = _ACCESSION_LINK_RE.search(link)
                 cik = None
                 accession = None
                 
@@ -221,7 +363,7 @@ class RssItemsToFilingsTool(BaseTool):
                 
                 # Try to extract form type from title or description
                 form = None
-                for form_type in ["10-Q", "10-K", "8-K", "20-F", "6-K", "DEF 14A", "S-1"]:
+                for form_type in _RSS_FORM_TYPES:
                     if form_type in title or form_type in description:
                         form = form_type
                         break
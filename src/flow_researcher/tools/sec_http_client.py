@@ -3,23 +3,69 @@ SEC HTTP Client with rate limiting, caching, and fair access compliance.
 
 This module provides a shared HTTP client for all SEC tools that:
 - Enforces <= 10 requests/second rate limit
-- Implements caching for JSON responses and downloads
+- Implements caching for JSON responses and downloads, and conditional
+  revalidation of other bodies (RSS feeds, index pages)
 - Sends proper User-Agent headers
 - Handles retries and errors gracefully
+- Reuses keep-alive connections through one process-wide client
+  (get_default_client), shared by all tools and threads
 """
 
 import json
 import time
 from pathlib import Path
-from typing import Dict, Optional, Any
-from collections import deque
+from typing import Dict, Hashable, List, Optional, Any, Tuple, Union
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import hashlib
 import os
+import threading
 
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
 from urllib3.util.retry import Retry
 
+from . import fast_json
+
+try:
+    # POSIX only: lets processes share one rate limit through a lock file
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+# Files smaller than this are not worth splitting into range requests
+MIN_RANGED_DOWNLOAD_BYTES = 16 * 1024 * 1024
+
+# Bytes written per read while streaming a download to disk
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Largest non-JSON body (RSS feeds, index pages) kept on disk for revalidation
+MAX_REVALIDATED_BODY_BYTES = 2 * 1024 * 1024
+
+# Marks a response body that _get did not parse as JSON
+_NOT_PARSED = object()
+
+# Keep-alive connections kept per host, sized for threaded batch runs
+CONNECTION_POOL_SIZE = 32
+
+# Parsed JSON bodies kept in memory in front of the disk cache, bounded by the
+# size of their JSON bodies: parsed objects take several times that, so company
+# facts documents (tens of MB) are never kept and the total stays modest
+MEMORY_CACHE_SIZE = 64
+MEMORY_CACHE_MAX_BYTES = 16 * 1024 * 1024
+MAX_MEMORY_CACHED_BODY_BYTES = 2 * 1024 * 1024
+
+# Concurrent HEAD probes; the rate limiter caps the request rate regardless
+MAX_PROBE_WORKERS = 10
+
+# Concurrent GETs in get_many; overlaps round trips up to the rate limit
+MAX_FETCH_WORKERS = 10
+
+# Hosts the SEC tools talk to, used to pre-open connections
+SEC_HOST_URLS = ("https://www.sec.gov/", "https://data.sec.gov/")
+
 
 class RateLimiter:
     """Simple rate limiter that enforces max requests per second."""
@@ -27,28 +73,58 @@ class RateLimiter:
     def __init__(self, max_requests_per_second: float = 10.0):
         self.max_rps = max_requests_per_second
         self.min_interval = 1.0 / max_requests_per_second
-        self.request_times: deque = deque()
+        # Monotonic time at which the next request may start
+        self._next_allowed = 0.0
+        # Tools may be called from several threads sharing one client
+        self._lock = threading.Lock()
     
     def wait_if_needed(self):
         """Wait if necessary to maintain rate limit."""
-        now = time.time()
+        # Reserve the next slot under the lock, then sleep outside it so
+        # other threads can reserve the slots after this one meanwhile
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_allowed, now)
+            self._next_allowed = slot + self.min_interval
         
-        # Remove timestamps older than 1 second
-        while self.request_times and now - self.request_times[0] > 1.0:
-            self.request_times.popleft()
-        
-        # If we're at the limit, wait
-        if len(self.request_times) >= self.max_rps:
-            sleep_time = 1.0 - (now - self.request_times[0])
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-                now = time.time()
-                # Clean up again after sleep
-                while self.request_times and now - self.request_times[0] > 1.0:
-                    self.request_times.popleft()
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class FileRateLimiter(RateLimiter):
+    """
+    Rate limiter shared by every process that uses the same state file.
+    
+    SEC's limit applies per client, not per process, so parallel workers
+    (e.g. pytest-xdist or multiprocessing) must draw from one budget. The
+    next free slot is kept in a small file guarded by an exclusive flock.
+    """
+    
+    def __init__(self, path: Union[str, Path], max_requests_per_second: float = 10.0):
+        super().__init__(max_requests_per_second)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+    
+    def wait_if_needed(self):
+        """Wait if necessary to maintain the rate limit across processes."""
+        # Threads of this process queue on the cheap thread lock rather than
+        # the file; wall-clock time is used because monotonic clocks are not
+        # comparable between processes
+        with self._lock, open(self.path, "a+b") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            f.seek(0)
+            try:
+                next_allowed = float(f.read() or 0.0)
+            except ValueError:
+                next_allowed = 0.0
+            now = time.time()
+            slot = max(next_allowed, now)
+            f.seek(0)
+            f.truncate()
+            f.write(repr(slot + self.min_interval).encode())
         
-        # Record this request
-        self.request_times.append(now)
+        if slot > now:
+            time.sleep(slot - now)
 
 
 class SimpleCache:
@@ -63,45 +139,132 @@ class SimpleCache:
     def _get_cache_path(self, key: str) -> Path:
         """Get file path for a cache key."""
         # Use hash to avoid filesystem issues with special characters
-        key_hash = hashlib.md5(key.encode()).hexdigest()
+        key_hash = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
         return self.cache_dir / f"{key_hash}.json"
     
     def get(self, key: str) -> Optional[Any]:
         """Get cached value if not expired."""
+        cached = self.get_entry(key)
+        if cached is None:
+            return None
+        
+        # Check if expired
+        if time.time() > cached.get('expires_at', 0):
+            # Entries with HTTP validators are kept so they can be revalidated
+            if not cached.get('etag') and not cached.get('last_modified'):
+                self._get_cache_path(key).unlink(missing_ok=True)  # Delete expired cache
+            return None
+        
+        return cached.get('value')
+    
+    def get_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the raw cache entry (value, expiry and validators), even if expired."""
         cache_path = self._get_cache_path(key)
         if not cache_path.exists():
             return None
         
         try:
-            with open(cache_path, 'r') as f:
-                cached = json.load(f)
-            
-            # Check if expired
-            if time.time() > cached.get('expires_at', 0):
-                cache_path.unlink()  # Delete expired cache
-                return None
-            
-            return cached.get('value')
-        except (json.JSONDecodeError, IOError):
+            return fast_json.loads(cache_path.read_bytes())
+        except (fast_json.JSONDecodeError, IOError):
             # Corrupted cache file, delete it
-            cache_path.unlink()
+            cache_path.unlink(missing_ok=True)
             return None
     
-    def set(self, key: str, value: Any, ttl_seconds: int = 3600):
-        """Cache a value with TTL."""
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: int = 3600,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        body: Optional[str] = None,
+        encoding: Optional[str] = None,
+        size: Optional[int] = None
+    ):
+        """
+        Cache a value with TTL and the HTTP validators it was served with.
+        
+        Non-JSON responses are stored as body (the raw bytes decoded as
+        latin-1, which round-trips exactly) plus the response encoding. size
+        records the length of a JSON value's response body.
+        """
         cache_path = self._get_cache_path(key)
         try:
             cached = {
                 'value': value,
-                'expires_at': time.time() + ttl_seconds
+                'expires_at': time.time() + ttl_seconds,
+                'etag': etag,
+                'last_modified': last_modified,
+                'body': body,
+                'encoding': encoding,
+                'size': size
             }
-            with open(cache_path, 'w') as f:
-                json.dump(cached, f)
+            # Write beside the entry and rename over it, so concurrent readers
+            # never see a half-written file
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(fast_json.dumps_bytes(cached))
+            os.replace(tmp_path, cache_path)
         except IOError:
             # If we can't write cache, just continue without caching
             pass
 
 
+class MemoryCache:
+    """
+    Thread-safe in-process LRU cache with TTL support.
+    
+    With max_bytes set, entries also count the size passed to set() and the
+    least recently used ones are evicted once the total exceeds it.
+    """
+    
+    def __init__(self, maxsize: int = 1024, ttl_seconds: int = 3600, max_bytes: Optional[int] = None):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get cached value if not expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            
+            expires_at, value, size = entry
+            if time.monotonic() > expires_at:
+                del self._entries[key]
+                self._total_bytes -= size
+                return None
+            
+            self._entries.move_to_end(key)
+            return value
+    
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None, size: int = 0):
+        """Cache a value with TTL, evicting the least recently used entries."""
+        if ttl_seconds is None:
+            ttl_seconds = self.ttl_seconds
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._total_bytes -= old[2]
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+            self._entries[key] = (time.monotonic() + ttl_seconds, value, size)
+            self._total_bytes += size
+            while len(self._entries) > self.maxsize or (
+                self.max_bytes is not None and self._total_bytes > self.max_bytes
+            ):
+                self._total_bytes -= self._entries.popitem(last=False)[1][2]
+    
+    def clear(self):
+        """Drop all cached values."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+
 class SECHttpClient:
     """
     HTTP client for SEC APIs with rate limiting, caching, and fair access compliance.
@@ -117,18 +280,28 @@ class SECHttpClient:
         max_requests_per_second: float = 10.0,
         timeout: int = 30,
         cache_ttl_seconds: int = 3600,
-        enable_cache: bool = True
+        enable_cache: bool = True,
+        rate_limit_file: Optional[str] = None
     ):
         self.user_agent = user_agent
         self.timeout = timeout
         self.cache_ttl = cache_ttl_seconds
         self.enable_cache = enable_cache
         
-        # Setup rate limiter
-        self.rate_limiter = RateLimiter(max_requests_per_second)
+        # Setup rate limiter; with a state file the budget is shared across
+        # processes (where flock is unavailable it stays per process)
+        if rate_limit_file is not None and fcntl is not None:
+            self.rate_limiter = FileRateLimiter(rate_limit_file, max_requests_per_second)
+        else:
+            self.rate_limiter = RateLimiter(max_requests_per_second)
         
         # Setup cache
         self.cache = SimpleCache() if enable_cache else None
+        # Parsed values of hot endpoints, so repeated hits skip the file read and parse
+        self.memory_cache = (
+            MemoryCache(MEMORY_CACHE_SIZE, cache_ttl_seconds, max_bytes=MEMORY_CACHE_MAX_BYTES)
+            if enable_cache else None
+        )
         
         # Setup requests session with retry strategy
         self.session = requests.Session()
@@ -138,7 +311,13 @@ class SECHttpClient:
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["GET", "HEAD"]
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # The default pool keeps only 10 connections per host, so concurrent
+        # flows beyond that would reconnect (TCP + TLS) on every request
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=len(SEC_HOST_URLS),
+            pool_maxsize=CONNECTION_POOL_SIZE
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
@@ -146,9 +325,109 @@ class SECHttpClient:
         self.session.headers.update({
             'User-Agent': self.user_agent,
             'Accept': 'application/json, text/html, */*',
-            'Accept-Encoding': 'gzip, deflate'
+            # gzip/deflate, plus br and zstd when urllib3 has a decoder for them
+            'Accept-Encoding': ACCEPT_ENCODING
         })
     
+    def warm_up(self, urls=SEC_HOST_URLS, timeout: int = 5):
+        """
+        Open keep-alive connections to the SEC hosts ahead of a burst of requests.
+        
+        Failures are ignored; the real requests will simply connect themselves.
+        
+        Args:
+            urls: One URL per host to connect to
+            timeout: Request timeout in seconds
+        """
+        for url in urls:
+            self.rate_limiter.wait_if_needed()
+            try:
+                self.session.head(url, timeout=timeout)
+            except requests.RequestException:
+                pass
+    
+    def head_all(self, urls: List[str]) -> List[Union[requests.Response, Exception]]:
+        """
+        Send HEAD requests for several URLs concurrently.
+        
+        Each request goes through the rate limiter. Connection errors are
+        returned in place of the response rather than raised.
+        
+        Args:
+            urls: URLs to probe
+        
+        Returns:
+            The response, or the exception raised, for each URL in order
+        """
+        if not urls:
+            return []
+        
+        def probe(url):
+            self.rate_limiter.wait_if_needed()
+            try:
+                return self.session.head(url, timeout=self.timeout, allow_redirects=True)
+            except requests.exceptions.RequestException as e:
+                return e
+        
+        with ThreadPoolExecutor(max_workers=min(len(urls), MAX_PROBE_WORKERS)) as executor:
+            return list(executor.map(probe, urls))
+    
+    def get_many(self, urls: List[str], use_cache: bool = True) -> List[Union[requests.Response, Exception]]:
+        """
+        Perform several GET requests concurrently, as get() would.
+        
+        Each request goes through the cache and the rate limiter. Failures
+        are returned in place of the response rather than raised.
+        
+        Args:
+            urls: URLs to fetch
+            use_cache: Whether to use cache for these requests
+        
+        Returns:
+            The response, or the exception raised, for each URL in order
+        """
+        if not urls:
+            return []
+        
+        def fetch(url):
+            try:
+                return self.get(url, use_cache=use_cache)
+            except Exception as e:
+                return e
+        
+        with ThreadPoolExecutor(max_workers=min(len(urls), MAX_FETCH_WORKERS)) as executor:
+            return list(executor.map(fetch, urls))
+    
+    def first_available(self, urls: List[str]) -> Optional[str]:
+        """
+        Find the first of several candidate URLs that exists.
+        
+        All candidates are probed with concurrent HEAD requests (each one
+        still goes through the rate limiter), so a miss costs one round
+        trip instead of a full failed download.
+        
+        Args:
+            urls: Candidate URLs in order of preference
+        
+        Returns:
+            The first URL, in the given order, answering with a 2xx status,
+            or None if every candidate answered with an error status
+        
+        Raises:
+            Exception: If no candidate exists and a probe failed to connect,
+                so a network problem is not reported as a missing file
+        """
+        outcomes = self.head_all(urls)
+        
+        for url, outcome in zip(urls, outcomes):
+            if isinstance(outcome, requests.Response) and outcome.ok:
+                return url
+        
+        errors = [outcome for outcome in outcomes if isinstance(outcome, Exception)]
+        if errors:
+            raise Exception(f"Request failed: {errors[0]}")
+        return None
+    
     def get(
         self,
         url: str,
@@ -168,17 +447,66 @@ class SECHttpClient:
         Returns:
             requests.Response object
         """
+        response, value = self._get(url, headers, params, use_cache)
+        if response is None:
+            return self._cached_response(value)
+        return response
+    
+    def get_json(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True
+    ) -> Any:
+        """
+        Perform a GET request like get() and return the parsed JSON body.
+        
+        Cache hits return the cached object itself, without building a
+        response, and fresh bodies are parsed only once. The object may be
+        shared with other callers, so it must not be mutated.
+        
+        Raises:
+            JSONDecodeError: If the body is not JSON
+        """
+        response, value = self._get(url, headers, params, use_cache)
+        if value is _NOT_PARSED:
+            return fast_json.loads(response.content)
+        return value
+    
+    def _get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        params: Optional[Dict[str, Any]],
+        use_cache: bool
+    ) -> Tuple[Optional[requests.Response], Any]:
+        """
+        Fetch url through the cache.
+        
+        Returns:
+            (response, value): response is None when value was served from
+            the cache; value is _NOT_PARSED when the body was not parsed as JSON
+        """
         # Check cache first
+        cache_key = None
+        stale_entry = None
         if use_cache and self.cache:
-            cache_key = f"{url}?{json.dumps(params or {}, sort_keys=True)}"
-            cached_response = self.cache.get(cache_key)
-            if cached_response is not None:
-                # Create a mock response from cached data
-                response = requests.Response()
-                response.status_code = 200
-                response._content = json.dumps(cached_response).encode()
-                response.headers['Content-Type'] = 'application/json'
-                return response
+            # Most requests carry no params; only those need a canonical suffix
+            cache_key = f"{url}?{json.dumps(params, sort_keys=True)}" if params else url
+            if self.memory_cache is not None:
+                cached_value = self.memory_cache.get(cache_key)
+                if cached_value is not None:
+                    return None, cached_value
+            
+            # One read serves both a fresh hit and an entry to revalidate
+            stale_entry = self.cache.get_entry(cache_key)
+            if stale_entry is not None:
+                remaining = stale_entry.get('expires_at', 0) - time.time()
+                cached_value = stale_entry.get('value')
+                if remaining > 0 and cached_value is not None:
+                    self._remember(cache_key, cached_value, remaining, stale_entry.get('size'))
+                    return None, cached_value
         
         # Rate limit
         self.rate_limiter.wait_if_needed()
@@ -188,6 +516,13 @@ class SECHttpClient:
         if headers:
             request_headers.update(headers)
         
+        # Revalidate an expired entry instead of downloading it again
+        if stale_entry:
+            if stale_entry.get('etag'):
+                request_headers['If-None-Match'] = stale_entry['etag']
+            if stale_entry.get('last_modified'):
+                request_headers['If-Modified-Since'] = stale_entry['last_modified']
+        
         # Make request
         try:
             response = self.session.get(
@@ -198,17 +533,111 @@ class SECHttpClient:
             )
             response.raise_for_status()
             
+            if response.status_code == 304 and stale_entry:
+                # Unchanged on the server: no body was sent, serve and re-arm the cached copy
+                body = stale_entry.get('body')
+                self.cache.set(
+                    cache_key,
+                    stale_entry.get('value'),
+                    self.cache_ttl if body is None else 0,
+                    etag=response.headers.get('ETag', stale_entry.get('etag')),
+                    last_modified=response.headers.get('Last-Modified', stale_entry.get('last_modified')),
+                    body=body,
+                    encoding=stale_entry.get('encoding'),
+                    size=stale_entry.get('size')
+                )
+                if body is not None:
+                    return self._cached_body_response(body, stale_entry.get('encoding')), _NOT_PARSED
+                self._remember(cache_key, stale_entry.get('value'), self.cache_ttl, stale_entry.get('size'))
+                return None, stale_entry.get('value')
+            
             # Cache successful JSON responses
             if use_cache and self.cache and response.status_code == 200:
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
                 try:
                     # Try to parse as JSON
-                    json_data = response.json()
-                    cache_key = f"{url}?{json.dumps(params or {}, sort_keys=True)}"
-                    self.cache.set(cache_key, json_data, self.cache_ttl)
-                except (json.JSONDecodeError, ValueError):
-                    # Not JSON, don't cache
-                    pass
+                    json_data = fast_json.loads(response.content)
+                except fast_json.JSONDecodeError:
+                    # Not JSON (RSS feeds, index pages): keep small bodies that
+                    # came with validators, already expired, so every later
+                    # request revalidates and an unchanged one is answered by a 304
+                    if (etag or last_modified) and len(response.content) <= MAX_REVALIDATED_BODY_BYTES:
+                        self.cache.set(
+                            cache_key,
+                            None,
+                            0,
+                            etag=etag,
+                            last_modified=last_modified,
+                            body=response.content.decode('latin-1'),
+                            encoding=response.encoding
+                        )
+                else:
+                    self.cache.set(
+                        cache_key,
+                        json_data,
+                        self.cache_ttl,
+                        etag=etag,
+                        last_modified=last_modified,
+                        size=len(response.content)
+                    )
+                    self._remember(cache_key, json_data, self.cache_ttl, len(response.content))
+                    return response, json_data
             
+            return response, _NOT_PARSED
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"HTTP request failed: {e}")
+    
+    def _remember(self, cache_key: str, value: Any, ttl_seconds: float, size: Optional[int]):
+        """
+        Keep a parsed value in memory, never beyond its disk cache expiry.
+        
+        size is the length of its JSON body; large or unknown-size bodies
+        (entries written before sizes were recorded) are only cached on disk.
+        """
+        if (
+            self.memory_cache is not None
+            and value is not None
+            and size is not None
+            and size <= MAX_MEMORY_CACHED_BODY_BYTES
+        ):
+            self.memory_cache.set(cache_key, value, ttl_seconds, size)
+    
+    @staticmethod
+    def _cached_response(value: Any) -> requests.Response:
+        """Create a mock response from cached data."""
+        response = requests.Response()
+        response.status_code = 200
+        response._content = fast_json.dumps_bytes(value)
+        response.headers['Content-Type'] = 'application/json'
+        return response
+    
+    @staticmethod
+    def _cached_body_response(body: str, encoding: Optional[str]) -> requests.Response:
+        """Create a mock response from a cached raw body."""
+        response = requests.Response()
+        response.status_code = 200
+        response._content = body.encode('latin-1')
+        response.encoding = encoding
+        return response
+    
+    def stream(self, url: str) -> requests.Response:
+        """
+        Open a streamed GET request, for bodies consumed as they arrive.
+        
+        The response is not cached; use it as a context manager so the
+        connection is released.
+        
+        Args:
+            url: URL to fetch
+        
+        Returns:
+            Response whose body has not been read yet
+        """
+        self.rate_limiter.wait_if_needed()
+        try:
+            response = self.session.get(url, timeout=self.timeout, stream=True)
+            response.raise_for_status()
             return response
         except requests.exceptions.RequestException as e:
             raise Exception(f"HTTP request failed: {e}")
@@ -232,43 +661,181 @@ class SECHttpClient:
         """
         dest_path_obj = Path(dest_path)
         
-        # Check if file already exists (simple cache check)
+        # Completed downloads only ever appear via os.replace, so an existing
+        # file is whole (simple cache check)
         if use_cache and dest_path_obj.exists():
             return str(dest_path_obj.absolute())
         
         # Ensure parent directory exists
         dest_path_obj.parent.mkdir(parents=True, exist_ok=True)
+        part_path = dest_path_obj.with_name(dest_path_obj.name + '.part')
+        validator_path = dest_path_obj.with_name(dest_path_obj.name + '.part.validator')
+        
+        # Resume an interrupted download; If-Range makes the server send the
+        # whole file instead if it changed since the partial was written
+        headers = {}
+        offset = file_size(str(part_path)) or 0
+        validator = validator_path.read_text() if offset and validator_path.exists() else None
+        if validator:
+            headers = {
+                'Accept-Encoding': 'identity',
+                'Range': f'bytes={offset}-',
+                'If-Range': validator
+            }
         
         # Rate limit
         self.rate_limiter.wait_if_needed()
         
         # Download file
         try:
-            response = self.session.get(url, timeout=self.timeout, stream=True)
+            response = self.session.get(url, headers=headers, timeout=self.timeout, stream=True)
+            if response.status_code == 416 and validator:
+                # Nothing left past the offset: the process died between the
+                # last write and os.replace, or the partial is unusable
+                total = response.headers.get('Content-Range', '').rpartition('/')[2]
+                response.close()
+                if total == str(offset):
+                    os.replace(part_path, dest_path_obj)
+                    validator_path.unlink(missing_ok=True)
+                    return str(dest_path_obj.absolute())
+                part_path.unlink(missing_ok=True)
+                validator_path.unlink(missing_ok=True)
+                return self.download(url, dest_path, use_cache=use_cache)
             response.raise_for_status()
             
-            with open(dest_path_obj, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
+            if response.status_code == 206 and validator:
+                mode = 'ab'
+            else:
+                mode = 'wb'
+                validator = response.headers.get('ETag') or response.headers.get('Last-Modified')
+                if validator:
+                    validator_path.write_text(validator)
+                else:
+                    validator_path.unlink(missing_ok=True)
+            
+            with open(part_path, mode) as f:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                     f.write(chunk)
             
+            os.replace(part_path, dest_path_obj)
+            validator_path.unlink(missing_ok=True)
             return str(dest_path_obj.absolute())
         except requests.exceptions.RequestException as e:
             raise Exception(f"Download failed: {e}")
+    
+    def download_ranged(
+        self,
+        url: str,
+        dest_path: str,
+        num_parts: int = 8,
+        use_cache: bool = True
+    ) -> str:
+        """
+        Download a large file as parallel HTTP range requests.
+        
+        Falls back to a single streamed download when the server does not
+        accept byte ranges or the file is too small to be worth splitting.
+        Each range request goes through the rate limiter.
+        
+        Args:
+            url: URL to download
+            dest_path: Local path to save file
+            num_parts: Number of ranges fetched in parallel
+            use_cache: Check if file already exists locally
+        
+        Returns:
+            Path to downloaded file
+        """
+        dest_path_obj = Path(dest_path)
+        
+        # Check if file already exists (simple cache check)
+        if use_cache and dest_path_obj.exists():
+            return str(dest_path_obj.absolute())
+        
+        # Byte offsets must refer to the file itself, not a gzip encoding of it
+        identity_headers = {'Accept-Encoding': 'identity'}
+        
+        self.rate_limiter.wait_if_needed()
+        try:
+            head = self.session.head(url, headers=identity_headers, timeout=self.timeout, allow_redirects=True)
+            head.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"Download failed: {e}")
+        
+        total_size = int(head.headers.get('Content-Length', 0))
+        if head.headers.get('Accept-Ranges') != 'bytes' or total_size < MIN_RANGED_DOWNLOAD_BYTES:
+            return self.download(url, dest_path, use_cache=use_cache)
+        
+        dest_path_obj.parent.mkdir(parents=True, exist_ok=True)
+        # Not download()'s '.part': a sparse, partly filled file must never be
+        # mistaken for a resumable prefix
+        part_path = dest_path_obj.with_name(dest_path_obj.name + '.ranged.part')
+        
+        part_size = -(-total_size // num_parts)
+        ranges = [
+            (start, min(start + part_size, total_size) - 1)
+            for start in range(0, total_size, part_size)
+        ]
+        
+        def fetch_range(byte_range):
+            start, end = byte_range
+            self.rate_limiter.wait_if_needed()
+            response = self.session.get(
+                url,
+                headers={**identity_headers, 'Range': f'bytes={start}-{end}'},
+                timeout=self.timeout,
+                stream=True
+            )
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise requests.exceptions.RequestException("server ignored the Range header")
+            
+            # Each range writes to its own region of the pre-sized file
+            with open(part_path, 'r+b') as f:
+                f.seek(start)
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+        
+        try:
+            with open(part_path, 'wb') as f:
+                f.truncate(total_size)
+            with ThreadPoolExecutor(max_workers=num_parts) as executor:
+                list(executor.map(fetch_range, ranges))
+            os.replace(part_path, dest_path_obj)
+            return str(dest_path_obj.absolute())
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"Download failed: {e}")
+        finally:
+            # Gone after a successful os.replace; any failure drops the partial
+            part_path.unlink(missing_ok=True)
+
+
+def file_size(path: str) -> Optional[int]:
+    """Return the size of a file with a single stat call, or None if missing."""
+    try:
+        return os.stat(path).st_size
+    except FileNotFoundError:
+        return None
 
 
 # Global client instance (can be overridden if needed)
 _default_client: Optional[SECHttpClient] = None
+_default_client_lock = threading.Lock()
 
 
 def get_default_client() -> SECHttpClient:
     """Get or create the default SEC HTTP client."""
     global _default_client
     if _default_client is None:
-        _default_client = SECHttpClient()
+        # Tools call this from worker threads; only one client may be created
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = SECHttpClient()
     return _default_client
 
 
 def set_default_client(client: SECHttpClient):
     """Set a custom default client."""
     global _default_client
-    _default_client = client
+    with _default_client_lock:
+        _default_client = client
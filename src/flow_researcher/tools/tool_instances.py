@@ -0,0 +1,31 @@
+"""
+Shared tool instances.
+
+Constructing a BaseTool re-runs Pydantic validation of the tool model and
+its args schema. The tools in this package are stateless wrappers around
+the shared SEC HTTP client, so a single instance per class can be reused
+by every flow run and agent.
+"""
+
+import threading
+from typing import Dict, Type, TypeVar
+
+from crewai.tools import BaseTool
+
+
+ToolT = TypeVar("ToolT", bound=BaseTool)
+
+_shared_tools: Dict[type, BaseTool] = {}
+_shared_tools_lock = threading.Lock()
+
+
+def get_shared_tool(tool_cls: Type[ToolT]) -> ToolT:
+    """Get or create the shared instance of a tool class."""
+    tool = _shared_tools.get(tool_cls)
+    if tool is None:
+        with _shared_tools_lock:
+            tool = _shared_tools.get(tool_cls)
+            if tool is None:
+                tool = tool_cls()
+                _shared_tools[tool_cls] = tool
+    return tool  # type: ignore[return-value]
@@ -0,0 +1,26 @@
+"""
+Tool result envelope.
+
+Every SEC tool returns a JSON object with the same three keys: data,
+source_urls and warnings. Building it as a slotted dataclass instead of a
+fresh dict per call keeps the envelope small, and orjson serializes
+dataclasses natively, so no intermediate dict is created on the way out.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, List
+
+from . import fast_json as json
+
+
+@dataclass(slots=True)
+class ToolResult:
+    """Result envelope returned (as JSON) by the SEC tools."""
+
+    data: Any = None
+    source_urls: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+    def to_json(self) -> str:
+        """Serialize the envelope to a compact JSON string."""
+        return json.dumps(self)
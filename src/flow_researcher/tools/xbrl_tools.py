@@ -4,14 +4,152 @@ XBRL "Facts" APIs Tools.
 These tools access structured financial data from SEC's XBRL APIs.
 """
 
-import json
-from typing import Type, Optional, List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Type, Optional, List, Dict, Any, Tuple
 
 from pydantic import BaseModel, Field
 
 from crewai.tools import BaseTool
 
-from .sec_http_client import get_default_client
+from . import fast_json as json
+from .company_tools import _normalize_cik
+from .sec_http_client import MemoryCache, get_default_client
+
+
+_COMPANY_FACTS_URL = "https://data.sec.gov/api/xbrl/companyfacts/CIK{}.json".format
+_COMPANY_CONCEPT_URL = "https://data.sec.gov/api/xbrl/companyconcept/CIK{}/{}/{}.json".format
+_FRAMES_URL = "https://data.sec.gov/api/xbrl/frames/{}/{}/{}/{}.json".format
+
+# Upper bound on concurrent companyconcept requests per batch call
+MAX_CONCEPT_FETCH_WORKERS = 8
+
+# Parsed companyfacts keyed by the JSON string itself: agents pass the same
+# payload to several parser tools in a row. Dict lookup compares the hash
+# first and the full string only on a hash match, so a hit is exact.
+PARSED_FACTS_CACHE_SIZE = 4
+PARSED_FACTS_CACHE_TTL_SECONDS = 300
+_parsed_facts_cache = MemoryCache(PARSED_FACTS_CACHE_SIZE, PARSED_FACTS_CACHE_TTL_SECONDS)
+
+
+def _parse_facts(companyfacts_json: str) -> Any:
+    """Parse a companyfacts JSON string, reusing the result for a repeated string."""
+    facts = _parsed_facts_cache.get(companyfacts_json)
+    if facts is None:
+        facts = json.loads(companyfacts_json)
+        _parsed_facts_cache.set(companyfacts_json, facts)
+    return facts
+
+
+def _facts_keys(companyfacts_json: str, *paths: Tuple[str, ...]) -> Optional[List[str]]:
+    """
+    List the keys at the first existing path of a companyfacts string, parsing
+    no values.
+    
+    Returns None when a full parse is the better route: the string is already
+    parsed in the cache, partial parsing is unavailable, or no path exists.
+    """
+    if not json.PARTIAL_PARSING or _parsed_facts_cache.get(companyfacts_json) is not None:
+        return None
+    return json.loads_keys(companyfacts_json, *paths)
+
+
+def _taxonomy_facts(companyfacts_json: str, taxonomy: str) -> Dict[str, Any]:
+    """Get the facts of one taxonomy from a companyfacts string, parsing it at most once."""
+    facts = _parsed_facts_cache.get(companyfacts_json)
+    if facts is None and json.PARTIAL_PARSING:
+        # Only the requested taxonomy is needed, not its siblings; cache that
+        # sub-tree on its own so a repeated call does not parse again
+        key = (companyfacts_json, taxonomy)
+        taxonomy_data = _parsed_facts_cache.get(key)
+        if taxonomy_data is None:
+            taxonomy_data = json.loads_path(
+                companyfacts_json,
+                ("facts", taxonomy),
+                ("data", "facts", taxonomy)
+            ) or {}
+            _parsed_facts_cache.set(key, taxonomy_data)
+        return taxonomy_data
+    
+    if facts is None:
+        facts = _parse_facts(companyfacts_json)
+    facts_data = facts.get("facts") or facts.get("data", {}).get("facts", {})
+    return facts_data.get(taxonomy, {})
+
+
+# Per-fact fields copied into normalized rows, after the tag and unit columns
+_FACT_FIELDS = ("fy", "fp", "end", "val", "form", "filed", "frame", "accn")
+_TABLE_COLUMNS = ("tag", "unit") + _FACT_FIELDS
+
+
+def _filter_columns(
+    columns: Dict[str, List[Any]],
+    tag: Optional[str],
+    fp: Optional[str],
+    form: Optional[str],
+    unit: Optional[str],
+    start_end: Optional[str]
+) -> List[Dict[str, Any]]:
+    """Filter a columnar facts table, building row dicts only for the matches."""
+    positions = range(len(columns["tag"]))
+    for name, wanted in (("tag", tag), ("fp", fp), ("form", form), ("unit", unit)):
+        if wanted:
+            column = columns[name]
+            positions = [i for i in positions if column[i] == wanted]
+    if start_end:
+        column = columns["end"]
+        if ":" in start_end:
+            # Date range
+            start, end = start_end.split(":", 1)
+            positions = [i for i in positions if column[i] and start <= column[i] <= end]
+        else:
+            # Single date
+            positions = [i for i in positions if column[i] == start_end]
+    
+    return [{name: columns[name][i] for name in _TABLE_COLUMNS} for i in positions]
+
+
+def _filter_rows(
+    data: Any,
+    tag: Optional[str],
+    fp: Optional[str],
+    form: Optional[str],
+    unit: Optional[str],
+    start_end: Optional[str]
+) -> Tuple[List[Dict[str, Any]], int]:
+    """Filter row-shaped facts; returns the matches and the input row count."""
+    # Extract rows from data structure
+    if isinstance(data, dict) and "data" in data:
+        rows_list = data["data"].get("rows", [])
+    elif isinstance(data, dict) and "rows" in data:
+        rows_list = data["rows"]
+    elif isinstance(data, list):
+        rows_list = data
+    else:
+        rows_list = []
+    
+    # Apply filters
+    filtered = rows_list
+    if tag:
+        filtered = [r for r in filtered if r.get("tag") == tag]
+    if fp:
+        filtered = [r for r in filtered if r.get("fp") == fp]
+    if form:
+        filtered = [r for r in filtered if r.get("form") == form]
+    if unit:
+        filtered = [r for r in filtered if r.get("unit") == unit]
+    if start_end:
+        if ":" in start_end:
+            # Date range
+            start, end = start_end.split(":", 1)
+            filtered = [
+                r for r in filtered
+                if r.get("end") and start <= r.get("end") <= end
+            ]
+        else:
+            # Single date
+            filtered = [r for r in filtered if r.get("end") == start_end]
+    
+    return filtered, len(rows_list)
 
 
 class GetCompanyFactsInput(BaseModel):
@@ -35,27 +173,28 @@ class GetCompanyFactsTool(BaseTool):
     args_schema: Type[BaseModel] = GetCompanyFactsInput
 
     def _run(self, cik: str) -> str:
-        cik_padded = cik.strip().zfill(10)
+        return json.dumps(self._run_native(cik))
+
+    def _run_native(self, cik: str) -> Dict[str, Any]:
+        """Build the result envelope as a dict, for callers inside this package."""
+        cik_padded = _normalize_cik(cik)
         client = get_default_client()
-        url = f"https://data.sec.gov/api/xbrl/companyfacts/CIK{cik_padded}.json"
+        url = _COMPANY_FACTS_URL(cik_padded)
         
         try:
-            response = client.get(url)
-            data = response.json()
+            data = client.get_json(url)
             
-            result = {
+            return {
                 "data": data,
                 "source_urls": [url],
                 "warnings": []
             }
-            
-            return json.dumps(result)
         except Exception as e:
-            return json.dumps({
+            return {
                 "data": None,
                 "source_urls": [url],
                 "warnings": [f"Failed to fetch company facts: {str(e)}"]
-            })
+            }
 
 
 class ListTaxonomiesInput(BaseModel):
@@ -83,20 +222,26 @@ class ListTaxonomiesTool(BaseTool):
 
     def _run(self, companyfacts_json: str) -> str:
         try:
+            taxonomies = None
             if isinstance(companyfacts_json, str):
-                facts = json.loads(companyfacts_json)
-            else:
-                facts = companyfacts_json
+                # Only the taxonomy names are needed, not the facts under them
+                taxonomies = _facts_keys(companyfacts_json, ("facts",), ("data", "facts"))
             
-            # Extract taxonomies from facts structure
-            # Structure: facts["facts"] contains taxonomy keys
-            if isinstance(facts, dict) and "facts" in facts:
-                taxonomies = list(facts["facts"].keys())
-            elif isinstance(facts, dict) and "data" in facts and isinstance(facts["data"], dict) and "facts" in facts["data"]:
-                taxonomies = list(facts["data"]["facts"].keys())
-            else:
-                # Try to find any dict keys that look like taxonomies
-                taxonomies = [k for k in facts.keys() if isinstance(facts.get(k), dict)]
+            if taxonomies is None:
+                if isinstance(companyfacts_json, str):
+                    facts = _parse_facts(companyfacts_json)
+                else:
+                    facts = companyfacts_json
+                
+                # Extract taxonomies from facts structure
+                # Structure: facts["facts"] contains taxonomy keys
+                if isinstance(facts, dict) and "facts" in facts:
+                    taxonomies = list(facts["facts"].keys())
+                elif isinstance(facts, dict) and "data" in facts and isinstance(facts["data"], dict) and "facts" in facts["data"]:
+                    taxonomies = list(facts["data"]["facts"].keys())
+                else:
+                    # Try to find any dict keys that look like taxonomies
+                    taxonomies = [k for k in facts.keys() if isinstance(facts.get(k), dict)]
             
             result = {
                 "data": {
@@ -151,18 +296,28 @@ class ListConceptsTool(BaseTool):
 
     def _run(self, companyfacts_json: str, taxonomy: str = "us-gaap") -> str:
         try:
+            concepts = None
             if isinstance(companyfacts_json, str):
-                facts = json.loads(companyfacts_json)
-            else:
-                facts = companyfacts_json
+                # Only the concept names are needed, not their facts
+                concepts = _facts_keys(
+                    companyfacts_json,
+                    ("facts", taxonomy),
+                    ("data", "facts", taxonomy)
+                )
             
-            # Extract concepts from facts structure
-            concepts = []
-            if isinstance(facts, dict):
-                # Handle different possible structures
-                facts_data = facts.get("facts") or facts.get("data", {}).get("facts", {})
-                if taxonomy in facts_data:
-                    concepts = list(facts_data[taxonomy].keys())
+            if concepts is None:
+                if isinstance(companyfacts_json, str):
+                    facts = _parse_facts(companyfacts_json)
+                else:
+                    facts = companyfacts_json
+                
+                # Extract concepts from facts structure
+                concepts = []
+                if isinstance(facts, dict):
+                    # Handle different possible structures
+                    facts_data = facts.get("facts") or facts.get("data", {}).get("facts", {})
+                    if taxonomy in facts_data:
+                        concepts = list(facts_data[taxonomy].keys())
             
             result = {
                 "data": {
@@ -216,13 +371,16 @@ class GetCompanyConceptTool(BaseTool):
     args_schema: Type[BaseModel] = GetCompanyConceptInput
 
     def _run(self, cik: str, taxonomy: str, tag: str) -> str:
-        cik_padded = cik.strip().zfill(10)
+        return json.dumps(self._run_native(cik, taxonomy, tag))
+
+    def _run_native(self, cik: str, taxonomy: str, tag: str) -> Dict[str, Any]:
+        """Build the result envelope as a dict, for callers inside this package."""
+        cik_padded = _normalize_cik(cik)
         client = get_default_client()
-        url = f"https://data.sec.gov/api/xbrl/companyconcept/CIK{cik_padded}/{taxonomy}/{tag}.json"
+        url = _COMPANY_CONCEPT_URL(cik_padded, taxonomy, tag)
         
         try:
-            response = client.get(url)
-            data = response.json()
+            data = client.get_json(url)
             
             result = {
                 "data": data,
@@ -230,13 +388,59 @@ class GetCompanyConceptTool(BaseTool):
                 "warnings": []
             }
             
-            return json.dumps(result)
+            return result
         except Exception as e:
-            return json.dumps({
+            return {
                 "data": None,
                 "source_urls": [url],
                 "warnings": [f"Failed to fetch company concept: {str(e)}"]
-            })
+            }
+
+
+class GetCompanyConceptBatchInput(BaseModel):
+    """Input schema for get_company_concept_batch tool."""
+    cik: str = Field(..., description="10-digit zero-padded CIK number")
+    taxonomy: str = Field(
+        default="us-gaap",
+        description="Taxonomy name (e.g., 'us-gaap', 'dei')"
+    )
+    tags: List[str] = Field(..., description="Concept tags (e.g., ['Revenues', 'NetIncomeLoss', 'Assets'])")
+
+
+class GetCompanyConceptBatchTool(BaseTool):
+    """
+    Get company concepts for several tags at once.
+    
+    Runs GetCompanyConceptTool for each tag concurrently, so several
+    concepts cost roughly one round trip instead of one per tag.
+    """
+    name: str = "get_company_concept_batch"
+    description: str = """
+    Retrieves time-series data for several XBRL concepts/tags of one company
+    in a single call. Returns a mapping of tag to its concept data, or null
+    when the concept could not be fetched; problems are reported in warnings.
+    """
+    args_schema: Type[BaseModel] = GetCompanyConceptBatchInput
+
+    def _run(self, cik: str, tags: List[str], taxonomy: str = "us-gaap") -> str:
+        concept_tool = GetCompanyConceptTool()
+        tags = list(dict.fromkeys(tags))
+        
+        max_workers = max(1, min(len(tags), MAX_CONCEPT_FETCH_WORKERS))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            outcomes = list(executor.map(lambda tag: concept_tool._run_native(cik, taxonomy, tag), tags))
+        
+        result = {
+            "data": {tag: outcome["data"] for tag, outcome in zip(tags, outcomes)},
+            "source_urls": [url for outcome in outcomes for url in outcome["source_urls"]],
+            "warnings": [
+                f"{tag}: {warning}"
+                for tag, outcome in zip(tags, outcomes)
+                for warning in outcome["warnings"]
+            ]
+        }
+        
+        return json.dumps(result)
 
 
 class GetFramesInput(BaseModel):
@@ -267,11 +471,10 @@ class GetFramesTool(BaseTool):
 
     def _run(self, taxonomy: str, tag: str, unit: str, period: str) -> str:
         client = get_default_client()
-        url = f"https://data.sec.gov/api/xbrl/frames/{taxonomy}/{tag}/{unit}/{period}.json"
+        url = _FRAMES_URL(taxonomy, tag, unit, period)
         
         try:
-            response = client.get(url)
-            data = response.json()
+            data = client.get_json(url)
             
             result = {
                 "data": data,
@@ -298,6 +501,10 @@ class NormalizeFactsToTableInput(BaseModel):
         default="us-gaap",
         description="Taxonomy name (e.g., 'us-gaap')"
     )
+    columnar: bool = Field(
+        default=False,
+        description="Return one list per column instead of one dict per row"
+    )
 
 
 class NormalizeFactsToTableTool(BaseTool):
@@ -314,47 +521,65 @@ class NormalizeFactsToTableTool(BaseTool):
     contains: tag, unit, fy (fiscal year), fp (fiscal period), end (end date),
     val (value), form (filing form), filed (filing date), frame, accn (accession
     number). The accession number can be used to join back to filings/documents.
+    Set columnar=True to get one list per column instead, a much smaller result
+    for large filers that facts_filter also accepts.
     """
     args_schema: Type[BaseModel] = NormalizeFactsToTableInput
 
-    def _run(self, companyfacts_json: str, taxonomy: str = "us-gaap") -> str:
+    def _run(self, companyfacts_json: str, taxonomy: str = "us-gaap", columnar: bool = False) -> str:
         try:
             if isinstance(companyfacts_json, str):
-                facts = json.loads(companyfacts_json)
+                taxonomy_data = _taxonomy_facts(companyfacts_json, taxonomy)
             else:
+                # Extract facts data
                 facts = companyfacts_json
+                facts_data = facts.get("facts") or facts.get("data", {}).get("facts", {})
+                taxonomy_data = facts_data.get(taxonomy, {})
             
-            # Extract facts data
-            facts_data = facts.get("facts") or facts.get("data", {}).get("facts", {})
-            taxonomy_data = facts_data.get(taxonomy, {})
-            
-            rows = []
-            for tag, tag_data in taxonomy_data.items():
-                units = tag_data.get("units", {})
-                for unit, unit_data in units.items():
-                    for fact in unit_data:
-                        row = {
-                            "tag": tag,
-                            "unit": unit,
-                            "fy": fact.get("fy"),
-                            "fp": fact.get("fp"),
-                            "end": fact.get("end"),
-                            "val": fact.get("val"),
-                            "form": fact.get("form"),
-                            "filed": fact.get("filed"),
-                            "frame": fact.get("frame"),
-                            "accn": fact.get("accn")
-                        }
-                        rows.append(row)
+            if columnar:
+                # Struct of arrays: no per-row dict, and keys are not repeated in the JSON
+                columns = {name: [] for name in _TABLE_COLUMNS}
+                for tag, tag_data in taxonomy_data.items():
+                    units = tag_data.get("units", {})
+                    for unit, unit_data in units.items():
+                        columns["tag"].extend([tag] * len(unit_data))
+                        columns["unit"].extend([unit] * len(unit_data))
+                        for name in _FACT_FIELDS:
+                            columns[name].extend([fact.get(name) for fact in unit_data])
+                
+                count = len(columns["tag"])
+                table = {"columns": columns}
+            else:
+                rows = []
+                for tag, tag_data in taxonomy_data.items():
+                    units = tag_data.get("units", {})
+                    for unit, unit_data in units.items():
+                        for fact in unit_data:
+                            row = {
+                                "tag": tag,
+                                "unit": unit,
+                                "fy": fact.get("fy"),
+                                "fp": fact.get("fp"),
+                                "end": fact.get("end"),
+                                "val": fact.get("val"),
+                                "form": fact.get("form"),
+                                "filed": fact.get("filed"),
+                                "frame": fact.get("frame"),
+                                "accn": fact.get("accn")
+                            }
+                            rows.append(row)
+                
+                count = len(rows)
+                table = {"rows": rows}
             
             result = {
                 "data": {
-                    "rows": rows,
-                    "count": len(rows),
+                    **table,
+                    "count": count,
                     "taxonomy": taxonomy
                 },
                 "source_urls": [],
-                "warnings": [] if rows else [f"No facts found for taxonomy '{taxonomy}'"]
+                "warnings": [] if count else [f"No facts found for taxonomy '{taxonomy}'"]
             }
             
             return json.dumps(result)
@@ -412,49 +637,43 @@ class FactsFilterTool(BaseTool):
         unit: Optional[str] = None,
         start_end: Optional[str] = None
     ) -> str:
+        return json.dumps(self._run_native(rows, tag, fp, form, unit, start_end))
+
+    def _run_native(
+        self,
+        rows: Any,
+        tag: Optional[str] = None,
+        fp: Optional[str] = None,
+        form: Optional[str] = None,
+        unit: Optional[str] = None,
+        start_end: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Build the result envelope as a dict, for callers inside this package.
+        
+        Accepts a parsed table or envelope as well, so filters can be chained
+        without a JSON round trip.
+        """
         try:
             if isinstance(rows, str):
                 data = json.loads(rows)
             else:
                 data = rows
             
-            # Extract rows from data structure
-            if isinstance(data, dict) and "data" in data:
-                rows_list = data["data"].get("rows", [])
-            elif isinstance(data, dict) and "rows" in data:
-                rows_list = data["rows"]
-            elif isinstance(data, list):
-                rows_list = data
+            # Columnar tables from normalize_facts_to_table(columnar=True)
+            table = data.get("data", data) if isinstance(data, dict) else None
+            if isinstance(table, dict) and "columns" in table:
+                columns = table["columns"]
+                filtered = _filter_columns(columns, tag, fp, form, unit, start_end)
+                original_count = len(columns["tag"])
             else:
-                rows_list = []
-            
-            # Apply filters
-            filtered = rows_list
-            if tag:
-                filtered = [r for r in filtered if r.get("tag") == tag]
-            if fp:
-                filtered = [r for r in filtered if r.get("fp") == fp]
-            if form:
-                filtered = [r for r in filtered if r.get("form") == form]
-            if unit:
-                filtered = [r for r in filtered if r.get("unit") == unit]
-            if start_end:
-                if ":" in start_end:
-                    # Date range
-                    start, end = start_end.split(":", 1)
-                    filtered = [
-                        r for r in filtered
-                        if r.get("end") and start <= r.get("end") <= end
-                    ]
-                else:
-                    # Single date
-                    filtered = [r for r in filtered if r.get("end") == start_end]
+                filtered, original_count = _filter_rows(data, tag, fp, form, unit, start_end)
             
             result = {
                 "data": {
                     "rows": filtered,
                     "count": len(filtered),
-                    "original_count": len(rows_list),
+                    "original_count": original_count,
                     "filters_applied": {
                         "tag": tag,
                         "fp": fp,
@@ -467,16 +686,16 @@ class FactsFilterTool(BaseTool):
                 "warnings": []
             }
             
-            return json.dumps(result)
+            return result
         except json.JSONDecodeError:
-            return json.dumps({
+            return {
                 "data": {"rows": [], "count": 0, "original_count": 0},
                 "source_urls": [],
                 "warnings": ["Invalid JSON in rows parameter"]
-            })
+            }
         except Exception as e:
-            return json.dumps({
+            return {
                 "data": {"rows": [], "count": 0, "original_count": 0},
                 "source_urls": [],
                 "warnings": [f"Failed to filter facts: {str(e)}"]
-            })
+            }
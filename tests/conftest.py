@@ -0,0 +1,81 @@
+"""
+Shared fixtures for the tools tests.
+
+Offline tests replace the process-wide SEC client with a fake that serves
+canned bodies, so they exercise the tools without touching the network.
+"""
+
+import copy
+
+import pytest
+
+from flow_researcher.tools import fast_json as json
+
+
+class FakeResponse:
+    """Minimal stand-in for a requests.Response with a body."""
+
+    def __init__(self, content):
+        self.content = content
+        self.text = content.decode("utf-8")
+
+
+class FakeSECClient:
+    """
+    Fake SEC client serving canned bodies by URL.
+
+    ``responses`` is either a callable mapping a URL to its body or a single
+    body served for every URL. Bodies may be parsed JSON, str or bytes; an
+    Exception body is raised (or returned by get_many, like the real client).
+    Every requested URL is recorded in ``urls``.
+    """
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.urls = []
+
+    def _body(self, url):
+        self.urls.append(url)
+        body = self.responses(url) if callable(self.responses) else self.responses
+        if isinstance(body, Exception):
+            raise body
+        return body
+
+    def get_json(self, url, **kwargs):
+        body = self._body(url)
+        if isinstance(body, (str, bytes)):
+            return json.loads(body)
+        # A fresh object per call, as if the body had been parsed again
+        return copy.deepcopy(body)
+
+    def get(self, url, **kwargs):
+        body = self._body(url)
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        elif not isinstance(body, bytes):
+            body = json.dumps_bytes(body)
+        return FakeResponse(body)
+
+    def get_many(self, urls, **kwargs):
+        results = []
+        for url in urls:
+            try:
+                results.append(self.get(url))
+            except Exception as e:
+                results.append(e)
+        return results
+
+
+@pytest.fixture
+def sec_client(monkeypatch):
+    """
+    Install a FakeSECClient as a tool module's default client.
+
+    Usage: ``client = sec_client(filing_tools, responses)``.
+    """
+    def install(module, responses):
+        client = FakeSECClient(responses)
+        monkeypatch.setattr(module, "get_default_client", lambda: client)
+        return client
+
+    return install
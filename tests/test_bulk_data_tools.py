@@ -8,7 +8,98 @@ to avoid downloading large files.
 """
 
 import json
+import zipfile
 import pytest
 
+from flow_researcher.tools import (
+    ExtractBulkZipTool,
+    PackBulkZipToSqliteTool,
+    BulkSubmissionsLookupTool,
+)
+from flow_researcher.tools import bulk_data_tools
+
 # Note: Bulk download tests are optional and may be skipped
 # to avoid downloading large files during testing
+
+
+@pytest.fixture
+def bulk_zip(tmp_path):
+    """Create a small bulk-style ZIP file with one JSON file per company."""
+    zip_path = tmp_path / "bulk.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        for i in range(30):
+            zf.writestr(f"CIK{i:010d}.json", json.dumps({"cik": i}))
+    return zip_path
+
+
+class TestExtractBulkZipTool:
+    """Test suite for ExtractBulkZipTool."""
+
+    def test_extract_preview_names(self, bulk_zip, tmp_path):
+        """Test extracting a ZIP returns the count and a preview of names."""
+        tool = ExtractBulkZipTool()
+        dest_dir = tmp_path / "out"
+        result = tool._run(str(bulk_zip), str(dest_dir))
+        
+        data = json.loads(result)
+        assert data["data"]["file_count"] == 30
+        assert data["data"]["files_truncated"] is True
+        assert len(data["data"]["extracted_files"]) < 30
+        assert len(list(dest_dir.iterdir())) == 30
+
+    def test_extract_all_names(self, bulk_zip, tmp_path):
+        """Test extracting a ZIP with every file name returned."""
+        tool = ExtractBulkZipTool()
+        result = tool._run(str(bulk_zip), str(tmp_path / "out"), return_names=True)
+        
+        data = json.loads(result)
+        assert data["data"]["file_count"] == 30
+        assert data["data"]["files_truncated"] is False
+        assert "CIK0000000000.json" in data["data"]["extracted_files"]
+
+    def test_extract_in_parallel(self, bulk_zip, tmp_path, monkeypatch):
+        """Test extracting a ZIP across worker processes."""
+        monkeypatch.setattr(bulk_data_tools, "PARALLEL_EXTRACT_MIN_FILES", 10)
+        monkeypatch.setattr(bulk_data_tools.os, "cpu_count", lambda: 2)
+        tool = ExtractBulkZipTool()
+        dest_dir = tmp_path / "out"
+        result = tool._run(str(bulk_zip), str(dest_dir))
+        
+        data = json.loads(result)
+        assert data["data"]["file_count"] == 30
+        assert len(list(dest_dir.iterdir())) == 30
+
+    def test_missing_zip(self, tmp_path):
+        """Test with a ZIP path that doesn't exist."""
+        tool = ExtractBulkZipTool()
+        result = tool._run(str(tmp_path / "missing.zip"), str(tmp_path / "out"))
+        
+        data = json.loads(result)
+        assert data["data"] is None
+        assert "not found" in data["warnings"][0].lower()
+
+
+class TestPackBulkZipToSqliteTool:
+    """Test suite for PackBulkZipToSqliteTool and BulkSubmissionsLookupTool."""
+
+    def test_pack_and_lookup(self, bulk_zip, tmp_path):
+        """Test packing a ZIP into SQLite and looking up a company."""
+        db_path = tmp_path / "bulk.db"
+        result = PackBulkZipToSqliteTool()._run(str(bulk_zip), str(db_path))
+        
+        data = json.loads(result)
+        assert data["data"]["document_count"] == 30
+        
+        lookup = BulkSubmissionsLookupTool()
+        data = json.loads(lookup._run(str(db_path), "7"))
+        assert data["data"] == {"cik": 7}
+        assert data["warnings"] == []
+
+    def test_lookup_missing_cik(self, bulk_zip, tmp_path):
+        """Test looking up a CIK that is not in the database."""
+        db_path = tmp_path / "bulk.db"
+        PackBulkZipToSqliteTool()._run(str(bulk_zip), str(db_path))
+        
+        data = json.loads(BulkSubmissionsLookupTool()._run(str(db_path), "0000999999"))
+        assert data["data"] is None
+        assert "not found" in data["warnings"][0].lower()
@@ -40,6 +40,56 @@ class TestTickerToCikTool:
         assert len(data["warnings"]) > 0
         assert "not found" in data["warnings"][0].lower()
 
+    def test_malformed_ticker_skips_network(self, monkeypatch):
+        """Test that malformed tickers are rejected without fetching the ticker map."""
+        from flow_researcher.tools import company_tools
+        
+        def fail_client():
+            raise AssertionError("ticker map should not be fetched")
+        
+        monkeypatch.setattr(company_tools, "get_default_client", fail_client)
+        monkeypatch.setattr(company_tools, "_ticker_map_cache", company_tools.MemoryCache(maxsize=1))
+        
+        tool = TickerToCikTool()
+        for ticker in ["", "   ", "12345", "AA PL"]:
+            data = json.loads(tool._run(ticker))
+            assert data["data"] is None
+            assert "not found" in data["warnings"][0].lower()
+
+    def test_repeated_lookup_is_cached(self, monkeypatch, sec_client):
+        """Test that a resolved ticker is not fetched again."""
+        from flow_researcher.tools import company_tools
+        
+        client = sec_client(company_tools, {"fields": ["cik", "name", "ticker", "exchange"],
+                                            "data": [[1234567, "Cached Co", "ZZCACHE", "NYSE"]]})
+        monkeypatch.setattr(company_tools, "_ticker_to_cik_cache", company_tools.MemoryCache())
+        monkeypatch.setattr(company_tools, "_ticker_map_cache", company_tools.MemoryCache(maxsize=1))
+        
+        tool = TickerToCikTool()
+        first = tool._run("zzcache")
+        second = tool._run("ZZCACHE")
+        missing = tool._run("ZZMISSING")
+        
+        assert first == second
+        assert json.loads(second)["data"]["cik"] == "0001234567"
+        assert json.loads(missing)["data"] is None
+        # The ticker map itself is downloaded once and shared by all lookups
+        assert len(client.urls) == 1
+
+    def test_map_without_exchange_column(self, monkeypatch, sec_client):
+        """Test that lookup columns are resolved by name when "exchange" is missing."""
+        from flow_researcher.tools import company_tools
+        
+        sec_client(company_tools, {"fields": ["ticker", "cik", "name"],
+                                   "data": [["ZZNOEX", 7654321, "No Exchange Co"]]})
+        monkeypatch.setattr(company_tools, "_ticker_to_cik_cache", company_tools.MemoryCache())
+        monkeypatch.setattr(company_tools, "_ticker_map_cache", company_tools.MemoryCache(maxsize=1))
+        
+        data = json.loads(TickerToCikTool()._run("ZZNOEX"))
+        
+        assert data["data"]["cik"] == "0007654321"
+        assert data["data"]["company_name"] == "No Exchange Co"
+
 
 class TestGetTickerCikMapTool:
     """Test suite for GetTickerCikMapTool."""
@@ -55,6 +105,22 @@ class TestGetTickerCikMapTool:
         # Should have some data structure (dict or list)
         assert isinstance(data["data"], (dict, list))
 
+    def test_map_body_is_passed_through(self, monkeypatch, sec_client):
+        """Test that the SEC response body is embedded as the envelope data."""
+        from flow_researcher.tools import company_tools
+        
+        ticker_map = {"fields": ["cik", "name", "ticker", "exchange"],
+                      "data": [[320193, "Apple Inc.", "AAPL", "Nasdaq"]]}
+        sec_client(company_tools, json.dumps(ticker_map, indent=2))
+        monkeypatch.setattr(company_tools, "_ticker_map_cache", company_tools.MemoryCache(maxsize=1))
+        
+        data = json.loads(GetTickerCikMapTool()._run())
+        assert data == {
+            "data": ticker_map,
+            "source_urls": [company_tools.TICKER_MAP_URL],
+            "warnings": []
+        }
+
 
 class TestGetCompanySubmissionsTool:
     """Test suite for GetCompanySubmissionsTool."""
@@ -69,6 +135,17 @@ class TestGetCompanySubmissionsTool:
         assert "filings" in data["data"] or "name" in data["data"]
         assert len(data["source_urls"]) > 0
 
+    def test_cik_prefix_is_normalized(self, sec_client):
+        """Test that a 'CIK'-prefixed or unpadded CIK builds the right URL."""
+        from flow_researcher.tools import company_tools
+        
+        sec_client(company_tools, {"name": "Apple Inc."})
+        
+        tool = GetCompanySubmissionsTool()
+        for cik in ("CIK0000320193", " 320193 "):
+            data = json.loads(tool._run(cik))
+            assert data["source_urls"] == ["https://data.sec.gov/submissions/CIK0000320193.json"]
+
 
 class TestGetCompanyProfileTool:
     """Test suite for GetCompanyProfileTool."""
@@ -84,3 +161,37 @@ class TestGetCompanyProfileTool:
         assert data["data"]["ticker"] == "AAPL"
         assert "entity_name" in data["data"]
         assert len(data["source_urls"]) > 0
+
+    def test_ticker_map_fields_skip_submissions(self, monkeypatch, sec_client):
+        """Test that a ticker-map-only field subset does not fetch submissions."""
+        from flow_researcher.tools import company_tools
+        
+        client = sec_client(company_tools, {"fields": ["cik", "name", "ticker", "exchange"],
+                                            "data": [[320193, "Apple Inc.", "AAPL", "Nasdaq"]]})
+        monkeypatch.setattr(company_tools, "_ticker_map_cache", company_tools.MemoryCache(maxsize=1))
+        
+        tool = GetCompanyProfileTool()
+        data = json.loads(tool._run("aapl", fields=["cik", "entity_name", "exchanges"]))
+        
+        assert data["data"] == {
+            "ticker": "AAPL",
+            "cik": "0000320193",
+            "entity_name": "Apple Inc.",
+            "exchanges": ["Nasdaq"],
+        }
+        assert client.urls == [company_tools.TICKER_MAP_URL]
+
+    def test_profile_from_parsed_submissions(self, monkeypatch, sec_client):
+        """Test that the profile is built from the client's parsed submissions."""
+        from flow_researcher.tools import company_tools
+        
+        sec_client(company_tools, {"name": "Apple Inc.", "tickers": ["AAPL"], "sic": "3571",
+                                   "filings": {"recent": {"form": ["10-K"]}}})
+        monkeypatch.setattr(company_tools, "_company_profile_cache", company_tools.MemoryCache(maxsize=1))
+        
+        data = json.loads(GetCompanyProfileTool()._run("aapl", cik="320193"))
+        
+        assert data["source_urls"] == ["https://data.sec.gov/submissions/CIK0000320193.json"]
+        assert data["data"]["entity_name"] == "Apple Inc."
+        assert data["data"]["sic"] == "3571"
+        assert data["data"]["exchanges"] == []
@@ -4,11 +4,20 @@ Tests for edgar_index_tools module.
 Tests EDGAR index files (daily/quarterly/full) tools.
 """
 
+import gzip
+import io
 import json
+import os
 import pytest
+import requests
 
 from flow_researcher.tools import (
     ListDailyIndexPathsTool,
+    DownloadDailyMasterIndexBatchTool,
+    ParseMasterIdxTool,
+    ParseMasterIdxUrlTool,
+    FindFilingsInMasterIdxTool,
+    FindFilingsInMasterIdxByPathTool,
     EdgarPathToDocUrlTool,
 )
 
@@ -26,6 +35,217 @@ class TestListDailyIndexPathsTool:
         assert data["data"]["quarter"] == 1
         assert len(data["data"]["paths"]) > 0
 
+    def test_all_quarters_paths(self):
+        """Test that omitting the quarter lists every month of the year in order."""
+        tool = ListDailyIndexPathsTool()
+        result = tool._run(2024)
+        
+        paths = json.loads(result)["data"]["paths"]
+        assert len(paths) == 24
+        assert paths[0].endswith("/2024/QTR1/master.01.idx")
+        assert paths[1].endswith("/2024/QTR1/master.01.idx.gz")
+        assert paths[-1].endswith("/2024/QTR4/master.12.idx.gz")
+
+    def test_verify_paths(self, monkeypatch):
+        """Test that verify reports only the paths that exist, with sizes."""
+        from flow_researcher.tools import edgar_index_tools
+        
+        class FakeResponse:
+            def __init__(self, ok, size=None):
+                self.ok = ok
+                self.headers = {"Content-Length": str(size)} if size else {}
+        
+        class FakeClient:
+            def head_all(self, urls):
+                return [FakeResponse(url.endswith("master.02.idx"), 1234) for url in urls]
+        
+        monkeypatch.setattr(edgar_index_tools, "get_default_client", lambda: FakeClient())
+        
+        tool = ListDailyIndexPathsTool()
+        data = json.loads(tool._run(2024, 1, verify=True))
+        
+        assert data["data"]["count"] == 6
+        assert len(data["data"]["verified"]) == 1
+        assert data["data"]["verified"][0]["url"].endswith("/2024/QTR1/master.02.idx")
+        assert data["data"]["verified"][0]["size"] == 1234
+
+
+class TestDownloadDailyMasterIndexBatchTool:
+    """Test suite for DownloadDailyMasterIndexBatchTool."""
+
+    def test_batch_download(self, tmp_path, monkeypatch):
+        """Test downloading several dates with one call."""
+        from flow_researcher.tools import edgar_index_tools
+        
+        class FakeClient:
+            def first_available(self, urls):
+                # Only the gzipped variant exists
+                return next((url for url in urls if url.endswith(".gz")), None)
+            
+            def download(self, url, dest_path):
+                with open(dest_path, "wb") as f:
+                    f.write(url.encode())
+                return dest_path
+        
+        monkeypatch.setattr(edgar_index_tools, "get_default_client", lambda: FakeClient())
+        
+        tool = DownloadDailyMasterIndexBatchTool()
+        data = json.loads(tool._run(["2024-01-02", "2024-04-01", "not-a-date"], str(tmp_path)))
+        
+        assert data["data"]["count"] == 2
+        assert data["data"]["requested"] == 3
+        assert [d["date"] for d in data["data"]["downloads"]] == ["2024-01-02", "2024-04-01"]
+        assert data["data"]["downloads"][1]["url"].endswith("/2024/QTR2/master.04.idx.gz")
+        assert (tmp_path / "master.20240102.idx.gz").exists()
+        assert len(data["warnings"]) == 1
+        assert "not-a-date" in data["warnings"][0]
+
+
+class TestParseMasterIdxTool:
+    """Test suite for ParseMasterIdxTool."""
+
+    def test_parse_master_idx(self, tmp_path):
+        """Test parsing rows after the header of a master index file."""
+        idx = tmp_path / "master.20240102.idx"
+        idx.write_text(
+            "Description:           Daily Index of EDGAR Dissemination Feed\n"
+            "\n"
+            "CIK|Company Name|Form Type|Date Filed|File Name\n"
+            "--------------------------------------------------------------------------------\n"
+            "320193|Apple Inc.|8-K|20240102|edgar/data/320193/0000320193-24-000001.txt\n"
+            "1234567|\"Quoted\" Co |10-Q|20240102\n"
+            "\n",
+            encoding="latin-1"
+        )
+        
+        tool = ParseMasterIdxTool()
+        data = json.loads(tool._run(str(idx)))
+        
+        assert data["data"]["count"] == 2
+        assert data["data"]["rows"][0] == {
+            "cik": "320193",
+            "company_name": "Apple Inc.",
+            "form_type": "8-K",
+            "date_filed": "20240102",
+            "edgar_path": "edgar/data/320193/0000320193-24-000001.txt"
+        }
+        assert data["data"]["rows"][1]["company_name"] == '"Quoted" Co'
+        assert data["data"]["rows"][1]["edgar_path"] == ""
+        assert data["warnings"] == []
+
+    def test_parse_gzipped_master_idx(self, tmp_path):
+        """Test that .gz master index files are decompressed while parsing."""
+        idx = tmp_path / "master.20240102.idx.gz"
+        with gzip.open(idx, "wt", encoding="latin-1") as f:
+            f.write("CIK|Company Name|Form Type|Date Filed|File Name\n---\n320193|Apple Inc.|8-K|20240102|x.txt\n")
+        
+        tool = ParseMasterIdxTool()
+        data = json.loads(tool._run(str(idx)))
+        
+        assert data["data"]["count"] == 1
+        assert data["data"]["rows"][0]["cik"] == "320193"
+
+    def test_summary_only(self, tmp_path):
+        """Test that summary_only returns form type counts instead of rows."""
+        idx = tmp_path / "master.idx"
+        idx.write_text(
+            "CIK|Company Name|Form Type|Date Filed|File Name\n"
+            "1|A|8-K|20240102|a.txt\n"
+            "2|B|8-K|20240102|b.txt\n"
+            "3|C|10-Q|20240102|c.txt\n"
+        )
+        
+        tool = ParseMasterIdxTool()
+        data = json.loads(tool._run(str(idx), summary_only=True))
+        
+        assert "rows" not in data["data"]
+        assert data["data"]["count"] == 3
+        assert data["data"]["form_types"] == {"8-K": 2, "10-Q": 1}
+
+
+class TestParseMasterIdxUrlTool:
+    """Test suite for ParseMasterIdxUrlTool."""
+
+    def test_parse_streamed_gz(self, monkeypatch):
+        """Test that a .gz index is decompressed from the response stream."""
+        from flow_researcher.tools import edgar_index_tools
+        
+        body = gzip.compress(b"CIK|Company Name|Form Type|Date Filed|File Name\n---\n320193|Apple Inc.|8-K|20240102|a.txt\n")
+        
+        class FakeRaw(io.BytesIO):
+            decode_content = False
+        
+        class FakeClient:
+            def stream(self, url):
+                response = requests.Response()
+                response.status_code = 200
+                response.raw = FakeRaw(body)
+                return response
+        
+        monkeypatch.setattr(edgar_index_tools, "get_default_client", lambda: FakeClient())
+        
+        tool = ParseMasterIdxUrlTool()
+        data = json.loads(tool._run("https://www.sec.gov/Archives/edgar/daily-index/2024/QTR1/master.20240102.idx.gz"))
+        
+        assert data["data"]["count"] == 1
+        assert data["data"]["rows"][0]["company_name"] == "Apple Inc."
+
+
+class TestFindFilingsInMasterIdxTool:
+    """Test suite for FindFilingsInMasterIdxTool."""
+
+    def test_filter_keeps_row_order(self):
+        """Test filtering by CIK and several forms keeps the original row order."""
+        rows = [
+            {"cik": "320193", "form_type": "10-Q", "edgar_path": "a"},
+            {"cik": "789019", "form_type": "8-K", "edgar_path": "b"},
+            {"cik": "320193", "form_type": "8-K", "edgar_path": "c"},
+            {"cik": "0000320193", "form_type": "10-k", "edgar_path": "d"},
+        ]
+        tool = FindFilingsInMasterIdxTool()
+        
+        by_cik = json.loads(tool._run(json.dumps({"rows": rows}), cik="320193", forms=["8-K", "10-K"]))
+        by_forms = json.loads(tool._run(json.dumps(rows), forms=["10-K", "8-K"]))
+        
+        assert [r["edgar_path"] for r in by_cik["data"]["rows"]] == ["c", "d"]
+        assert [r["edgar_path"] for r in by_forms["data"]["rows"]] == ["b", "c", "d"]
+        assert by_forms["data"]["original_count"] == 4
+
+
+class TestFindFilingsInMasterIdxByPathTool:
+    """Test suite for FindFilingsInMasterIdxByPathTool."""
+
+    def test_filter_by_path(self, tmp_path):
+        """Test filtering a master index file by CIK and form type."""
+        idx = tmp_path / "master.idx"
+        idx.write_text(
+            "CIK|Company Name|Form Type|Date Filed|File Name\n"
+            "---\n"
+            "320193|Apple Inc.|8-K|20240102|a.txt\n"
+            "320193|Apple Inc.|10-Q|20240102|b.txt\n"
+            "789019|Microsoft Corp|8-K|20240102|c.txt\n",
+            encoding="latin-1"
+        )
+        
+        tool = FindFilingsInMasterIdxByPathTool()
+        data = json.loads(tool._run(str(idx), cik="0000320193", forms=["8-k"]))
+        
+        assert data["data"]["original_count"] == 3
+        assert data["data"]["count"] == 1
+        assert data["data"]["rows"][0]["edgar_path"] == "a.txt"
+
+    def test_rewritten_file_is_reparsed(self, tmp_path):
+        """Test that cached rows are dropped when the file changes."""
+        idx = tmp_path / "master.idx"
+        idx.write_text("CIK|Company Name|Form Type|Date Filed|File Name\n1|A|8-K|20240102|a.txt\n")
+        
+        tool = FindFilingsInMasterIdxByPathTool()
+        assert json.loads(tool._run(str(idx)))["data"]["count"] == 1
+        
+        idx.write_text("CIK|Company Name|Form Type|Date Filed|File Name\n1|A|8-K|20240102|a.txt\n2|B|8-K|20240102|b.txt\n")
+        os.utime(idx, ns=(0, idx.stat().st_mtime_ns + 1_000_000_000))
+        assert json.loads(tool._run(str(idx)))["data"]["count"] == 2
+
 
 class TestEdgarPathToDocUrlTool:
     """Test suite for EdgarPathToDocUrlTool."""
@@ -38,3 +258,11 @@ class TestEdgarPathToDocUrlTool:
         data = json.loads(result)
         assert "sec.gov" in data["data"]["url"]
         assert "Archives" in data["data"]["url"]
+
+    def test_edgar_path_prefixes(self):
+        """Test that leading '/', 'edgar/' and 'edgar/data/' are all stripped."""
+        tool = EdgarPathToDocUrlTool()
+        expected = "https://www.sec.gov/Archives/edgar/data/320193/a.txt"
+        
+        for path in ["edgar/data/320193/a.txt", "/edgar/data/320193/a.txt", "edgar/320193/a.txt", "320193/a.txt"]:
+            assert json.loads(tool._run(path))["data"]["url"] == expected
@@ -41,6 +41,22 @@ class TestBuildFilingIndexUrlTool:
         assert "0000320193" in data["data"]["url"]
         assert data["data"]["cik"] == "0000320193"
 
+    def test_cik_prefix_is_normalized(self):
+        """Test that a 'CIK'-prefixed or unpadded CIK builds the same URL."""
+        tool = BuildFilingIndexUrlTool()
+        expected = json.loads(tool._run("0000320193", "0000320193-25-000010"))["data"]["url"]
+        
+        for cik in ("CIK0000320193", " 320193 "):
+            data = json.loads(tool._run(cik, "0000320193-25-000010"))
+            assert data["data"]["url"] == expected
+            assert data["data"]["cik"] == "0000320193"
+
+    def test_build_matches_tool_url(self):
+        """Test that build() returns the same URL as the tool envelope."""
+        result = json.loads(BuildFilingIndexUrlTool()._run("320193", "0000320193-25-000010"))
+        
+        assert BuildFilingIndexUrlTool.build("320193", "0000320193-25-000010") == result["data"]["url"]
+
 
 class TestBuildCompleteSubmissionTxtUrlTool:
     """Test suite for BuildCompleteSubmissionTxtUrlTool."""
@@ -54,6 +70,12 @@ class TestBuildCompleteSubmissionTxtUrlTool:
         assert data["data"]["url"].endswith(".txt")
         assert "0000320193" in data["data"]["url"]
 
+    def test_build_matches_tool_url(self):
+        """Test that build() returns the same URL as the tool envelope."""
+        result = json.loads(BuildCompleteSubmissionTxtUrlTool()._run("320193", "0000320193-25-000010"))
+        
+        assert BuildCompleteSubmissionTxtUrlTool.build("320193", "0000320193-25-000010") == result["data"]["url"]
+
 
 class TestBuildFilingFolderUrlTool:
     """Test suite for BuildFilingFolderUrlTool."""
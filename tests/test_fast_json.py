@@ -0,0 +1,48 @@
+"""
+Tests for fast_json module.
+
+Tests the orjson-backed drop-in for json.dumps/json.loads.
+"""
+
+import json as stdlib_json
+import pytest
+
+from flow_researcher.tools import fast_json
+
+
+class TestFastJson:
+    """Test suite for fast_json."""
+
+    def test_round_trip(self):
+        """Test that dumps/loads round-trip a tool result envelope."""
+        result = {"data": {"cik": "0000320193", "val": 1.5}, "source_urls": [], "warnings": []}
+        encoded = fast_json.dumps(result)
+        
+        assert isinstance(encoded, str)
+        assert fast_json.loads(encoded) == result
+        assert stdlib_json.loads(encoded) == result
+        assert fast_json.dumps_bytes(result) == encoded.encode()
+
+    def test_decode_error_is_stdlib_compatible(self):
+        """Test that invalid JSON raises an error stdlib handlers catch."""
+        with pytest.raises(stdlib_json.JSONDecodeError):
+            fast_json.loads("not json")
+
+    def test_loads_path(self):
+        """Test that the first existing key path is returned."""
+        document = stdlib_json.dumps({"data": {"facts": {"us-gaap": {"Revenues": {}}, "dei": {}}}})
+        
+        assert fast_json.loads_path(document, ("facts", "us-gaap"), ("data", "facts", "us-gaap")) == {"Revenues": {}}
+        assert fast_json.loads_path(document, ("data", "facts", "ifrs-full")) is None
+        assert fast_json.loads_path(document, ("data", "facts", "us-gaap", "Revenues", "x")) is None
+        with pytest.raises(stdlib_json.JSONDecodeError):
+            fast_json.loads_path("not json", ("facts",))
+
+    def test_loads_keys(self):
+        """Test that the keys of the first existing object path are listed."""
+        document = stdlib_json.dumps({"facts": {"dei": {"a": 1}, "us-gaap": {"Revenues": {"units": {}}}}})
+        
+        assert fast_json.loads_keys(document, ("data", "facts"), ("facts",)) == ["dei", "us-gaap"]
+        assert fast_json.loads_keys(document, ("facts", "us-gaap")) == ["Revenues"]
+        assert fast_json.loads_keys(document, ("facts", "dei", "a")) is None
+        assert fast_json.loads_keys(document, ("missing",)) is None
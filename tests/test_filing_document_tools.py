@@ -50,6 +50,21 @@ class TestParseFilingIndexDocumentsTool:
         # Should find at least some documents
         assert len(data["data"]) >= 0
 
+    def test_document_types(self):
+        """Test classifying filings and exhibits by filename and description."""
+        tool = ParseFilingIndexDocumentsTool()
+        html = """
+        <base href="https://www.sec.gov/Archives/edgar/data/320193/000032019325000010/">
+        <a href="aapl-20250628.htm">10-Q</a>
+        <a href="ex-99.1.pdf">Press release</a>
+        <a href="EX-31.2.htm">Certification</a>
+        <a href="R1.xml">Cover</a>
+        """
+        data = json.loads(tool._run(html))
+        
+        assert [d["type"] for d in data["data"]] == ["10-Q", "EX-99.1", "EX-31.2", "XML"]
+        assert data["data"][0]["url"] == "https://www.sec.gov/Archives/edgar/data/320193/000032019325000010/aapl-20250628.htm"
+
 
 class TestFindDocumentByTypeTool:
     """Test suite for FindDocumentByTypeTool."""
@@ -66,3 +81,15 @@ class TestFindDocumentByTypeTool:
         data = json.loads(result)
         assert data["data"]["matches_found"] >= 0
         assert isinstance(data["data"]["matches"], list)
+
+    def test_preference_order_and_fields(self):
+        """Test that the first preferred type wins and fields are searched separately."""
+        tool = FindDocumentByTypeTool()
+        documents = json.dumps([
+            {"filename": "ex-99.1.pdf", "type": "EX-99.1", "description": "10-Q press release"},
+            {"filename": "10", "type": "", "description": "-Q"}
+        ])
+        data = json.loads(tool._run(documents, ["ex-99.1", "10-Q"]))
+        
+        assert data["data"]["matches_found"] == 1
+        assert data["data"]["matches"][0]["matched_type"] == "EX-99.1"
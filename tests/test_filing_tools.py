@@ -4,20 +4,101 @@ Tests for filing_tools module.
 Tests filing discovery and metadata tools.
 """
 
-import json
 import pytest
 
+from flow_researcher.tools import fast_json as json
 from flow_researcher.tools import (
     ListRecentFilingsTool,
     GetLatestFilingTool,
+    GetLatestFilingBatchTool,
     GetFilingsByDateRangeTool,
     GetFilingAcceptanceDatetimeTool,
 )
 
 
+@pytest.fixture(scope="module")
+def latest_10q():
+    """Fetch and decode Apple's latest 10-Q envelope once for this module."""
+    return json.loads(GetLatestFilingTool()._run("0000320193", "10-Q"))
+
+
+@pytest.fixture(scope="module")
+def latest_10q_meta(latest_10q):
+    """The latest 10-Q metadata as the JSON string agents pass to the tools."""
+    return json.dumps(latest_10q["data"]) if latest_10q.get("data") else None
+
+
 class TestListRecentFilingsTool:
     """Test suite for ListRecentFilingsTool."""
 
+    def test_submissions_fetched_once(self, monkeypatch, sec_client):
+        """Test that the filing tools share one submissions fetch per CIK."""
+        from flow_researcher.tools import filing_tools
+        
+        submissions = {"filings": {"recent": {
+            "accessionNumber": ["0000000001-24-000002", "0000000001-24-000001"],
+            "form": ["8-K", "10-Q"],
+            "filingDate": ["2024-05-01", "2024-04-01"],
+            "reportDate": ["", "2024-03-31"],
+            "acceptanceDateTime": ["", ""],
+            "primaryDocument": ["a.htm", "b.htm"],
+        }}}
+        
+        client = sec_client(filing_tools, submissions)
+        monkeypatch.setattr(filing_tools, "_submissions_cache", filing_tools.MemoryCache(maxsize=8))
+        
+        recent = json.loads(ListRecentFilingsTool()._run("1", forms=[" 10-q", "10-Q"]))
+        latest = json.loads(GetLatestFilingTool()._run("1", "8-K"))
+        
+        assert recent["data"][0]["accessionNumber"] == "0000000001-24-000001"
+        assert latest["data"]["accessionNumber"] == "0000000001-24-000002"
+        assert len(client.urls) == 1
+
+    def test_submissions_cache_is_bounded_by_size(self, monkeypatch, sec_client):
+        """Test that cached submissions are evicted once their bodies exceed max_bytes."""
+        from flow_researcher.tools import filing_tools
+        
+        submissions = {"filings": {"recent": {
+            "accessionNumber": ["0000000001-24-000001"],
+            "form": ["10-Q"],
+            "filingDate": ["2024-04-01"],
+        }}}
+        body_size = len(json.dumps_bytes(submissions))
+        client = sec_client(filing_tools, submissions)
+        monkeypatch.setattr(
+            filing_tools, "_submissions_cache", filing_tools.MemoryCache(maxsize=8, max_bytes=body_size * 3 // 2)
+        )
+        
+        for cik in ["1", "2", "1"]:
+            ListRecentFilingsTool()._run(cik)
+        
+        # Only one body fits, so the second CIK evicted the first
+        assert len(client.urls) == 3
+
+    def test_short_columns_normalize_to_none(self, monkeypatch, sec_client):
+        """Test that columns shorter than accessionNumber yield None fields."""
+        from flow_researcher.tools import filing_tools
+        
+        submissions = {"filings": {"recent": {
+            "accessionNumber": ["0000000001-24-000002", "0000000001-24-000001"],
+            "form": ["8-K", "10-Q"],
+            "filingDate": ["2024-05-01"],
+        }}}
+        
+        sec_client(filing_tools, submissions)
+        monkeypatch.setattr(filing_tools, "_submissions_cache", filing_tools.MemoryCache(maxsize=8))
+        
+        result = json.loads(ListRecentFilingsTool()._run("1"))
+        
+        assert result["data"][1] == {
+            "form": "10-Q",
+            "filingDate": None,
+            "reportDate": None,
+            "acceptanceDateTime": None,
+            "accessionNumber": "0000000001-24-000001",
+            "primaryDocument": None
+        }
+
     def test_list_all_filings(self):
         """Test listing recent filings without filters."""
         tool = ListRecentFilingsTool()
@@ -38,28 +119,89 @@ class TestListRecentFilingsTool:
         data = json.loads(result)
         assert isinstance(data["data"], list)
         # All returned filings should be 10-Q
-        for filing in data["data"]:
-            assert filing["form"] == "10-Q"
+        assert {filing["form"] for filing in data["data"]} <= {"10-Q"}
 
 
 class TestGetLatestFilingTool:
     """Test suite for GetLatestFilingTool."""
 
-    def test_get_latest_10q(self):
+    def test_get_latest_10q(self, latest_10q):
         """Test getting latest 10-Q filing."""
-        tool = GetLatestFilingTool()
-        result = tool._run("0000320193", "10-Q")
-        
-        data = json.loads(result)
+        data = latest_10q
         if data["data"]:  # May not have 10-Q if company doesn't file it
             assert data["data"]["form"] == "10-Q"
             assert "accessionNumber" in data["data"]
             assert "filingDate" in data["data"]
 
 
+class TestGetLatestFilingBatchTool:
+    """Test suite for GetLatestFilingBatchTool."""
+
+    def test_latest_per_cik(self, monkeypatch, sec_client):
+        """Test that each CIK gets its own latest filing and warnings are tagged."""
+        from flow_researcher.tools import filing_tools
+        
+        submissions_by_cik = {
+            "0000000001": {"filings": {"recent": {
+                "accessionNumber": ["0000000001-24-000002", "0000000001-24-000001"],
+                "form": ["8-K", "10-K"],
+                "filingDate": ["2024-05-01", "2024-02-01"],
+            }}},
+            "0000000002": {"filings": {"recent": {
+                "accessionNumber": ["0000000002-24-000001"],
+                "form": ["8-K"],
+                "filingDate": ["2024-03-01"],
+            }}},
+        }
+        
+        sec_client(filing_tools, lambda url: submissions_by_cik[url.rsplit("CIK", 1)[1][:10]])
+        monkeypatch.setattr(filing_tools, "_submissions_cache", filing_tools.MemoryCache(maxsize=8))
+        
+        result = json.loads(GetLatestFilingBatchTool()._run(["1", "0000000002", "1"], "10-K"))
+        
+        assert list(result["data"]) == ["0000000001", "0000000002"]
+        assert result["data"]["0000000001"]["accessionNumber"] == "0000000001-24-000001"
+        assert result["data"]["0000000002"] is None
+        assert result["warnings"] == ["CIK 0000000002: No 10-K filings found for this company"]
+
+
 class TestGetFilingsByDateRangeTool:
     """Test suite for GetFilingsByDateRangeTool."""
 
+    def test_range_and_form_filters(self, monkeypatch, sec_client):
+        """Test that form and date filters combine and keep filing order."""
+        from flow_researcher.tools import filing_tools
+        
+        submissions = {"filings": {"recent": {
+            "accessionNumber": ["a4", "a3", "a2", "a1"],
+            "form": ["10-Q", "8-K", "10-Q", "10-K"],
+            "filingDate": ["2024-08-01", "2024-07-15", "2024-05-01", "2024-02-01"],
+        }}}
+        
+        sec_client(filing_tools, submissions)
+        monkeypatch.setattr(filing_tools, "_submissions_cache", filing_tools.MemoryCache(maxsize=8))
+        
+        tool = GetFilingsByDateRangeTool()
+        data = json.loads(tool._run("1", "2024-05-01", "2024-08-01", forms=["10-Q", "10-K"]))
+        
+        assert [f["accessionNumber"] for f in data["data"]] == ["a4", "a2"]
+        assert data["data"][0]["reportDate"] is None
+
+    def test_unsorted_dates_are_all_checked(self, monkeypatch, sec_client):
+        """Test that a filing dated before start does not hide later rows in range."""
+        from flow_researcher.tools import filing_tools
+        
+        sec_client(filing_tools, {"filings": {"recent": {
+            "accessionNumber": ["a3", "a2", "a1"],
+            "form": ["8-K", "8-K", "8-K"],
+            "filingDate": ["2024-05-02", "2024-04-30", "2024-05-01"],
+        }}})
+        monkeypatch.setattr(filing_tools, "_submissions_cache", filing_tools.MemoryCache(maxsize=8))
+        
+        data = json.loads(GetFilingsByDateRangeTool()._run("1", "2024-05-01", "2024-05-31"))
+        
+        assert [f["accessionNumber"] for f in data["data"]] == ["a3", "a1"]
+
     def test_get_filings_in_range(self):
         """Test getting filings within a date range."""
         tool = GetFilingsByDateRangeTool()
@@ -67,11 +209,9 @@ class TestGetFilingsByDateRangeTool:
         
         data = json.loads(result)
         assert isinstance(data["data"], list)
-        # Verify dates are in range
-        for filing in data["data"]:
-            if filing.get("filingDate"):
-                filing_date = filing["filingDate"]
-                assert "2024" in filing_date
+        # Verify dates are in range; ISO dates compare correctly as strings
+        filing_dates = [filing["filingDate"] for filing in data["data"] if filing.get("filingDate")]
+        assert all("2024-01-01" <= filing_date <= "2024-12-31" for filing_date in filing_dates)
 
     def test_invalid_date_range(self):
         """Test with invalid date range (start > end)."""
@@ -80,24 +220,18 @@ class TestGetFilingsByDateRangeTool:
         
         data = json.loads(result)
         assert data["data"] == []
-        assert len(data["warnings"]) > 0
-        assert "before" in data["warnings"][0].lower() or "after" in data["warnings"][0].lower()
+        assert data["warnings"] == ["Start date must be before or equal to end date"]
 
 
 class TestGetFilingAcceptanceDatetimeTool:
     """Test suite for GetFilingAcceptanceDatetimeTool."""
 
-    def test_extract_acceptance_datetime(self):
+    def test_extract_acceptance_datetime(self, latest_10q, latest_10q_meta):
         """Test extracting acceptance datetime from filing metadata."""
-        # First get a filing with acceptance datetime
-        filings_tool = GetLatestFilingTool()
-        filing_result = filings_tool._run("0000320193", "10-Q")
-        
-        filing_data = json.loads(filing_result)
+        filing_data = latest_10q
         if filing_data.get("data") and filing_data["data"].get("acceptanceDateTime"):
             tool = GetFilingAcceptanceDatetimeTool()
-            filing_meta = json.dumps(filing_data["data"])
-            result = tool._run(filing_meta)
+            result = tool._run(latest_10q_meta)
             
             result_data = json.loads(result)
             assert result_data["data"] is not None
@@ -113,5 +247,4 @@ class TestGetFilingAcceptanceDatetimeTool:
         
         data = json.loads(result)
         assert data["data"] is None
-        assert len(data["warnings"]) > 0
-        assert "not available" in data["warnings"][0].lower()
+        assert data["warnings"] == ["Acceptance datetime not available in filing metadata"]
@@ -4,14 +4,46 @@ Tests for rss_tools module.
 Tests RSS / "Latest Filings" monitoring tools.
 """
 
-import json
 import pytest
 
+from flow_researcher.tools import fast_json as json
 from flow_researcher.tools import (
     GetCompanyEdgarRssFeedUrlTool,
+    FetchRssTool,
+    FetchRssBatchTool,
+    RssItemsToFilingsTool,
 )
 
 
+ATOM_FEED = """<?xml version="1.0" encoding="ISO-8859-1" ?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+<title>Latest Filings</title>
+<entry>
+<title>10-Q - Apple Inc. (0000320193) (Filer)</title>
+<link rel="alternate" type="text/html" href="https://www.sec.gov/Archives/edgar/data/320193/000032019324000081/0000320193-24-000081-index.htm"/>
+<summary type="html"> Filed: 2024-08-02 AccNo: 0000320193-24-000081 </summary>
+<published>2024-08-02T06:01:36-04:00</published>
+</entry>
+<entry>
+<title>8-K - Apple Inc. (0000320193) (Filer)</title>
+<link rel="alternate" type="text/html" href="https://www.sec.gov/Archives/edgar/data/320193/000032019324000080/0000320193-24-000080-index.htm"/>
+<published>2024-08-01T16:30:12-04:00</published>
+</entry>
+</feed>
+"""
+
+RSS_FEED = """<?xml version="1.0"?>
+<rss version="2.0"><channel>
+<item>
+<title>8-K - Example Corp</title>
+<link> https://www.sec.gov/Archives/edgar/data/1/000000000124000001/ </link>
+<pubDate>Thu, 01 Aug 2024 16:30:12 EDT</pubDate>
+<description>Current report</description>
+</item>
+</channel></rss>
+"""
+
+
 class TestGetCompanyEdgarRssFeedUrlTool:
     """Test suite for GetCompanyEdgarRssFeedUrlTool."""
 
@@ -24,3 +56,114 @@ class TestGetCompanyEdgarRssFeedUrlTool:
         assert "sec.gov" in data["data"]["url"]
         assert "atom" in data["data"]["url"] or "rss" in data["data"]["url"]
         assert data["data"]["cik"] == "0000320193"
+        assert "CIK=320193&" in data["data"]["url"]
+        
+        prefixed = json.loads(tool._run("CIK0000320193"))
+        assert prefixed["data"] == data["data"]
+
+
+class TestFetchRssTool:
+    """Test suite for FetchRssTool."""
+
+    def test_parse_atom_feed(self, sec_client):
+        """Test parsing Atom entries into items."""
+        from flow_researcher.tools import rss_tools
+        
+        sec_client(rss_tools, ATOM_FEED)
+        
+        data = json.loads(FetchRssTool()._run("https://www.sec.gov/feed"))
+        
+        assert data["data"]["count"] == 2
+        assert data["data"]["items"][0] == {
+            "title": "10-Q - Apple Inc. (0000320193) (Filer)",
+            "link": "https://www.sec.gov/Archives/edgar/data/320193/000032019324000081/0000320193-24-000081-index.htm",
+            "pubDate": "2024-08-02T06:01:36-04:00",
+            "description": "Filed: 2024-08-02 AccNo: 0000320193-24-000081"
+        }
+        assert data["data"]["items"][1]["description"] == ""
+
+    def test_parse_rss_feed(self, sec_client):
+        """Test parsing RSS 2.0 items into items."""
+        from flow_researcher.tools import rss_tools
+        
+        sec_client(rss_tools, RSS_FEED)
+        
+        data = json.loads(FetchRssTool()._run("https://www.sec.gov/rss"))
+        
+        assert data["data"]["items"] == [{
+            "title": "8-K - Example Corp",
+            "link": "https://www.sec.gov/Archives/edgar/data/1/000000000124000001/",
+            "pubDate": "Thu, 01 Aug 2024 16:30:12 EDT",
+            "description": "Current report"
+        }]
+        assert data["warnings"] == []
+
+    def test_malformed_feed_falls_back_to_regex(self, sec_client):
+        """Test that feeds that are not well-formed XML are still scanned."""
+        from flow_researcher.tools import rss_tools
+        
+        broken = ATOM_FEED.replace("</feed>", "").replace("(Filer)</title>", "(Filer) & more</title>", 1)
+        sec_client(rss_tools, broken)
+        
+        data = json.loads(FetchRssTool()._run("https://www.sec.gov/feed"))
+        
+        assert data["data"]["count"] == 2
+        assert data["data"]["items"][0]["title"] == "10-Q - Apple Inc. (0000320193) (Filer) & more"
+
+
+class TestFetchRssBatchTool:
+    """Test suite for FetchRssBatchTool."""
+
+    def test_feeds_parsed_per_url(self, sec_client):
+        """Test that each feed is parsed and failed fetches become warnings."""
+        from flow_researcher.tools import rss_tools
+        
+        sec_client(rss_tools, lambda url: ATOM_FEED if url == "https://a/feed" else Exception("HTTP request failed: 404"))
+        
+        data = json.loads(FetchRssBatchTool()._run(["https://a/feed", "https://b/feed"]))
+        
+        assert len(data["data"]["feeds"]["https://a/feed"]) == 2
+        assert data["data"]["feeds"]["https://b/feed"] == []
+        assert data["data"]["count"] == 2
+        assert data["warnings"] == ["Failed to fetch RSS feed https://b/feed: HTTP request failed: 404"]
+
+
+class TestRssItemsToFilingsTool:
+    """Test suite for RssItemsToFilingsTool."""
+
+    def test_extract_filings(self):
+        """Test extracting CIK, accession and form from feed items."""
+        items = [
+            {
+                "title": "10-K/A - Example Corp (0000000001) (Filer)",
+                "link": "https://www.sec.gov/Archives/edgar/data/1/000000000124000001/0000000001-24-000001-index.htm",
+                "pubDate": "2024-08-01",
+                "description": "Amended 8-K exhibits"
+            },
+            {"title": "Press release", "link": "https://example.com/", "description": ""}
+        ]
+        
+        data = json.loads(RssItemsToFilingsTool()._run(json.dumps({"items": items})))
+        
+        assert data["data"]["count"] == 1
+        filing = data["data"]["filings"][0]
+        assert filing["cik"] == "0000000001"
+        assert filing["accession"] == "000000000124000001"
+        assert filing["form"] == "10-K"
+
+    def test_accepts_native_envelope(self, sec_client):
+        """Test chaining fetch_rss into rss_items_to_filings without a JSON round trip."""
+        from flow_researcher.tools import rss_tools
+        sec_client(rss_tools, ATOM_FEED)
+        
+        envelope = FetchRssTool()._run_native("https://www.sec.gov/feed")
+        data = json.loads(RssItemsToFilingsTool()._run(envelope))
+        
+        assert data["data"]["count"] == envelope["data"]["count"]
+
+    def test_invalid_json(self):
+        """Test that malformed input is reported as a warning."""
+        data = json.loads(RssItemsToFilingsTool()._run("{not json"))
+        
+        assert data["data"]["count"] == 0
+        assert data["warnings"] == ["Invalid JSON in items parameter"]
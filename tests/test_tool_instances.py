@@ -0,0 +1,33 @@
+"""
+Tests for tool_instances module.
+
+Tests the shared per-class tool instance cache.
+"""
+
+import pytest
+
+from flow_researcher.tools import (
+    TickerToCikTool,
+    GetCompanyProfileTool,
+    get_shared_tool,
+)
+
+
+class TestGetSharedTool:
+    """Test suite for get_shared_tool."""
+
+    def test_returns_same_instance(self):
+        """Test that repeated calls return the same tool instance."""
+        tool1 = get_shared_tool(TickerToCikTool)
+        tool2 = get_shared_tool(TickerToCikTool)
+        
+        assert isinstance(tool1, TickerToCikTool)
+        assert tool1 is tool2
+
+    def test_instances_are_per_class(self):
+        """Test that each tool class gets its own instance."""
+        ticker_tool = get_shared_tool(TickerToCikTool)
+        profile_tool = get_shared_tool(GetCompanyProfileTool)
+        
+        assert isinstance(profile_tool, GetCompanyProfileTool)
+        assert ticker_tool is not profile_tool
@@ -0,0 +1,34 @@
+"""
+Tests for tool_result module.
+
+Tests the ToolResult envelope shared by the SEC tools.
+"""
+
+import json
+
+from flow_researcher.tools.tool_result import ToolResult
+
+
+class TestToolResult:
+    """Test suite for ToolResult."""
+
+    def test_to_json_matches_dict_envelope(self):
+        """Test that the serialized envelope matches the dict form."""
+        result = ToolResult(data={"cik": "0000320193"}, source_urls=["https://www.sec.gov/"], warnings=["w"])
+        encoded = result.to_json()
+
+        assert json.loads(encoded) == {
+            "data": {"cik": "0000320193"},
+            "source_urls": ["https://www.sec.gov/"],
+            "warnings": ["w"]
+        }
+        assert list(json.loads(encoded)) == ["data", "source_urls", "warnings"]
+
+    def test_defaults(self):
+        """Test that the default envelope is empty and lists are not shared."""
+        first = ToolResult()
+        second = ToolResult()
+        first.warnings.append("w")
+
+        assert json.loads(second.to_json()) == {"data": None, "source_urls": [], "warnings": []}
+        assert not hasattr(first, "__dict__")
@@ -4,44 +4,60 @@ Tests for xbrl_tools module.
 Tests XBRL "Facts" APIs for structured financial data.
 """
 
-import json
 import pytest
 
+from flow_researcher.tools import fast_json as json
 from flow_researcher.tools import (
     GetCompanyFactsTool,
     ListTaxonomiesTool,
     ListConceptsTool,
     GetCompanyConceptTool,
+    GetCompanyConceptBatchTool,
+    NormalizeFactsToTableTool,
+    FactsFilterTool,
 )
 
 
+@pytest.fixture(scope="module")
+def apple_facts():
+    """Fetch Apple's company facts envelope once for the tests in this module."""
+    return GetCompanyFactsTool()._run("0000320193")
+
+
 class TestGetCompanyFactsTool:
     """Test suite for GetCompanyFactsTool."""
 
-    def test_get_company_facts(self):
+    def test_get_company_facts(self, apple_facts):
         """Test getting company facts."""
-        tool = GetCompanyFactsTool()
-        result = tool._run("0000320193")  # Apple
+        result = apple_facts
         
-        data = json.loads(result)
-        if data["data"]:
-            assert "facts" in data["data"] or "cik" in data["data"]
-            assert len(data["source_urls"]) > 0
+        # Only the top-level keys are needed, not the whole facts document
+        keys = json.loads_keys(result, ("data",))
+        if keys:
+            assert "facts" in keys or "cik" in keys
+            assert len(json.loads_path(result, ("source_urls",))) > 0
+
+    def test_native_envelope_feeds_parsers(self, sec_client):
+        """Test passing the parsed facts envelope to a parser tool without re-encoding."""
+        from flow_researcher.tools import xbrl_tools
+        
+        sec_client(xbrl_tools, {"cik": 320193, "facts": {"dei": {}, "us-gaap": {}}})
+        
+        envelope = GetCompanyFactsTool()._run_native("320193")
+        data = json.loads(ListTaxonomiesTool()._run(envelope))
+        
+        assert envelope["source_urls"] == ["https://data.sec.gov/api/xbrl/companyfacts/CIK0000320193.json"]
+        assert data["data"]["taxonomies"] == ["dei", "us-gaap"]
 
 
 class TestListTaxonomiesTool:
     """Test suite for ListTaxonomiesTool."""
 
-    def test_list_taxonomies(self):
+    def test_list_taxonomies(self, apple_facts):
         """Test listing taxonomies."""
-        # First get company facts
-        facts_tool = GetCompanyFactsTool()
-        facts_result = facts_tool._run("0000320193")
-        facts_data = json.loads(facts_result)
-        
-        if facts_data["data"]:
+        if json.loads_keys(apple_facts, ("data",)):
             tool = ListTaxonomiesTool()
-            result = tool._run(json.dumps(facts_data["data"]))
+            result = tool._run(apple_facts)
             
             data = json.loads(result)
             assert "taxonomies" in data["data"]
@@ -51,16 +67,11 @@ class TestListTaxonomiesTool:
 class TestListConceptsTool:
     """Test suite for ListConceptsTool."""
 
-    def test_list_concepts(self):
+    def test_list_concepts(self, apple_facts):
         """Test listing concepts."""
-        # First get company facts
-        facts_tool = GetCompanyFactsTool()
-        facts_result = facts_tool._run("0000320193")
-        facts_data = json.loads(facts_result)
-        
-        if facts_data["data"]:
+        if json.loads_keys(apple_facts, ("data",)):
             tool = ListConceptsTool()
-            result = tool._run(json.dumps(facts_data["data"]), "us-gaap")
+            result = tool._run(apple_facts, "us-gaap")
             
             data = json.loads(result)
             assert "concepts" in data["data"]
@@ -79,3 +90,168 @@ class TestGetCompanyConceptTool:
         # May or may not have data depending on tag availability
         if data["data"]:
             assert len(data["source_urls"]) > 0
+
+
+class TestGetCompanyConceptBatchTool:
+    """Test suite for GetCompanyConceptBatchTool."""
+
+    def test_concepts_per_tag(self, sec_client):
+        """Test that each tag is fetched once and failures become warnings."""
+        from flow_researcher.tools import xbrl_tools
+        
+        def concept(url):
+            if url.endswith("/Missing.json"):
+                return Exception("404 Not Found")
+            return {"tag": url.rsplit("/", 1)[1][:-len(".json")], "units": {"USD": []}}
+        
+        client = sec_client(xbrl_tools, concept)
+        
+        result = GetCompanyConceptBatchTool()._run("320193", ["Revenues", "Missing", "Assets", "Revenues"])
+        data = json.loads(result)
+        
+        assert list(data["data"]) == ["Revenues", "Missing", "Assets"]
+        assert data["data"]["Assets"]["tag"] == "Assets"
+        assert data["data"]["Missing"] is None
+        assert data["warnings"] == ["Missing: Failed to fetch company concept: 404 Not Found"]
+        assert len(client.urls) == 3
+        assert "CIK0000320193/us-gaap/Revenues.json" in data["source_urls"][0]
+
+
+class TestParsedFactsCache:
+    """Test suite for the parsed companyfacts cache."""
+
+    def test_equal_strings_share_one_parse(self, monkeypatch):
+        """Test that an equal companyfacts string is not parsed again."""
+        from flow_researcher.tools import xbrl_tools
+        from flow_researcher.tools.sec_http_client import MemoryCache
+        monkeypatch.setattr(xbrl_tools, "_parsed_facts_cache", MemoryCache(4, 300))
+        
+        payload = json.dumps({"facts": {"us-gaap": {"Revenues": {}}}})
+        copy = "".join(list(payload))
+        
+        assert xbrl_tools._parse_facts(payload) is xbrl_tools._parse_facts(copy)
+        concepts = json.loads(ListConceptsTool()._run(copy, "us-gaap"))
+        assert concepts["data"]["concepts"] == ["Revenues"]
+        rows = json.loads(NormalizeFactsToTableTool()._run(copy, "us-gaap"))
+        assert rows["warnings"] == ["No facts found for taxonomy 'us-gaap'"]
+
+    def test_list_tools_on_uncached_string(self, monkeypatch):
+        """Test listing taxonomies and concepts of an envelope string not parsed before."""
+        from flow_researcher.tools import xbrl_tools
+        from flow_researcher.tools.sec_http_client import MemoryCache
+        monkeypatch.setattr(xbrl_tools, "_parsed_facts_cache", MemoryCache(4, 300))
+        
+        envelope = json.dumps({"data": {"facts": {"dei": {}, "us-gaap": {"Assets": {}, "Revenues": {}}}}})
+        
+        taxonomies = json.loads(ListTaxonomiesTool()._run(envelope))
+        concepts = json.loads(ListConceptsTool()._run(envelope, "us-gaap"))
+        missing = json.loads(ListConceptsTool()._run(envelope, "ifrs-full"))
+        
+        assert taxonomies["data"]["taxonomies"] == ["dei", "us-gaap"]
+        assert concepts["data"]["concepts"] == ["Assets", "Revenues"]
+        assert missing["data"]["count"] == 0
+
+    def test_repeated_normalize_parses_once(self, monkeypatch):
+        """Test that normalizing the same string twice parses it only once."""
+        from flow_researcher.tools import xbrl_tools
+        from flow_researcher.tools.sec_http_client import MemoryCache
+        monkeypatch.setattr(xbrl_tools, "_parsed_facts_cache", MemoryCache(4, 300))
+        
+        parses = []
+        for name in ("loads", "loads_path"):
+            parse = getattr(xbrl_tools.json, name)
+            monkeypatch.setattr(
+                xbrl_tools.json, name,
+                lambda *args, _parse=parse, _name=name: parses.append(_name) or _parse(*args)
+            )
+        
+        payload = json.dumps({"facts": {"us-gaap": {"Revenues": {"units": {"USD": [{"val": 1}]}}}}})
+        first = NormalizeFactsToTableTool()._run(payload, "us-gaap")
+        second = NormalizeFactsToTableTool()._run(payload, "us-gaap")
+        
+        assert first == second
+        assert len(parses) == 1
+
+
+class TestNormalizeFactsToTableTool:
+    """Test suite for NormalizeFactsToTableTool."""
+
+    FACTS = {
+        "cik": 320193,
+        "facts": {
+            "dei": {"EntityCommonStockSharesOutstanding": {"units": {"shares": [{"val": 1}]}}},
+            "us-gaap": {
+                "Revenues": {
+                    "units": {
+                        "USD": [{
+                            "fy": 2024, "fp": "FY", "end": "2024-09-28", "val": 391035000000,
+                            "form": "10-K", "filed": "2024-11-01", "frame": "CY2024",
+                            "accn": "0000320193-24-000123"
+                        }]
+                    }
+                }
+            }
+        }
+    }
+
+    def test_normalize_json_string(self):
+        """Test that only the requested taxonomy is turned into rows."""
+        data = json.loads(NormalizeFactsToTableTool()._run(json.dumps(self.FACTS), "us-gaap"))
+        
+        assert data["data"]["count"] == 1
+        assert data["data"]["rows"][0] == {
+            "tag": "Revenues", "unit": "USD", "fy": 2024, "fp": "FY", "end": "2024-09-28",
+            "val": 391035000000, "form": "10-K", "filed": "2024-11-01", "frame": "CY2024",
+            "accn": "0000320193-24-000123"
+        }
+
+    def test_normalize_envelope_and_missing_taxonomy(self):
+        """Test the get_company_facts envelope shape and an absent taxonomy."""
+        envelope = json.dumps({"data": self.FACTS, "source_urls": [], "warnings": []})
+        tool = NormalizeFactsToTableTool()
+        
+        assert json.loads(tool._run(envelope, "dei"))["data"]["count"] == 1
+        missing = json.loads(tool._run(envelope, "ifrs-full"))
+        assert missing["data"]["count"] == 0
+        assert missing["warnings"] == ["No facts found for taxonomy 'ifrs-full'"]
+        
+        invalid = json.loads(tool._run("{not json", "us-gaap"))
+        assert invalid["warnings"] == ["Invalid JSON in companyfacts_json parameter"]
+
+    def test_columnar_table_filters_like_rows(self):
+        """Test that the columnar table filters to the same rows as the row table."""
+        tool = NormalizeFactsToTableTool()
+        facts = json.dumps(self.FACTS)
+        rows = tool._run(facts, "us-gaap")
+        columnar = tool._run(facts, "us-gaap", columnar=True)
+        
+        table = json.loads(columnar)["data"]
+        assert table["count"] == 1
+        assert table["columns"]["tag"] == ["Revenues"]
+        assert table["columns"]["accn"] == ["0000320193-24-000123"]
+        
+        filter_tool = FactsFilterTool()
+        for filters in ({"tag": "Revenues", "fp": "FY"}, {"start_end": "2024-01-01:2024-12-31"}, {"form": "10-Q"}):
+            expected = json.loads(filter_tool._run(rows, **filters))["data"]
+            assert json.loads(filter_tool._run(columnar, **filters))["data"] == expected
+
+
+class TestFactsFilterTool:
+    """Test suite for FactsFilterTool."""
+
+    def test_chained_native_filters(self):
+        """Test that a filter result can be filtered again without re-encoding."""
+        rows = [
+            {"tag": "Revenues", "fp": "FY", "form": "10-K", "unit": "USD", "end": "2023-09-30"},
+            {"tag": "Revenues", "fp": "Q1", "form": "10-Q", "unit": "USD", "end": "2023-12-30"},
+            {"tag": "Assets", "fp": "FY", "form": "10-K", "unit": "USD", "end": "2023-09-30"},
+        ]
+        tool = FactsFilterTool()
+        
+        by_tag = tool._run_native({"rows": rows}, tag="Revenues")
+        by_tag_and_fp = tool._run_native(by_tag, fp="FY")
+        
+        assert by_tag["data"]["count"] == 2
+        assert by_tag_and_fp["data"]["rows"] == [rows[0]]
+        assert by_tag_and_fp["data"]["original_count"] == 2
+        assert json.loads(tool._run(json.dumps({"rows": rows}), tag="Revenues", fp="FY"))["data"]["rows"] == [rows[0]]